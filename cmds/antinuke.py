@@ -4,11 +4,15 @@ import json
 import os
 import re
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Deque, Optional
-from collections import defaultdict, deque
+from typing import Dict, Optional
+from collections import deque
 
+from utils.cluster import cluster_file
+from utils.cooldown import TTLCache
+from utils.jobs import JobContext, get_queue
 
-CONFIG_FILE = 'antinuke_config.json'
+
+CONFIG_FILE = cluster_file('antinuke_config.json')
 BOT_OWNER_IDS = {386889350010634252, 164202861356515328}
 
 
@@ -75,9 +79,56 @@ class AntiNuke(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         self.config = load_config()
-        # Simple rate counters per category/executor within small window
-        self._counters: Dict[int, Dict[str, Dict[int, Deque[datetime]]]] = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: deque(maxlen=10))))
+        # Simple rate counters per (guild, category, executor) within small window
         self._window_seconds = 12
+        self._counters = TTLCache(self._window_seconds, max_size=10000)
+
+    async def cog_load(self) -> None:
+        # Restores run through the shared job queue so they retry and survive restarts
+        self.jobs = get_queue(self.bot)
+        self.jobs.register('antinuke_restore', self._run_restore, guild_concurrency=2)
+
+    async def cog_unload(self) -> None:
+        self.jobs.unregister('antinuke_restore')
+
+    # State handoff for `jsk reload` (see utils/hot_reload.py)
+    def export_state(self) -> Dict:
+        return {'counters': [[list(key), [ts.timestamp() for ts in q]] for key, q in self._counters.items()]}
+
+    def import_state(self, state: Dict) -> None:
+        for key, stamps in state.get('counters', []):
+            q = deque((datetime.fromtimestamp(ts, timezone.utc) for ts in stamps), maxlen=10)
+            self._counters.set(tuple(key), q)
+
+    def queue_restore(self, guild: discord.Guild, source_id: int, kind: str, **params) -> None:
+        params.update({'type': kind, 'source_id': source_id})
+        self.jobs.submit('antinuke_restore', guild.id, params,
+                         dedup_key=f"antinuke_restore:{guild.id}:{kind}:{source_id}", max_attempts=5)
+
+    async def _run_restore(self, job: JobContext) -> None:
+        if job.job.state.get('restored_id'):
+            return
+        guild = self.bot.get_guild(job.job.guild_id)
+        if guild is None:
+            return
+        p = job.job.params
+        if p['type'] == 'channel':
+            category = guild.get_channel(p['category_id']) if p.get('category_id') else None
+            if p.get('voice'):
+                created = await guild.create_voice_channel(name=p['name'], category=category, reason='AntiNuke restore')
+            else:
+                created = await guild.create_text_channel(name=p['name'], category=category, reason='AntiNuke restore')
+        elif p['type'] == 'role':
+            created = await guild.create_role(name=p['name'], colour=discord.Colour(p.get('colour', 0)), hoist=p.get('hoist', False),
+                                              mentionable=p.get('mentionable', False), reason='AntiNuke restore')
+        elif p['type'] == 'webhook':
+            channel = guild.get_channel(p['channel_id'])
+            if channel is None:
+                return
+            created = await channel.create_webhook(name=p['name'])
+        else:
+            return
+        job.checkpoint(force=True, restored_id=created.id)
 
     # ---------- helpers ----------
     def guild_conf(self, guild_id: int) -> Dict:
@@ -181,7 +232,7 @@ class AntiNuke(commands.Cog):
             pass
 
     def bump_counter(self, guild_id: int, category: str, user_id: int) -> int:
-        q = self._counters[guild_id][category][user_id]
+        q = self._counters.touch((guild_id, category, user_id), lambda: deque(maxlen=10))
         now = datetime.now(timezone.utc)
         q.append(now)
         # prune
@@ -519,7 +570,7 @@ class AntiNuke(commands.Cog):
             return
         # capture metadata for restore
         name = getattr(channel, 'name', 'restored-channel')
-        category = getattr(channel, 'category', None)
+        category_id = getattr(channel, 'category_id', None)
         is_voice = isinstance(channel, discord.VoiceChannel)
         try:
             async for entry in guild.audit_logs(limit=3, action=discord.AuditLogAction.channel_delete):
@@ -528,14 +579,8 @@ class AntiNuke(commands.Cog):
                     n = self.bump_counter(guild.id, 'delete_channel', executor.id)
                     if n >= int(cat.get('threshold', 1)):
                         await self.punish(guild, executor, cat.get('action', 'kick'), timeout_seconds=cat.get('timeout_seconds'))
-                        # remediation: restore channel best-effort
-                        try:
-                            if is_voice:
-                                await guild.create_voice_channel(name=name, category=category, reason='AntiNuke restore')
-                            else:
-                                await guild.create_text_channel(name=name, category=category, reason='AntiNuke restore')
-                        except Exception:
-                            pass
+                        # remediation: restore channel in the background
+                        self.queue_restore(guild, channel.id, 'channel', name=name, category_id=category_id, voice=is_voice)
                 break
         except Exception:
             pass
@@ -572,7 +617,7 @@ class AntiNuke(commands.Cog):
             return
         # capture metadata
         name = role.name
-        colour = role.colour
+        colour = role.colour.value
         hoist = role.hoist
         mentionable = role.mentionable
         try:
@@ -582,11 +627,8 @@ class AntiNuke(commands.Cog):
                     n = self.bump_counter(guild.id, 'delete_role', executor.id)
                     if n >= int(cat.get('threshold', 1)):
                         await self.punish(guild, executor, cat.get('action', 'kick'), timeout_seconds=cat.get('timeout_seconds'))
-                        # remediation: restore role best-effort
-                        try:
-                            await guild.create_role(name=name, colour=colour, hoist=hoist, mentionable=mentionable, reason='AntiNuke restore')
-                        except Exception:
-                            pass
+                        # remediation: restore role in the background
+                        self.queue_restore(guild, role.id, 'role', name=name, colour=colour, hoist=hoist, mentionable=mentionable)
                 break
         except Exception:
             pass
@@ -653,11 +695,8 @@ class AntiNuke(commands.Cog):
                             if n >= int(cat_d.get('threshold', 1)):
                                 await self.punish(guild, executor, cat_d.get('action', 'kick'), timeout_seconds=cat_d.get('timeout_seconds'))
                                 # remediation: recreate webhook name in this channel
-                                try:
-                                    name = getattr(entry.target, 'name', 'restored-webhook')
-                                    await channel.create_webhook(name=name)
-                                except Exception:
-                                    pass
+                                name = getattr(entry.target, 'name', None) or 'restored-webhook'
+                                self.queue_restore(guild, getattr(entry.target, 'id', entry.id), 'webhook', name=name, channel_id=channel.id)
                         break
                 except Exception:
                     pass
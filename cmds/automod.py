@@ -4,11 +4,14 @@ import json
 import os
 import re
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Deque, Optional
+from typing import Dict, Optional
 from collections import deque, defaultdict
 
+from utils.cluster import cluster_file
+from utils.cooldown import TTLCache
 
-CONFIG_FILE = 'automod_config.json'
+
+CONFIG_FILE = cluster_file('automod_config.json')
 BOT_OWNER_IDS = {386889350010634252, 164202861356515328}
 
 
@@ -67,16 +70,26 @@ class AutoMod(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         self.config = load_config()
-        # spam tracker: per guild -> per user -> deque of timestamps
-        self._spam_cache: Dict[int, Dict[int, Deque[datetime]]] = defaultdict(lambda: defaultdict(lambda: deque(maxlen=20)))
-        # message cache for deletion: per guild -> per user -> deque of messages
-        self._spam_msg_cache: Dict[int, Dict[int, Deque[discord.Message]]] = defaultdict(lambda: defaultdict(lambda: deque(maxlen=20)))
         # tuning constants
         self.default_spam_threshold = 5
         self.default_spam_window_seconds = 7
+        # spam tracker: (guild, user) -> deque of timestamps; quiet users expire after one window
+        self._spam_cache = TTLCache(self.default_spam_window_seconds, max_size=50000)
+        # message cache for deletion: (guild, user) -> deque of messages
+        self._spam_msg_cache = TTLCache(self.default_spam_window_seconds, max_size=50000)
         self.default_repeat_threshold = 5
         self.default_timeout = timedelta(minutes=10)
 
+    # ---------- state handoff for `jsk reload` (see utils/hot_reload.py) ----------
+    def export_state(self) -> Dict:
+        # Only the spam timestamps are plain data; cached Message objects are left behind
+        return {'spam': [[list(key), [ts.timestamp() for ts in dq]] for key, dq in self._spam_cache.items()]}
+
+    def import_state(self, state: Dict) -> None:
+        for key, stamps in state.get('spam', []):
+            dq = deque((datetime.fromtimestamp(ts, timezone.utc) for ts in stamps), maxlen=20)
+            self._spam_cache.set(tuple(key), dq)
+
     # ---------- permissions ----------
     def can_configure(self, ctx: commands.Context) -> bool:
         if ctx.guild is None:
@@ -424,9 +437,9 @@ class AutoMod(commands.Cog):
             threshold = int(spam_conf.get('threshold', self.default_spam_threshold))
             window = self.default_spam_window_seconds
             now = datetime.now(timezone.utc)
-            dq = self._spam_cache[guild.id][message.author.id]
+            dq = self._spam_cache.touch((guild.id, message.author.id), lambda: deque(maxlen=20))
             dq.append(now)
-            dq_msgs = self._spam_msg_cache[guild.id][message.author.id]
+            dq_msgs = self._spam_msg_cache.touch((guild.id, message.author.id), lambda: deque(maxlen=20))
             dq_msgs.append(message)
             # purge old
             while dq and (now - dq[0]).total_seconds() > window:
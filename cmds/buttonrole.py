@@ -4,11 +4,12 @@ from discord.ui import View, Button
 import json
 import os
 from typing import Optional, Union
+from utils.cluster import cluster_file
 
 class ButtonRole(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.button_roles_file = "button_roles.json"
+        self.button_roles_file = cluster_file('button_roles.json')
         self.button_roles = self.load_button_roles()
 
     def load_button_roles(self):
@@ -0,0 +1,97 @@
+from typing import Any, Dict, List, Optional
+
+from discord.ext import commands
+
+from utils.cluster import ClusterError, get_ipc
+from utils.stats import FIELDS, get_stats
+
+
+def _latency(value: float) -> Optional[float]:
+    return value if value == value and value != float('inf') else None
+
+
+class Cluster(commands.Cog):
+    """Answer cross-cluster queries and aggregate bot-wide numbers over IPC."""
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+        self.ipc = get_ipc(bot)
+        self.stats = get_stats(bot)
+
+    async def cog_load(self) -> None:
+        self.ipc.register('stats', self._op_stats)
+        self.ipc.register('guild', self._op_guild)
+        self.ipc.register('leave', self._op_leave)
+        await self.ipc.start()
+
+    async def cog_unload(self) -> None:
+        for op in ('stats', 'guild', 'leave'):
+            self.ipc.unregister(op)
+        await self.ipc.close()
+
+    # ---------- ops served to other clusters ----------
+    async def _op_stats(self) -> Dict[str, Any]:
+        self.stats.refresh_chunked(self.bot)
+        shards: List[Dict[str, Any]] = []
+        for shard_id, shard in sorted((getattr(self.bot, 'shards', None) or {}).items()):
+            shards.append({
+                'id': shard_id,
+                'up': not shard.is_closed(),
+                'latency': _latency(shard.latency),
+                'guilds': self.stats.shard_guilds[shard_id],
+            })
+        return {'cluster': self.ipc.cluster_id, 'totals': self.stats.snapshot(), 'shards': shards}
+
+    async def _op_guild(self, guild_id: int) -> Optional[Dict[str, Any]]:
+        guild = self.bot.get_guild(int(guild_id))
+        if guild is None:
+            return None
+        return {
+            'id': guild.id,
+            'name': guild.name,
+            'owner_id': guild.owner_id,
+            'members': guild.member_count,
+            'shard': guild.shard_id,
+            'cluster': self.ipc.cluster_id,
+        }
+
+    async def _op_leave(self, guild_id: int) -> bool:
+        guild = self.bot.get_guild(int(guild_id))
+        if guild is None:
+            return False
+        await guild.leave()
+        return True
+
+    # ---------- helpers for commands ----------
+    async def global_stats(self) -> Dict[str, Any]:
+        """Totals summed over every reachable cluster, plus how many answered."""
+        replies = await self.ipc.broadcast('stats')
+        totals = {field: 0 for field in FIELDS + ('humans', 'unsplit', 'guilds')}
+        shards: List[Dict[str, Any]] = []
+        for reply in replies.values():
+            for field in totals:
+                totals[field] += reply['totals'].get(field, 0)
+            for shard in reply['shards']:
+                shards.append(dict(shard, cluster=reply['cluster']))
+        shards.sort(key=lambda shard: shard['id'])
+        return {'totals': totals, 'shards': shards, 'clusters': len(replies), 'expected': self.ipc.cluster_count}
+
+    async def find_guild(self, guild_id: int) -> Optional[Dict[str, Any]]:
+        """Locate a guild in whichever cluster hosts it."""
+        for info in (await self.ipc.broadcast('guild', guild_id=guild_id)).values():
+            if info:
+                return info
+        return None
+
+    async def leave_guild(self, guild_id: int) -> bool:
+        info = await self.find_guild(guild_id)
+        if info is None:
+            return False
+        try:
+            return bool(await self.ipc.request(info['cluster'], 'leave', guild_id=guild_id))
+        except ClusterError:
+            return False
+
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(Cluster(bot))
@@ -8,6 +8,7 @@ from urllib.parse import quote_plus
 import io
 import json
 import re
+from utils.cluster import cluster_file, update_json
 from utils.formatting import quote
 
 BULLY_MEDIA = [
@@ -33,8 +34,10 @@ class Fun(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         self.tenor_key = os.getenv("TENOR_API_KEY")
-        self._nsfw_conf_path = 'nsfw_config.json'
+        self._nsfw_conf_path = cluster_file('nsfw_config.json')
+        # Media lists are shared by every cluster, unlike the per-guild NSFW settings
         self._nsfw_media_path = 'nsfw_media.json'
+        self._nsfw_media_mtime: Optional[float] = None
         self._nsfw_conf: Dict = self._load_json(self._nsfw_conf_path, default={})
         self._nsfw_media: Dict[str, List[str]] = self._load_json(self._nsfw_media_path, default={
             "straight": [],
@@ -88,8 +91,31 @@ class Fun(commands.Cog):
         embed.description = quote(text)
         await ctx.send(embed=embed)
 
+    def _media(self) -> Dict[str, List[str]]:
+        # Reload when another cluster has added media since we last read the file
+        try:
+            mtime = os.path.getmtime(self._nsfw_media_path)
+        except OSError:
+            return self._nsfw_media
+        if mtime != self._nsfw_media_mtime:
+            self._nsfw_media_mtime = mtime
+            self._nsfw_media = self._load_json(self._nsfw_media_path, default=self._nsfw_media)
+        return self._nsfw_media
+
+    def _add_media(self, category: str, urls: List[str]) -> int:
+        """Merge ``urls`` into a media category under the shared file lock; returns how many were new."""
+        def merge(media):
+            bucket = media.setdefault(category, [])
+            new = [u for u in dict.fromkeys(urls) if u not in bucket]
+            bucket.extend(new)
+            return len(new)
+        try:
+            return update_json(self._nsfw_media_path, merge, indent=4)
+        except Exception:
+            return 0
+
     def _pick(self, bucket: str) -> Optional[str]:
-        items = list(self._nsfw_media.get(bucket) or [])
+        items = list(self._media().get(bucket) or [])
         return random.choice(items) if items else None
 
     def _is_nsfw_allowed(self, ctx: commands.Context) -> bool:
@@ -289,15 +315,8 @@ class Fun(commands.Cog):
         if not await self._validate_video_url(url):
             await self._reply_embed(ctx, "NSFW", "Only direct video links are allowed (.mp4, .webm, .mov, .m4v).")
             return
-        self._nsfw_media.setdefault(category, [])
-        if url not in self._nsfw_media[category]:
-            self._nsfw_media[category].append(url)
-            try:
-                with open(self._nsfw_media_path, 'w', encoding='utf-8') as f:
-                    json.dump(self._nsfw_media, f, indent=4)
-            except Exception:
-                pass
-        await self._reply_embed(ctx, "NSFW", f"Video added in {category} porn. Total now {len(self._nsfw_media[category])}.")
+        self._add_media(category, [url])
+        await self._reply_embed(ctx, "NSFW", f"Video added in {category} porn. Total now {len(self._media().get(category, []))}.")
 
     @nsfw.command(name="bulk")
     async def nsfw_bulk(self, ctx: commands.Context, category: str, *, blob: str = "") -> None:
@@ -335,18 +354,9 @@ class Fun(commands.Cog):
             return
         # Filter to probable video URLs
         urls = [u for u in urls if self._looks_like_video(u)]
-        bucket = self._nsfw_media.setdefault(category, [])
-        before = len(bucket)
-        # Deduplicate
-        for u in urls:
-            if u not in bucket:
-                bucket.append(u)
-        try:
-            with open(self._nsfw_media_path, 'w', encoding='utf-8') as f:
-                json.dump(self._nsfw_media, f, indent=4)
-        except Exception:
-            pass
-        added = len(bucket) - before
+        # Deduplicated against the file as it is now, not our possibly stale copy
+        added = self._add_media(category, urls)
+        bucket = self._media().get(category, [])
         await self._reply_embed(ctx, "NSFW", f"Added {added} videos to {category} porn (total {len(bucket)}).")
 
     @nsfw.command(name="list")
@@ -355,7 +365,7 @@ class Fun(commands.Cog):
         if category not in ("straight", "gay", "trans", "lesbian", "hentai"):
             await self._reply_embed(ctx, "NSFW", "Category must be one of: straight, gay, trans, lesbian, hentai.")
             return
-        arr = self._nsfw_media.get(category) or []
+        arr = self._media().get(category) or []
         lines = [f"{i+1}. {u}" for i, u in enumerate(arr[:20])]
         more = "" if len(arr) <= 20 else f"\n... and {len(arr)-20} more"
         text = ("\n".join(lines) or "(empty)") + more
@@ -6,15 +6,47 @@ import json
 import os
 import asyncio
 import random
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 from datetime import datetime, timedelta
 import re
+from utils.cluster import cluster_file
 
 class Giveaway(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.giveaways_file = "giveaways.json"
+        self.giveaways_file = cluster_file('giveaways.json')
         self.giveaways = self.load_giveaways()
+        # giveaway message id -> task that ends it at its end_time
+        self._end_tasks: Dict[str, asyncio.Task] = {}
+
+    async def cog_load(self):
+        self._schedule_pending()
+
+    async def cog_unload(self):
+        for task in self._end_tasks.values():
+            task.cancel()
+        self._end_tasks.clear()
+
+    # State handoff for `jsk reload` (see utils/hot_reload.py)
+    def export_state(self) -> Dict:
+        return {"giveaways": self.giveaways}
+
+    def import_state(self, state: Dict) -> None:
+        self.giveaways = state.get("giveaways", self.giveaways)
+        self._schedule_pending()
+
+    def _schedule(self, guild_id: str, giveaway_id: str) -> None:
+        task = self._end_tasks.get(giveaway_id)
+        if task is not None and not task.done():
+            return
+        self._end_tasks[giveaway_id] = asyncio.create_task(self.end_giveaway(guild_id, giveaway_id))
+
+    def _schedule_pending(self) -> None:
+        """Arm an end timer for every giveaway that hasn't ended yet."""
+        for guild_id, giveaways in self.giveaways.items():
+            for giveaway_id, giveaway in giveaways.items():
+                if not giveaway.get("ended"):
+                    self._schedule(guild_id, giveaway_id)
 
     def load_giveaways(self):
         """Load giveaways from JSON file."""
@@ -312,21 +344,43 @@ class Giveaway(commands.Cog):
         self.save_giveaways()
 
         # Schedule giveaway end
-        self.bot.loop.create_task(self.end_giveaway(guild_id, giveaway_id, duration_delta))
+        self._schedule(guild_id, giveaway_id)
 
         await interaction.response.send_message("Giveaway created successfully!", ephemeral=True)
 
-    async def end_giveaway(self, guild_id: str, giveaway_id: str, duration: timedelta):
-        """End a giveaway after the specified duration."""
-        await asyncio.sleep(duration.total_seconds())
+    async def end_giveaway(self, guild_id: str, giveaway_id: str):
+        """End a giveaway once its end_time is reached."""
+        if guild_id not in self.giveaways or giveaway_id not in self.giveaways[guild_id]:
+            return
+        delay = self.giveaways[guild_id][giveaway_id]["end_time"] - datetime.utcnow().timestamp()
+        await asyncio.sleep(max(0, delay))
+        # Timers are armed during extension load; giveaways that ended during downtime
+        # must wait for the cache so their channel resolves and the result is announced
+        while True:
+            try:
+                await self.bot.wait_until_ready()
+                break
+            except RuntimeError:
+                await asyncio.sleep(1)
         
         if guild_id not in self.giveaways or giveaway_id not in self.giveaways[guild_id]:
             return
+        if self.bot.get_guild(int(guild_id)) is None:
+            return  # Not a guild this process hosts (or we were removed from it)
         
         giveaway = self.giveaways[guild_id][giveaway_id]
         if giveaway["ended"]:
             return
         
+        channel = self.bot.get_channel(giveaway["channel_id"])
+        if channel is None:
+            try:
+                channel = await self.bot.fetch_channel(giveaway["channel_id"])
+            except (discord.NotFound, discord.Forbidden):
+                channel = None  # Channel is gone; end the giveaway without an announcement
+            except discord.HTTPException:
+                return  # Try again on the next start rather than ending it unannounced
+        
         # Mark as ended
         giveaway["ended"] = True
         
@@ -336,7 +390,6 @@ class Giveaway(commands.Cog):
         if not participants:
             # No participants
             try:
-                channel = self.bot.get_channel(giveaway["channel_id"])
                 if channel:
                     await channel.send("No one entered this giveaway!")
             except:
@@ -357,13 +410,13 @@ class Giveaway(commands.Cog):
             
             # Send winner announcement
             try:
-                channel = self.bot.get_channel(giveaway["channel_id"])
                 if channel:
                     await channel.send(winner_message)
             except:
                 pass
         
         self.save_giveaways()
+        self._end_tasks.pop(giveaway_id, None)
 
     @commands.Cog.listener()
     async def on_interaction(self, interaction: discord.Interaction):
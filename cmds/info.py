@@ -3,12 +3,75 @@ from discord.ext import commands
 from datetime import datetime
 from typing import Optional
 from discord.ui import View, Button
+from utils.member_index import JoinIndex
+from utils.stats import get_stats
+from utils.formatting import quote
+
+OWNER_IDS = [386889350010634252, 164202861356515328]  # Update as needed
+
+
+def format_latency(latency: float) -> str:
+    if latency != latency or latency == float('inf'):  # NaN/inf before the first heartbeat
+        return "n/a"
+    return f"{latency * 1000:.0f}ms"
+
 
 class Info(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.join_index = JoinIndex()
+        self.stats = get_stats(bot)
+        # Extension may be (re)loaded after the guilds are already available
+        for guild in bot.guilds:
+            self.stats.set_guild(guild)
+
+    # Keep the join-order index and botinfo counters current
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member) -> None:
+        self.join_index.member_join(member)
+        self.stats.member_join(member)
+
+    @commands.Cog.listener()
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent) -> None:
+        # Unlike on_member_remove, this fires for members that were never cached
+        self.join_index.member_remove(payload.guild_id, payload.user.id)
+        self.stats.member_remove(payload)
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild) -> None:
+        # The member cache starts over when a guild comes back, so does its join index
+        self.join_index.drop(guild.id)
+        self.stats.set_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        self.stats.set_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self.join_index.drop(guild.id)
+        self.stats.remove_guild(guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        self.stats.channel_create(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        self.stats.channel_delete(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel) -> None:
+        self.stats.channel_update(before, after)
 
     # Helpers
+    def _cluster(self):
+        """The Cluster cog when running as one of several worker processes."""
+        cluster = self.bot.get_cog("Cluster")
+        if cluster is not None and cluster.ipc.enabled:
+            return cluster
+        return None
+
     @staticmethod
     def format_dt(dt: Optional[datetime]) -> str:
         if not dt:
@@ -35,10 +98,14 @@ class Info(commands.Cog):
         voice_channels = sum(1 for c in guild.channels if isinstance(c, discord.VoiceChannel))
         categories_count = len(guild.categories)
 
-        # Members
-        total_members = guild.member_count or (len(guild.members) if guild.members else 0)
-        bots_count = sum(1 for m in guild.members if m.bot) if guild.members else 0
-        users_count = total_members - bots_count if total_members else 0
+        # Members: the total comes from the gateway; the bot/human split is only
+        # shown when the member cache is complete (lean mode doesn't chunk large guilds)
+        total_members = guild.member_count or guild.approximate_member_count or len(guild.members)
+        if guild.chunked:
+            bots_count = sum(1 for m in guild.members if m.bot)
+            members_value = f"Users: {total_members - bots_count}\nBots: {bots_count}\nTotal: {total_members}"
+        else:
+            members_value = f"Total: {total_members}"
 
         # Owner
         try:
@@ -70,7 +137,6 @@ class Info(commands.Cog):
 
         # Counts blocks
         counts_value = f"Roles: {roles_count}\nEmojis: {emojis_count}\nStickers: {stickers_count}"
-        members_value = f"Users: {users_count}\nBots: {bots_count}\nTotal: {total_members}"
         channels_value = f"Text: {text_channels}\nVoice: {voice_channels}\nCategories: {categories_count}"
         embed.add_field(name="Counts", value=quote(counts_value), inline=True)
         embed.add_field(name="Members", value=quote(members_value), inline=True)
@@ -145,15 +211,78 @@ class Info(commands.Cog):
         roles_display = " ".join(r.mention for r in roles_sorted[:15]) if roles_sorted else "None"
         embed.add_field(name=f"Roles [{len(roles)}]", value=quote(roles_display or "None"), inline=False)
 
-        # Join position
+        # Join position (needs every member's join date, so only for fully cached guilds)
+        index = self.join_index.get(guild) if guild.chunked else None
+        position = index.position(member.id) if index is not None else None
+        if position:
+            embed.add_field(name="Join position", value=quote(f"{position} / {len(index)}"), inline=False)
+
+        await ctx.send(embed=embed)
+
+    @commands.command(name="newmembers", aliases=["newest", "newusers"])
+    async def new_members(self, ctx: commands.Context, count: int = 10) -> None:
+        """Show the most recently joined members."""
+        guild = ctx.guild
+        if guild is None:
+            await ctx.send("This command can only be used in a server.")
+            return
+        count = max(1, min(count, 25))
+
         try:
-            members_sorted = sorted([m for m in guild.members if m.joined_at], key=lambda m: m.joined_at)
-            position = members_sorted.index(member) + 1 if member in members_sorted else None
+            from utils.formatting import quote
         except Exception:
-            position = None
-        if position:
-            embed.add_field(name="Join position", value=quote(f"{position} / {len(members_sorted)}"), inline=False)
+            def quote(t: str) -> str:
+                return t
 
+        # Lean mode keeps everyone who joined this session, so the newest members are
+        # cached even when the guild isn't chunked; only their positions are unknown
+        index = self.join_index.get(guild)
+        lines = []
+        for position, member_id in enumerate(index.newest(count)):
+            member = guild.get_member(member_id)
+            if member is None:
+                continue
+            rank = f"{len(index) - position}." if guild.chunked else "•"
+            lines.append(f"{rank} {member.mention} — <t:{int(member.joined_at.timestamp())}:R>")
+        embed = discord.Embed(title=f"Newest members in {guild.name}", color=0xFFFFFF)
+        embed.description = "\n".join(lines) if lines else quote("No members found")
+        if not guild.chunked:
+            embed.set_footer(text="Only members cached since the bot started are listed")
+        await ctx.send(embed=embed)
+
+    @commands.command(name="shards")
+    async def shards_cmd(self, ctx: commands.Context) -> None:
+        """Per-shard latency and guild counts (bot owners only)."""
+        if ctx.author.id not in OWNER_IDS:
+            return
+        cluster = self._cluster()
+        lines = []
+        if cluster is not None:
+            # Cluster mode: every worker reports its own shard range over IPC
+            overview = await cluster.global_stats()
+            for shard in overview["shards"]:
+                latency = shard["latency"] if shard["latency"] is not None else float("nan")
+                lines.append(
+                    f"#{shard['id']} (cluster {shard['cluster']}): {'up' if shard['up'] else 'down'} — "
+                    f"{format_latency(latency)}, {shard['guilds']:,} servers"
+                )
+            title = f"Shards ({self.bot.shard_count or 1}) — {overview['clusters']}/{overview['expected']} clusters"
+        else:
+            self.stats.refresh_chunked(self.bot)
+            shards = getattr(self.bot, "shards", None) or {}
+            for shard_id in sorted(shards):
+                shard = shards[shard_id]
+                state = "down" if shard.is_closed() else ("ratelimited" if shard.is_ws_ratelimited() else "up")
+                lines.append(
+                    f"#{shard_id}: {state} — {format_latency(shard.latency)}, "
+                    f"{self.stats.shard_guilds[shard_id]:,} servers"
+                )
+            if not lines:
+                lines.append(f"#0: up — {format_latency(self.bot.latency)}, {self.stats.guilds:,} servers")
+            title = f"Shards ({self.bot.shard_count or 1})"
+        embed = discord.Embed(title=title, color=0xFFFFFF, description=quote("\n".join(lines)))
+        if ctx.guild is not None:
+            embed.set_footer(text=f"This server is on shard #{ctx.guild.shard_id}")
         await ctx.send(embed=embed)
 
     @commands.command(name="botinfo", aliases=["bi"]) 
@@ -161,25 +290,21 @@ class Info(commands.Cog):
         """Show updated bot information including features and prefix."""
         bot = self.bot
         guild = ctx.guild
-        # Accurate counts require members intent
-        total_members = 0
-        total_bots = 0
-        total_users = 0
-        for g in bot.guilds:
-            members = g.members if g.members else []
-            # if cache is empty, try to fetch quickly
-            if not members and g.chunked is False:
-                try:
-                    await g.chunk(cache=True)
-                    members = g.members
-                except Exception:
-                    members = []
-            total_members += len(members) if members else (g.member_count or 0)
-            total_bots += sum(1 for m in members if getattr(m, 'bot', False))
-            total_users += sum(1 for m in members if not getattr(m, 'bot', False))
-        text_channels = sum(len([c for c in g.channels if isinstance(c, discord.TextChannel)]) for g in bot.guilds)
-        voice_channels = sum(len([c for c in g.channels if isinstance(c, discord.VoiceChannel)]) for g in bot.guilds)
-        categories = sum(len(g.categories) for g in bot.guilds)
+        # Counters are maintained from gateway events (utils/stats.py); in cluster
+        # mode they are summed over every worker process
+        cluster = self._cluster()
+        overview = await cluster.global_stats() if cluster is not None else None
+        if overview is not None:
+            totals = overview["totals"]
+        else:
+            self.stats.refresh_chunked(bot)
+            totals = self.stats.snapshot()
+        total_members = totals['members']
+        total_bots = totals['bots']
+        total_users = totals['humans']
+        text_channels = totals['text']
+        voice_channels = totals['voice']
+        categories = totals['categories']
 
         # System
         import platform, sys
@@ -224,6 +349,9 @@ class Info(commands.Cog):
 
         # Members
         members_field = f"Total: {total_members}\nHuman: {total_users}\nBots: {total_bots}"
+        if totals['unsplit']:
+            # Guilds without a complete member cache have no bot/human breakdown
+            members_field += f"\nUncounted: {totals['unsplit']}"
         embed.add_field(name="Members", value=quote(members_field), inline=True)
 
         # Channels
@@ -231,8 +359,14 @@ class Info(commands.Cog):
         embed.add_field(name="Channels", value=quote(channels_field), inline=True)
 
         # Totals / Presence
-        servers = len(bot.guilds)
-        embed.add_field(name="Servers", value=str(servers), inline=True)
+        embed.add_field(name="Servers", value=str(totals['guilds']), inline=True)
+        shard_id = guild.shard_id if guild else 0
+        shard = bot.get_shard(shard_id) if hasattr(bot, "get_shard") else None
+        shard_latency = shard.latency if shard else bot.latency
+        shards_field = f"Shards: {bot.shard_count or 1}\nThis server: #{shard_id}\nLatency: {format_latency(shard_latency)}"
+        if overview is not None:
+            shards_field += f"\nClusters: {overview['clusters']}/{overview['expected']}"
+        embed.add_field(name="Shards", value=quote(shards_field), inline=True)
         embed.add_field(name="Prefix", value=f"`{ctx.prefix}`", inline=True)
 
         # System
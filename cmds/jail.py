@@ -2,15 +2,256 @@ import discord
 from discord.ext import commands
 import json
 import os
+import re
+import time
+from datetime import timedelta
+from typing import Dict, Optional, Set
+from utils.cluster import cluster_file
+from utils.jobs import get_queue
+from utils.timers import get_timers
+
+
+# Overwrites applied once per channel at `set jail` time; jailing itself is only a role swap
+JAIL_DENY = discord.PermissionOverwrite(view_channel=False, send_messages=False)
+JAIL_ALLOW = discord.PermissionOverwrite(view_channel=True, send_messages=True)
+
+# Retry delay when a sentence ends but the member's roles can't be edited yet
+RELEASE_RETRY = 15 * 60
+
+
+def parse_duration(text: str) -> Optional[timedelta]:
+    """Parse sentence lengths like 30m, 2h, 1d or 1w"""
+    m = re.match(r'^(\d+)(m|min|mins|minute|minutes|h|hr|hrs|hour|hours|d|day|days|w|week|weeks)$', (text or '').strip().lower())
+    if not m:
+        return None
+    value = int(m.group(1))
+    unit = m.group(2)
+    if unit.startswith('m'):
+        return timedelta(minutes=value)
+    if unit.startswith('h'):
+        return timedelta(hours=value)
+    if unit.startswith('d'):
+        return timedelta(days=value)
+    return timedelta(weeks=value)
+
+
+def sentence_key(guild_id, user_id) -> str:
+    return f"jail:{guild_id}:{user_id}"
 
 class Jail(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.jailed_file = 'jailed_users.json'
-        self.jail_config_file = 'jail_config.json'
+        self.jailed_file = cluster_file('jailed_users.json')
+        self.jail_config_file = cluster_file('jail_config.json')
         self.jailed_users = self.load_jailed_users()
         self.jail_config = self.load_jail_config()
-        
+        # guild_id -> jailed user ids, checked on every member join
+        self.jailed_index: Dict[int, Set[int]] = {
+            int(guild_id): {int(user_id) for user_id in users}
+            for guild_id, users in self.jailed_users.items()
+        }
+
+    async def cog_load(self):
+        # The one-off overwrite sweep runs as a background job so it resumes after restarts
+        self.jobs = get_queue(self.bot)
+        self.jobs.register('jail_overwrites', self._run_jail_overwrites)
+        # Timed sentences share the bot-wide persistent deadline scheduler
+        self.timers = get_timers(self.bot)
+        self.timers.register('jail_release', self._on_sentence_end)
+        for guild_id, users in self.jailed_users.items():
+            for user_id, user_data in users.items():
+                expires_at = user_data.get("expires_at")
+                if expires_at and self.timers.get(sentence_key(guild_id, user_id)) is None:
+                    self.timers.schedule('jail_release', sentence_key(guild_id, user_id), int(guild_id), expires_at)
+
+    async def cog_unload(self):
+        self.jobs.unregister('jail_overwrites')
+        self.timers.unregister('jail_release')
+
+    def get_jail_role(self, guild):
+        """The configured jail role, falling back to the legacy "Jailed" name lookup"""
+        role_id = self.jail_config.get(str(guild.id), {}).get("jail_role_id")
+        role = guild.get_role(int(role_id)) if role_id else None
+        return role or discord.utils.get(guild.roles, name="Jailed")
+
+    def submit_overwrites(self, guild, jail_role, jail_channel, requested_by=None):
+        """Queue the one-time sweep that hides the guild from the jail role"""
+        return self.jobs.submit('jail_overwrites', guild.id,
+                                {'role_id': jail_role.id, 'jail_channel_id': jail_channel.id},
+                                requested_by=requested_by)
+
+    async def _sweep_channels(self, job, apply, channels):
+        """Run ``apply`` over ``channels``, checkpointing the channels already handled"""
+        guild = self.bot.get_guild(job.job.guild_id)
+        if guild is None:
+            return
+        handled = set(job.job.state.get('handled', []))
+        channels = [c for c in channels if c.id not in handled]
+        job.progress(done=len(handled), total=len(handled) + len(channels))
+        for channel in channels:
+            await job.step()
+            try:
+                await apply(guild, channel)
+            except (discord.Forbidden, discord.NotFound):
+                pass
+            handled.add(channel.id)
+            job.checkpoint(handled=list(handled))
+            job.progress(done=len(handled))
+
+    async def _run_jail_overwrites(self, job):
+        """Hide every channel from the jail role except the jail channel.
+
+        Categories are handled first. Children still synced with their category are re-synced
+        rather than given their own overwrite, so they keep following the category, and channels
+        that already carry the right overwrite are skipped, which makes re-running ``set jail`` cheap.
+        """
+        params = job.job.params
+        guild = self.bot.get_guild(job.job.guild_id)
+        if guild is None:
+            return
+        jail_role = guild.get_role(params['role_id'])
+        if jail_role is None:
+            return
+        # Decide which children follow their category before the category overwrites change
+        if 'synced' not in job.job.state:
+            job.checkpoint(force=True, synced=[
+                c.id for c in guild.channels
+                if c.category is not None and c.id != params['jail_channel_id'] and self._follows_category(c, jail_role)
+            ])
+        synced = set(job.job.state['synced'])
+
+        async def apply(guild, channel):
+            if channel.id == params['jail_channel_id']:
+                # Jail channel: only jailed users and admins can see
+                if channel.overwrites_for(jail_role) != JAIL_ALLOW:
+                    await channel.set_permissions(jail_role, overwrite=JAIL_ALLOW)
+                if channel.overwrites_for(guild.default_role) != JAIL_DENY:
+                    await channel.set_permissions(guild.default_role, overwrite=JAIL_DENY)
+            elif channel.overwrites_for(jail_role) == JAIL_DENY:
+                return
+            elif channel.id in synced and channel.category is not None:
+                await channel.edit(sync_permissions=True)
+            else:
+                await channel.set_permissions(jail_role, overwrite=JAIL_DENY)
+
+        ordered = sorted(guild.channels, key=lambda c: (not isinstance(c, discord.CategoryChannel), c.position))
+        await self._sweep_channels(job, apply, ordered)
+
+        cfg = self.jail_config.get(str(guild.id))
+        if cfg is not None and cfg.get("jail_role_id") == str(jail_role.id):
+            cfg["overwrites_ready"] = True
+            self.save_jail_config()
+
+    @staticmethod
+    def _follows_category(channel, jail_role):
+        """Whether ``channel`` mirrors its category's overwrites, ignoring the jail role itself"""
+        mine = {t: o for t, o in channel.overwrites.items() if t != jail_role}
+        parent = {t: o for t, o in channel.category.overwrites.items() if t != jail_role}
+        return mine == parent
+
+    async def release(self, guild, user_id, member, reason, save=True):
+        """Give a jailed member their stored roles back in one call and drop their record.
+
+        ``member`` may be None when they have left the guild; the record is dropped all the same.
+        Returns ``(restored, failed)`` role names. Raises discord.Forbidden if the edit is refused.
+        """
+        user_id = str(user_id)
+        user_data = self.jailed_users.get(str(guild.id), {}).get(user_id, {})
+        restored_roles = []
+        failed_roles = []
+        if member is not None and user_data:
+            jail_role = self.get_jail_role(guild)
+            # Split stored roles into ones we can give back and ones that are gone or above us
+            bot_top = guild.me.top_role
+            restore = [r for r in member.roles[1:] if r != jail_role]
+            for role_id in user_data.get("roles", []):
+                role = guild.get_role(role_id)
+                if role is None or role == jail_role or role in restore:
+                    continue
+                if role.managed or role >= bot_top:
+                    failed_roles.append(role.name)
+                else:
+                    restore.append(role)
+                    restored_roles.append(role.name)
+            # Swap the jail role back for the stored roles in one call
+            await member.edit(roles=restore, reason=reason[:512])
+        self.forget_jailed(guild.id, user_id, save=save)
+        return restored_roles, failed_roles
+
+    def is_jailed(self, guild_id, user_id) -> bool:
+        """O(1) check used by join listeners (see JoinRoles) to leave jailed members alone"""
+        return int(user_id) in self.jailed_index.get(int(guild_id), ())
+
+    def forget_jailed(self, guild_id, user_id, save=True):
+        """Drop a jail record and its pending sentence timer"""
+        jailed = self.jailed_index.get(int(guild_id))
+        if jailed is not None:
+            jailed.discard(int(user_id))
+            if not jailed:
+                del self.jailed_index[int(guild_id)]
+        guild_id = str(guild_id)
+        users = self.jailed_users.get(guild_id, {})
+        users.pop(str(user_id), None)
+        if not users:
+            self.jailed_users.pop(guild_id, None)
+        self.timers.cancel(sentence_key(guild_id, user_id))
+        if save:
+            self.save_jailed_users()
+
+    async def _on_sentence_end(self, timer):
+        """Release a member whose timed sentence has run out"""
+        user_id = timer.key.rsplit(':', 1)[1]
+        user_data = self.jailed_users.get(str(timer.guild_id), {}).get(user_id)
+        if user_data is None or user_data.get("expires_at") != timer.run_at:
+            return  # unjailed or re-sentenced in the meantime
+        guild = self.bot.get_guild(timer.guild_id)
+        if guild is None:
+            self.forget_jailed(timer.guild_id, user_id)
+            return
+        try:
+            # The fetch can fail transiently too (429/5xx); it shares the release retry
+            member = guild.get_member(int(user_id)) or await self._fetch_member(guild, user_id)
+            await self.release(guild, user_id, member, "Jail sentence served")
+        except discord.HTTPException as e:
+            print(f"[Jail] Failed to release {user_id} in {guild.id}, retrying later: {e}")
+            # Retry from now, not from the original deadline, which may be long past after downtime
+            retry_at = max(time.time(), timer.run_at) + RELEASE_RETRY
+            user_data["expires_at"] = retry_at
+            self.timers.schedule('jail_release', timer.key, timer.guild_id, retry_at)
+            self.save_jailed_users()
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member):
+        """Put members who left while jailed straight back in jail"""
+        if not self.is_jailed(member.guild.id, member.id):
+            return
+        jail_role = self.get_jail_role(member.guild)
+        if jail_role is None:
+            return
+        # A fresh member has no roles, so this single call is the whole jail swap;
+        # JoinRoles skips jailed members, so no auto roles are granted in between
+        try:
+            await member.add_roles(jail_role, reason="Rejoined while jailed")
+        except discord.HTTPException as e:
+            print(f"[Jail] Failed to re-jail {member.id} in {member.guild.id}: {e}")
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel):
+        """Keep the jail overwrites current as channels are added"""
+        cfg = self.jail_config.get(str(channel.guild.id), {})
+        if not cfg.get("enabled", False) or str(channel.id) == cfg.get("jail_channel_id"):
+            return
+        jail_role = self.get_jail_role(channel.guild)
+        # Channels created inside a category usually inherit its overwrites already
+        if jail_role is None or channel.overwrites_for(jail_role) == JAIL_DENY:
+            return
+        try:
+            await channel.set_permissions(jail_role, overwrite=JAIL_DENY, reason="Jail system")
+        except (discord.Forbidden, discord.NotFound):
+            pass
+        except discord.HTTPException as e:
+            print(f"[Jail] Failed to hide #{channel.name} from the jail role: {e}")
+
     def load_jailed_users(self):
         """Load jailed users from JSON file"""
         try:
@@ -43,7 +284,7 @@ class Jail(commands.Cog):
     
     @commands.group(name='jail', invoke_without_command=True)
     async def jail_user(self, ctx, target: str = None, *, reason="No reason provided"):
-        """Jail a user by removing their roles and adding them to a jail role"""
+        """Jail a user by removing their roles and adding them to a jail role, optionally for a set time"""
         guild_id = str(ctx.guild.id)
         
         # If subcommand (e.g., status), don't run base action
@@ -57,7 +298,7 @@ class Jail(commands.Cog):
 
         # If no member provided show usage
         if target is None:
-            await ctx.send(f"Usage: `{ctx.prefix}jail @user [reason]` or `{ctx.prefix}jail status`")
+            await ctx.send(f"Usage: `{ctx.prefix}jail @user [duration] [reason]` or `{ctx.prefix}jail status`")
             return
         
         # Require Manage Roles unless invoker is bot owner (JSK covers owners, but allow here too)
@@ -95,22 +336,14 @@ class Jail(commands.Cog):
         user_id = str(member.id)
         
         # Check if user is already jailed
-        if guild_id in self.jailed_users and user_id in self.jailed_users[guild_id]:
+        if self.is_jailed(ctx.guild.id, member.id):
             await ctx.send(f"{member.mention} is already jailed!")
             return
         
-        # Get or create jail role
-        jail_role = discord.utils.get(ctx.guild.roles, name="Jailed")
+        jail_role = self.get_jail_role(ctx.guild)
         if not jail_role:
-            try:
-                jail_role = await ctx.guild.create_role(
-                    name="Jailed",
-                    color=discord.Color.dark_red(),
-                    reason="Jail system role"
-                )
-            except discord.Forbidden:
-                await ctx.send("I don't have permission to create the jail role!")
-                return
+            await ctx.send(f"Jail role not found! Use `{ctx.prefix}set jail` to set it up again.")
+            return
         
         # Get jail channel
         jail_channel_id = self.jail_config[guild_id].get("jail_channel_id")
@@ -122,6 +355,14 @@ class Jail(commands.Cog):
             await ctx.send("Jail channel not found! Please set up the jail system first.")
             return
         
+        # An optional sentence length leads the reason: `jail @user 2h spamming`
+        head, _, rest = reason.partition(' ')
+        duration = parse_duration(head)
+        expires_at = None
+        if duration is not None:
+            reason = rest.strip() or "No reason provided"
+            expires_at = time.time() + duration.total_seconds()
+        
         # Store original roles
         original_roles = [role.id for role in member.roles if role.name != "@everyone"]
         
@@ -134,33 +375,31 @@ class Jail(commands.Cog):
             "roles": original_roles,
             "reason": reason,
             "jailed_by": ctx.author.id,
-            "jailed_at": str(ctx.message.created_at)
+            "jailed_at": str(ctx.message.created_at),
+            "expires_at": expires_at
         }
+        self.jailed_index.setdefault(ctx.guild.id, set()).add(member.id)
         
-        # Remove all roles and add jail role
+        # Swap every role for the jail role in one call; managed roles (boosts, integrations) can't be removed
         try:
-            await member.remove_roles(*member.roles[1:])  # Keep @everyone role
-            await member.add_roles(jail_role)
-        except discord.Forbidden:
-            await ctx.send("I don't have permission to modify this user's roles!")
+            await member.edit(roles=[r for r in member.roles[1:] if r.managed] + [jail_role],
+                              reason=f"Jailed by {ctx.author}: {reason}"[:512])
+        except discord.HTTPException as e:
+            # Roll back so a failed edit doesn't leave a phantom jail record behind
+            self.forget_jailed(ctx.guild.id, member.id, save=False)
+            if isinstance(e, discord.Forbidden):
+                await ctx.send("I don't have permission to modify this user's roles!")
+            else:
+                await ctx.send(f"Failed to jail {member.mention}, please try again. ({e.status})")
             return
         
-        # Set up channel permissions for jailed user
-        try:
-            # Hide all channels from jailed user except jail channel
-            for channel in ctx.guild.channels:
-                if channel != jail_channel:
-                    # Hide all other channels from jailed users
-                    await channel.set_permissions(jail_role, view_channel=False, send_messages=False, read_messages=False)
-                else:
-                    # Jail channel: only jailed users and admins can see
-                    await channel.set_permissions(jail_role, view_channel=True, send_messages=True, read_messages=True)
-                    # Hide jail channel from everyone else (non-admins)
-                    await channel.set_permissions(ctx.guild.default_role, view_channel=False, send_messages=False, read_messages=False)
-        except discord.Forbidden:
-            await ctx.send("Warning: I don't have permission to set channel permissions!")
+        # Guilds set up before the overwrites were applied at `set jail` time get them once here
+        if not self.jail_config[guild_id].get("overwrites_ready"):
+            self.submit_overwrites(ctx.guild, jail_role, jail_channel, requested_by=ctx.author.id)
         
         self.save_jailed_users()
+        if expires_at:
+            self.timers.schedule('jail_release', sentence_key(guild_id, user_id), ctx.guild.id, expires_at)
         
         embed = discord.Embed(
             title="🔒 User Jailed",
@@ -171,6 +410,8 @@ class Jail(commands.Cog):
         embed.add_field(name="Jailed by", value=ctx.author.mention, inline=True)
         embed.add_field(name="User ID", value=member.id, inline=True)
         embed.add_field(name="Jail Channel", value=jail_channel.mention, inline=True)
+        if expires_at:
+            embed.add_field(name="Released", value=f"<t:{int(expires_at)}:R>", inline=True)
         embed.set_footer(text=f"Use {ctx.prefix}unjail {member.mention} to unjail them")
         
         await ctx.send(embed=embed)
@@ -182,6 +423,8 @@ class Jail(commands.Cog):
             color=0xFFFFFF
         )
         jail_embed.add_field(name="Reason", value=reason, inline=False)
+        if expires_at:
+            jail_embed.add_field(name="Released", value=f"<t:{int(expires_at)}:R>", inline=False)
         jail_embed.add_field(name="Jail Channel", value="You can only see and use this channel while jailed.", inline=False)
         await jail_channel.send(embed=jail_embed)
 
@@ -212,74 +455,71 @@ class Jail(commands.Cog):
 
     @commands.command(name='unjail')
     @commands.has_permissions(manage_roles=True)
-    async def unjail_user(self, ctx, member: discord.Member):
-        """Unjail a user by restoring their original roles"""
+    async def unjail_user(self, ctx, members: commands.Greedy[discord.Member], scope: str = None):
+        """Unjail one or more users (or `all`) by restoring their original roles"""
         guild_id = str(ctx.guild.id)
-        user_id = str(member.id)
+        jailed = self.jailed_users.get(guild_id, {})
         
-        # Check if user is jailed
-        if guild_id not in self.jailed_users or user_id not in self.jailed_users[guild_id]:
-            await ctx.send(f"{member.mention} is not jailed!")
+        if scope is not None and scope.lower() == "all":
+            if not jailed:
+                await ctx.send("No users are currently jailed in this server.")
+                return
+            # Members who have left are included so their records are cleared too
+            targets = [(user_id, ctx.guild.get_member(int(user_id))) for user_id in list(jailed)]
+        elif members:
+            targets = [(str(m.id), m) for m in dict.fromkeys(members)]
+        else:
+            await ctx.send(f"Please specify a user to unjail! Usage: `{ctx.prefix}unjail @user [@user...]` or `{ctx.prefix}unjail all`")
             return
         
-        # Get jail role
-        jail_role = discord.utils.get(ctx.guild.roles, name="Jailed")
-        if not jail_role:
-            await ctx.send("Jail role not found! Creating a new one...")
-            try:
-                jail_role = await ctx.guild.create_role(name="Jailed")
-            except discord.Forbidden:
-                await ctx.send("I don't have permission to create the jail role!")
-                return
+        not_jailed = [member for user_id, member in targets if user_id not in jailed]
+        targets = [(user_id, member) for user_id, member in targets if user_id in jailed]
+        if len(targets) == 1 and not not_jailed:
+            await self._unjail_one(ctx, *targets[0])
+            return
+        if not targets:
+            await ctx.send(f"{not_jailed[0].mention} is not jailed!" if len(not_jailed) == 1 else "None of those users are jailed!")
+            return
         
-        # Get user data
-        user_data = self.jailed_users[guild_id][user_id]
-        original_role_ids = user_data["roles"]
+        released = []
+        failed = []
+        for user_id, member in targets:
+            if member is None:
+                member = await self._fetch_member(ctx.guild, user_id)
+            try:
+                await self.release(ctx.guild, user_id, member, f"Unjailed by {ctx.author}", save=False)
+                released.append(member.mention if member else f"`{user_id}` (left)")
+            except discord.HTTPException:
+                failed.append(member.mention if member else f"`{user_id}`")
+        self.save_jailed_users()
         
-        # Remove jail role
+        embed = discord.Embed(
+            title="🔓 Users Unjailed",
+            description=f"Unjailed {len(released)} of {len(targets)} users.",
+            color=0xFFFFFF
+        )
+        embed.add_field(name="Unjailed by", value=ctx.author.mention, inline=True)
+        if released:
+            embed.add_field(name="Released", value=", ".join(released[:25]), inline=False)
+        if failed:
+            embed.add_field(name="Failed (missing permissions)", value=", ".join(failed[:25]), inline=False)
+        if not_jailed:
+            embed.add_field(name="Not jailed", value=", ".join(m.mention for m in not_jailed[:25]), inline=False)
+        await ctx.send(embed=embed)
+    
+    async def _unjail_one(self, ctx, user_id, member):
+        user_data = self.jailed_users[str(ctx.guild.id)][user_id]
+        if member is None:
+            member = await self._fetch_member(ctx.guild, user_id)
         try:
-            await member.remove_roles(jail_role)
+            restored_roles, failed_roles = await self.release(ctx.guild, user_id, member, f"Unjailed by {ctx.author}")
         except discord.Forbidden:
-            await ctx.send("I don't have permission to remove the jail role!")
+            await ctx.send("I don't have permission to modify this user's roles!")
             return
         
-        # Restore channel permissions for unjailed user
-        try:
-            # Reset channel permissions for the user
-            for channel in ctx.guild.channels:
-                await channel.set_permissions(member, overwrite=None)
-            # Make sure jail channel is hidden from regular users
-            jail_channel_id = self.jail_config[guild_id].get("jail_channel_id")
-            if jail_channel_id:
-                jail_channel = ctx.guild.get_channel(int(jail_channel_id))
-                if jail_channel:
-                    await jail_channel.set_permissions(ctx.guild.default_role, view_channel=False, send_messages=False, read_messages=False)
-        except discord.Forbidden:
-            await ctx.send("Warning: I don't have permission to reset channel permissions!")
-        
-        # Restore original roles
-        restored_roles = []
-        failed_roles = []
-        
-        for role_id in original_role_ids:
-            role = ctx.guild.get_role(role_id)
-            if role and role.name != "Jailed":
-                try:
-                    await member.add_roles(role)
-                    restored_roles.append(role.name)
-                except discord.Forbidden:
-                    failed_roles.append(role.name)
-        
-        # Remove from jailed users
-        del self.jailed_users[guild_id][user_id]
-        if not self.jailed_users[guild_id]:  # Remove guild if no jailed users
-            del self.jailed_users[guild_id]
-        
-        self.save_jailed_users()
-        
         embed = discord.Embed(
             title="🔓 User Unjailed",
-            description=f"{member.mention} has been unjailed!",
+            description=f"{member.mention if member else f'`{user_id}`'} has been unjailed!",
             color=0xFFFFFF
         )
         embed.add_field(name="Unjailed by", value=ctx.author.mention, inline=True)
@@ -292,6 +532,13 @@ class Jail(commands.Cog):
         
         await ctx.send(embed=embed)
     
+    @staticmethod
+    async def _fetch_member(guild, user_id):
+        try:
+            return await guild.fetch_member(int(user_id))
+        except discord.NotFound:
+            return None
+    
     @commands.command(name='jailed')
     @commands.has_permissions(manage_roles=True)
     async def list_jailed(self, ctx):
@@ -313,10 +560,12 @@ class Jail(commands.Cog):
             if member:
                 jailed_by = ctx.guild.get_member(user_data["jailed_by"])
                 jailed_by_mention = jailed_by.mention if jailed_by else "Unknown"
+                expires_at = user_data.get("expires_at")
+                release = f"<t:{int(expires_at)}:R>" if expires_at else "Manual"
                 
                 embed.add_field(
                     name=f"👤 {member.display_name}",
-                    value=f"**Reason:** {user_data['reason']}\n**Jailed by:** {jailed_by_mention}\n**User ID:** {user_id}",
+                    value=f"**Reason:** {user_data['reason']}\n**Jailed by:** {jailed_by_mention}\n**Released:** {release}\n**User ID:** {user_id}",
                     inline=False
                 )
         
@@ -381,8 +630,12 @@ class Jail(commands.Cog):
             self.jail_config[guild_id]["enabled"] = True
             self.jail_config[guild_id]["jail_channel_id"] = str(jail_channel.id)
             self.jail_config[guild_id]["jail_role_id"] = str(jail_role.id)
+            self.jail_config[guild_id]["overwrites_ready"] = False
             self.save_jail_config()
             
+            # Hide the server from the jail role once, here, so jailing is just a role swap
+            self.submit_overwrites(ctx.guild, jail_role, jail_channel, requested_by=ctx.author.id)
+            
             embed = discord.Embed(
                 title="✅ Jail System Enabled",
                 description="The jail system has been set up successfully!",
@@ -391,7 +644,8 @@ class Jail(commands.Cog):
             embed.add_field(name="Jail Role", value=jail_role.mention, inline=True)
             embed.add_field(name="Jail Channel", value=jail_channel.mention, inline=True)
             embed.add_field(name="Status", value="Enabled", inline=True)
-            embed.add_field(name="Usage", value=f"`{ctx.prefix}jail @user [reason]` - Jail a user\n`{ctx.prefix}unjail @user` - Unjail a user", inline=False)
+            embed.add_field(name="Channel permissions", value=f"Applying in the background, see `{ctx.prefix}jobs`", inline=False)
+            embed.add_field(name="Usage", value=f"`{ctx.prefix}jail @user [duration] [reason]` - Jail a user (e.g. `2h`, `1d`)\n`{ctx.prefix}unjail @user [@user...]` - Unjail users (`all` for everyone)", inline=False)
             await ctx.send(embed=embed)
     
     @commands.command(name='unset')
@@ -482,7 +736,7 @@ class Jail(commands.Cog):
         if isinstance(error, commands.MissingPermissions):
             await ctx.send("You need 'Manage Roles' permission to unjail users!")
         elif isinstance(error, commands.MissingRequiredArgument):
-            await ctx.send(f"Please specify a user to unjail! Usage: `{ctx.prefix}unjail @user`")
+            await ctx.send(f"Please specify a user to unjail! Usage: `{ctx.prefix}unjail @user [@user...]` or `{ctx.prefix}unjail all`")
         elif isinstance(error, commands.MemberNotFound):
             await ctx.send("User not found! Please mention a valid user.")
     
@@ -0,0 +1,142 @@
+import discord
+from discord.ext import commands
+import json
+import time
+from typing import Optional
+
+from utils.jobs import Job, get_queue
+
+
+OWNER_IDS = [386889350010634252, 164202861356515328]
+
+KIND_LABELS = {
+    'bulk_role': 'Bulk role',
+    'jail_overwrites': 'Jail channel permissions',
+    'ticket_close': 'Ticket close',
+    'antinuke_restore': 'AntiNuke restore',
+}
+
+
+def is_second_owner(guild_id: int, user_id: int) -> bool:
+    try:
+        with open('second_owners.json', 'r') as f:
+            data = json.load(f)
+        return str(user_id) == data.get(str(guild_id))
+    except Exception:
+        return False
+
+
+class Jobs(commands.Cog):
+    """Inspect and control background jobs queued for this server."""
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+        self.queue = get_queue(bot)
+
+    def is_admin_owner_or_sso(self, ctx: commands.Context) -> bool:
+        if ctx.guild is None:
+            return False
+        if ctx.author.id in OWNER_IDS or ctx.author.id == ctx.guild.owner_id:
+            return True
+        if ctx.author.guild_permissions.administrator:
+            return True
+        return is_second_owner(ctx.guild.id, ctx.author.id)
+
+    @staticmethod
+    def _describe(job: Job) -> str:
+        label = KIND_LABELS.get(job.kind, job.kind)
+        progress = f" — {job.done}/{job.total}" if job.total else ""
+        return f"`{job.job_id}` **{label}** · {job.status}{progress}"
+
+    def _find(self, ctx: commands.Context, job_id: str) -> Optional[Job]:
+        job = self.queue.get(job_id)
+        if job is None or job.guild_id != ctx.guild.id:
+            return None
+        return job
+
+    @commands.group(name='jobs', invoke_without_command=True)
+    @commands.guild_only()
+    async def jobs_group(self, ctx: commands.Context):
+        """List background jobs for this server."""
+        await self.jobs_list(ctx)
+
+    @jobs_group.command(name='list')
+    @commands.guild_only()
+    async def jobs_list(self, ctx: commands.Context):
+        """List queued, running and recently finished jobs."""
+        if not self.is_admin_owner_or_sso(ctx):
+            await ctx.send("Only Guild Owner, Second Owner, or Administrators can use this command.")
+            return
+        jobs = self.queue.list(guild_id=ctx.guild.id, include_finished=True)
+        if not jobs:
+            await ctx.send("No background jobs for this server.")
+            return
+        active = [j for j in jobs if not j.finished]
+        finished = [j for j in jobs if j.finished][-10:]
+        embed = discord.Embed(title="Background Jobs", color=0xFFFFFF)
+        embed.add_field(name="Active", value="\n".join(self._describe(j) for j in active[:15]) or "None", inline=False)
+        if finished:
+            embed.add_field(name="Recently finished", value="\n".join(self._describe(j) for j in finished), inline=False)
+        embed.set_footer(text=f"Use {ctx.prefix}jobs status <id> or {ctx.prefix}jobs cancel <id>")
+        await ctx.send(embed=embed)
+
+    @jobs_group.command(name='status')
+    @commands.guild_only()
+    async def jobs_status(self, ctx: commands.Context, job_id: str):
+        """Show details for a single job."""
+        if not self.is_admin_owner_or_sso(ctx):
+            await ctx.send("Only Guild Owner, Second Owner, or Administrators can use this command.")
+            return
+        job = self._find(ctx, job_id)
+        if job is None:
+            await ctx.send(f"No job `{job_id}` found in this server.")
+            return
+        embed = discord.Embed(title=f"Job {job.job_id}", description=KIND_LABELS.get(job.kind, job.kind), color=0xFFFFFF)
+        embed.add_field(name="Status", value=job.status.capitalize(), inline=True)
+        if job.total:
+            embed.add_field(name="Progress", value=f"{job.done}/{job.total}", inline=True)
+        embed.add_field(name="Attempts", value=f"{job.attempts}/{job.max_attempts}", inline=True)
+        if job.requested_by:
+            embed.add_field(name="Requested by", value=f"<@{job.requested_by}>", inline=True)
+        embed.add_field(name="Created", value=f"<t:{int(job.created_at)}:R>", inline=True)
+        if job.status in ('queued', 'retrying') and job.run_at > time.time():
+            embed.add_field(name="Runs", value=f"<t:{int(job.run_at)}:R>", inline=True)
+        if job.error:
+            embed.add_field(name="Last error", value=job.error, inline=False)
+        await ctx.send(embed=embed)
+
+    async def _control(self, ctx: commands.Context, job_id: str, op: str) -> None:
+        if not self.is_admin_owner_or_sso(ctx):
+            await ctx.send("Only Guild Owner, Second Owner, or Administrators can use this command.")
+            return
+        job = self._find(ctx, job_id)
+        if job is None:
+            await ctx.send(f"No job `{job_id}` found in this server.")
+            return
+        done = {'pause': 'paused', 'resume': 'resumed', 'cancel': 'cancelled'}[op]
+        if not getattr(self.queue, op)(job.job_id):
+            await ctx.send(f"Job `{job.job_id}` is {job.status} and can't be {done}.")
+            return
+        await ctx.send(f"Job `{job.job_id}` {done}.")
+
+    @jobs_group.command(name='cancel')
+    @commands.guild_only()
+    async def jobs_cancel(self, ctx: commands.Context, job_id: str):
+        """Cancel a queued or running job."""
+        await self._control(ctx, job_id, 'cancel')
+
+    @jobs_group.command(name='pause')
+    @commands.guild_only()
+    async def jobs_pause(self, ctx: commands.Context, job_id: str):
+        """Pause a queued or running job."""
+        await self._control(ctx, job_id, 'pause')
+
+    @jobs_group.command(name='resume')
+    @commands.guild_only()
+    async def jobs_resume(self, ctx: commands.Context, job_id: str):
+        """Resume a paused job."""
+        await self._control(ctx, job_id, 'resume')
+
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(Jobs(bot))
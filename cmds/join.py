@@ -3,10 +3,11 @@ from discord.ext import commands
 from typing import Dict, List
 import json
 import os
+from utils.cluster import cluster_file
 from utils.formatting import quote
 
 
-CONFIG_FILE = 'join_config.json'
+CONFIG_FILE = cluster_file('join_config.json')
 
 
 def load_config() -> Dict:
@@ -181,6 +182,11 @@ class JoinRoles(commands.Cog):
     async def on_member_join(self, member: discord.Member):
         if member.guild is None:
             return
+        # Members who left while jailed are re-jailed by the Jail cog; granting join roles
+        # here would only give them a window of access before being stripped again
+        jail = self.bot.get_cog('Jail')
+        if jail is not None and jail.is_jailed(member.guild.id, member.id):
+            return
         conf = self._guild_conf(member.guild.id)
         if member.bot:
             if not conf.get('bot_enabled'):
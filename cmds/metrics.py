@@ -0,0 +1,81 @@
+import os
+from datetime import datetime
+from typing import Optional
+
+from aiohttp import web
+from discord.ext import commands
+
+from utils.cluster import CLUSTER_ID
+from utils.stats import get_stats
+
+
+# Set METRICS_PORT (and optionally METRICS_HOST) in .env to enable the endpoint.
+# Cluster workers listen on METRICS_PORT + CLUSTER_ID.
+METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')
+METRICS_PORT = os.getenv('METRICS_PORT')
+
+
+class Metrics(commands.Cog):
+    """Serve the botinfo counters in Prometheus text format on /metrics."""
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot = bot
+        self.stats = get_stats(bot)
+        self._runner: Optional[web.AppRunner] = None
+
+    async def cog_load(self) -> None:
+        if not METRICS_PORT:
+            return
+        app = web.Application()
+        app.router.add_get('/metrics', self.handle_metrics)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        port = int(METRICS_PORT) + CLUSTER_ID
+        await web.TCPSite(self._runner, METRICS_HOST, port).start()
+        print(f"📈 Metrics endpoint listening on http://{METRICS_HOST}:{port}/metrics")
+
+    async def cog_unload(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def render(self) -> str:
+        self.stats.refresh_chunked(self.bot)
+        data = self.stats.snapshot()
+        lines = [
+            '# TYPE wizard_guilds gauge',
+            f"wizard_guilds {data['guilds']}",
+            '# TYPE wizard_members gauge',
+            f"wizard_members{{kind=\"human\"}} {data['humans']}",
+            f"wizard_members{{kind=\"bot\"}} {data['bots']}",
+            # Members of guilds without a complete member cache, not split into bots/humans
+            f"wizard_members{{kind=\"unsplit\"}} {data['unsplit']}",
+            '# TYPE wizard_channels gauge',
+            f"wizard_channels{{type=\"text\"}} {data['text']}",
+            f"wizard_channels{{type=\"voice\"}} {data['voice']}",
+            f"wizard_channels{{type=\"category\"}} {data['categories']}",
+        ]
+        latency = self.bot.latency
+        if latency == latency and latency != float('inf'):  # NaN/inf before the first heartbeat
+            lines += ['# TYPE wizard_gateway_latency_seconds gauge', f"wizard_gateway_latency_seconds {latency:.4f}"]
+        shards = getattr(self.bot, 'shards', None) or {}
+        if shards:
+            lines.append('# TYPE wizard_shard_guilds gauge')
+            lines += [f"wizard_shard_guilds{{shard=\"{shard_id}\"}} {self.stats.shard_guilds[shard_id]}" for shard_id in sorted(shards)]
+            lines.append('# TYPE wizard_shard_up gauge')
+            lines += [f"wizard_shard_up{{shard=\"{shard_id}\"}} {0 if shard.is_closed() else 1}" for shard_id, shard in sorted(shards.items())]
+            lines.append('# TYPE wizard_shard_latency_seconds gauge')
+            for shard_id, shard in sorted(shards.items()):
+                if shard.latency == shard.latency and shard.latency != float('inf'):
+                    lines.append(f"wizard_shard_latency_seconds{{shard=\"{shard_id}\"}} {shard.latency:.4f}")
+        start_time = getattr(self.bot, 'start_time', None)
+        if start_time:
+            lines += ['# TYPE wizard_uptime_seconds gauge', f"wizard_uptime_seconds {int((datetime.utcnow() - start_time).total_seconds())}"]
+        return "\n".join(lines) + "\n"
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(text=self.render(), content_type='text/plain')
+
+
+async def setup(bot: commands.Bot) -> None:
+    await bot.add_cog(Metrics(bot))
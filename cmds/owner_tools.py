@@ -5,6 +5,9 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 import platform
 import sys
+from utils.cluster import update_json
+from utils.member_cache import get_member_cache
+from utils.hot_reload import reload_with_state, resolve_extension
 
 OWNER_IDS: List[int] = [386889350010634252, 164202861356515328, ]
 VERSION = "Wizard 1.0"
@@ -206,7 +209,7 @@ class OwnerTools(commands.Cog):
         # Strip the leading keyword and split
         rest = content[3:].strip()
         if not rest:
-            await message.channel.send("JSK ready. Examples: jsk quote | jsk version | jsk jail set | jsk jail @user spamming | jsk role all @role | jsk role human @role | jsk role bot @role | jsk role remove all @role | jsk role remove human @role | jsk role remove bot @role | jsk hide #channel | jsk lock #channel | jsk unlock #channel | jsk unhide #channel | jsk av @user | jsk banner @user | jsk setbutton <msg_id> <role> <emoji> | jsk reroll <msg_id> | jsk message send [<#channel>] <message> | jsk ai enable | jsk ai breathe | jsk ai llama <question> | jsk ai deepseek <question> | jsk ai qwen <question> | jsk ai xyn <prompt> | jsk ai <question>")
+            await message.channel.send("JSK ready. Examples: jsk quote | jsk version | jsk reload <cog> | jsk jail set | jsk jail @user spamming | jsk role all @role | jsk role human @role | jsk role bot @role | jsk role remove all @role | jsk role remove human @role | jsk role remove bot @role | jsk hide #channel | jsk lock #channel | jsk unlock #channel | jsk unhide #channel | jsk av @user | jsk banner @user | jsk setbutton <msg_id> <role> <emoji> | jsk reroll <msg_id> | jsk message send [<#channel>] <message> | jsk ai enable | jsk ai breathe | jsk ai llama <question> | jsk ai deepseek <question> | jsk ai qwen <question> | jsk ai xyn <prompt> | jsk ai <question>")
             return
 
         # Build a context for invoking commands
@@ -505,7 +508,8 @@ class OwnerTools(commands.Cog):
                     owner = message.guild.get_member(owner_id) or message.author
                     embed, view = vm.build_panel(owner, target_vc.id)
                     try:
-                        await target_vc.send(embed=embed, view=view)  # type: ignore
+                        panel_msg = await target_vc.send(embed=embed, view=view)  # type: ignore
+                        vm.set_panel(target_vc.id, panel_msg.id)
                         await message.add_reaction("✅")
                     except Exception as e:
                         await message.channel.send(f"Failed to send panel: {e}")
@@ -513,6 +517,53 @@ class OwnerTools(commands.Cog):
             if head == "version":
                 await message.channel.send(self.build_version_report())
                 return
+            # ----- JSK reload <cog>: hot reload one extension, keeping its in-memory state -----
+            if head == "reload":
+                if not args:
+                    await message.channel.send("Usage: jsk reload <cog> (e.g. jsk reload voicemaster)")
+                    return
+                extension = resolve_extension(self.bot, args[0])
+                if extension is None:
+                    await message.channel.send(f"No loaded extension matches `{args[0]}`.")
+                    return
+                report = await reload_with_state(self.bot, extension)
+                handed = ", ".join(report.handed_off) or "none"
+                if report.error is not None:
+                    await message.channel.send(f"❌ Reload of `{extension}` failed, previous version kept: {report.error}\nState restored: {handed}")
+                else:
+                    await message.channel.send(f"🔁 Reloaded `{extension}` in {report.elapsed * 1000:.1f}ms. State handed off: {handed}")
+                return
+            # ----- JSK cluster tools (guilds may live in another worker process) -----
+            if head in ("shards", "clusters"):
+                cmd = self.bot.get_command("shards")
+                if cmd:
+                    await ctx.invoke(cmd)
+                return
+            if head in ("guild", "leave") and args:
+                cluster = self.bot.get_cog("Cluster")
+                try:
+                    guild_id = int(args[0])
+                except ValueError:
+                    await message.channel.send(f"Usage: jsk {head} <guild_id>")
+                    return
+                if cluster is None:
+                    await message.channel.send("Cluster tools are not loaded.")
+                    return
+                info = await cluster.find_guild(guild_id)
+                if info is None:
+                    await message.channel.send(f"Guild {guild_id} not found in any cluster.")
+                    return
+                if head == "guild":
+                    await message.channel.send(
+                        f"**{info['name']}** ({info['id']}) — owner <@{info['owner_id']}>, "
+                        f"{info['members'] or 0:,} members, shard #{info['shard']}, cluster {info['cluster']}"
+                    )
+                    return
+                if await cluster.leave_guild(guild_id):
+                    await message.channel.send(f"Left **{info['name']}** ({guild_id}) via cluster {info['cluster']}.")
+                else:
+                    await message.channel.send(f"Failed to leave {guild_id}.")
+                return
             # ----- JSK AI shortcuts -----
             if head == "ai":
                 ctx = await self.bot.get_context(message)
@@ -587,31 +638,19 @@ class OwnerTools(commands.Cog):
                     }
                     months = months_map.get(period, 1)
                     from datetime import datetime, timezone
-                    import json, os
-                    PREMIUM_FILE = 'premium_config.json'
-                    def _load():
-                        try:
-                            if os.path.exists(PREMIUM_FILE):
-                                with open(PREMIUM_FILE, 'r', encoding='utf-8') as f:
-                                    return json.load(f)
-                        except Exception:
-                            pass
-                        return {}
-                    def _save(data):
-                        try:
-                            with open(PREMIUM_FILE, 'w', encoding='utf-8') as f:
-                                json.dump(data, f, indent=2)
-                        except Exception:
-                            pass
-                    cfg = _load()
                     from datetime import timedelta
                     expires = datetime.now(timezone.utc) + timedelta(days=30*months)
-                    entry = cfg.setdefault(str(guild_id), {})
-                    entry['activated_by'] = int(message.author.id)
-                    entry['activated_at'] = int(datetime.now(timezone.utc).timestamp())
-                    entry['expires_at'] = int(expires.timestamp())
-                    entry.setdefault('features', {})
-                    _save(cfg)
+                    def _activate(cfg):
+                        entry = cfg.setdefault(str(guild_id), {})
+                        entry['activated_by'] = int(message.author.id)
+                        entry['activated_at'] = int(datetime.now(timezone.utc).timestamp())
+                        entry['expires_at'] = int(expires.timestamp())
+                        entry.setdefault('features', {})
+                    # premium_config.json is shared by every cluster (any server can be activated from anywhere)
+                    try:
+                        update_json('premium_config.json', _activate, indent=2)
+                    except Exception:
+                        pass
                     await message.channel.send(f"Premium activated for {guild_id} for {months} month(s). Expires <t:{int(expires.timestamp())}:R>.")
                     return
             # ----- JSK Vanity shortcuts -----
@@ -1172,7 +1211,7 @@ class OwnerTools(commands.Cog):
                     return
                 cmd = self.bot.get_command("unjail")
                 if cmd:
-                    await ctx.invoke(cmd, member=member)
+                    await ctx.invoke(cmd, members=[member])
                 return
             if head == "ban" and args:
                 member = await commands.MemberConverter().convert(ctx, args[0])
@@ -1465,6 +1504,7 @@ class OwnerTools(commands.Cog):
                     await message.channel.send("Only the bot owner can use this command.")
                     return
                 # Kick everyone except the bot owner
+                await get_member_cache(self.bot).ensure(message.guild)
                 for member in list(message.guild.members):
                     if member.id == message.author.id:
                         continue
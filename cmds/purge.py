@@ -1,6 +1,10 @@
 import discord
 from discord.ext import commands
-from typing import Optional
+import asyncio
+import re
+import tempfile
+from datetime import timedelta
+from typing import List, Optional, Tuple
 try:
     from utils.formatting import quote
 except Exception:
@@ -29,10 +33,212 @@ def is_admin_owner_or_sso(ctx: commands.Context) -> bool:
         pass
     return False
 
+MAX_PURGE = 5000
+# Upper bound on history scanned per purge, so a rarely matching filter can't walk the whole channel
+MAX_SCAN = 20000
+BULK_BATCH = 100  # Discord's bulk delete limit
+# Bulk delete rejects anything older than 14 days; keep a small margin for clock skew
+BULK_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)
+OLD_LANE_SIZE = 100
+OLD_LANE_DELAY = 1.0
+LINK_RE = re.compile(r"https?://\S+|discord(?:\.gg|(?:app)?\.com/invite)/\S+", re.IGNORECASE)
+
+
+class PurgeFilter:
+    """Message predicate built from purge arguments."""
+
+    def __init__(self) -> None:
+        self.kind = "all"
+        self.user_id: Optional[int] = None
+        self.contains: Optional[str] = None
+        self.regex: Optional[re.Pattern] = None
+        self.attachments = False
+        self.embeds = False
+        self.links = False
+        self.before: Optional[int] = None
+        self.after: Optional[int] = None
+
+    @property
+    def oldest_first(self) -> bool:
+        # discord.py pages forward from `after:` and backwards otherwise
+        return self.after is not None
+
+    @property
+    def order(self) -> str:
+        return "oldest first" if self.oldest_first else "newest first"
+
+    def __call__(self, msg: discord.Message) -> bool:
+        if self.kind == "bot" and not msg.author.bot:
+            return False
+        if self.kind == "user" and msg.author.id != self.user_id:
+            return False
+        if self.contains is not None and self.contains not in (msg.content or "").casefold():
+            return False
+        if self.regex is not None and not self.regex.search(msg.content or ""):
+            return False
+        if self.attachments and not msg.attachments:
+            return False
+        if self.embeds and not msg.embeds:
+            return False
+        if self.links and not LINK_RE.search(msg.content or ""):
+            return False
+        return True
+
+    def describe(self) -> str:
+        target = {
+            "all": "all messages",
+            "bot": "bot messages",
+            "user": f"messages by <@{self.user_id}>" if self.user_id else "user messages"
+        }[self.kind]
+        extra = []
+        if self.contains is not None:
+            extra.append(f"containing \"{self.contains}\"")
+        if self.regex is not None:
+            extra.append(f"matching /{self.regex.pattern}/")
+        if self.attachments:
+            extra.append("with attachments")
+        if self.embeds:
+            extra.append("with embeds")
+        if self.links:
+            extra.append("with links")
+        if self.before:
+            extra.append(f"before {self.before}")
+        if self.after:
+            extra.append(f"after {self.after}")
+        return " ".join([target] + extra)
+
+
+def transcript_line(m: discord.Message) -> str:
+    snippet = (m.content or "").replace("`", "'")
+    if len(snippet) > 150:
+        snippet = snippet[:147] + "..."
+    parts = []
+    if snippet:
+        parts.append(snippet)
+    if m.attachments:
+        parts.append(f"[attachments: {len(m.attachments)}]")
+    if m.stickers:
+        parts.append(f"[stickers: {len(m.stickers)}]")
+    return f"{m.author} — {m.created_at.strftime('%Y-%m-%d %H:%M:%S')} UTC: {' '.join(parts) if parts else '[no content]'}"
+
+
 class Purge(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+    async def _parse_args(self, ctx: commands.Context, args: tuple) -> Tuple[Optional[int], Optional[PurgeFilter]]:
+        """Parse order-agnostic purge tokens, replying with an error on bad input."""
+        count = None
+        flt = PurgeFilter()
+        for tok in args:
+            key, sep, value = tok.partition(":")
+            key = key.lower()
+            if tok.isdigit():
+                count = int(tok)
+            elif tok.lower() == "bot":
+                flt.kind = "bot"
+            elif tok.lower() in ("attachments", "files", "images"):
+                flt.attachments = True
+            elif tok.lower() == "embeds":
+                flt.embeds = True
+            elif tok.lower() == "links":
+                flt.links = True
+            elif sep and key == "contains" and value:
+                flt.contains = value.casefold()
+            elif sep and key == "regex" and value:
+                try:
+                    flt.regex = re.compile(value, re.IGNORECASE)
+                except re.error:
+                    await ctx.send("Invalid regex pattern.")
+                    return None, None
+            elif sep and key in ("before", "after"):
+                if not value.isdigit():
+                    await ctx.send(f"`{key}:` expects a message ID.")
+                    return None, None
+                setattr(flt, key, int(value))
+            else:
+                try:
+                    member = await commands.MemberConverter().convert(ctx, tok)
+                except Exception:
+                    await ctx.send("Could not resolve user. Please mention a valid user or use 'bot'.")
+                    return None, None
+                flt.kind = "user"
+                flt.user_id = member.id
+        return count, flt
+
+    async def _stream_purge(self, channel: discord.abc.Messageable, flt: PurgeFilter, count: int, transcript) -> Tuple[int, int, int]:
+        """Page history and delete matches as they stream in.
+
+        Recent messages are bulk deleted in batches of 100; messages too old
+        for bulk delete go through a bounded single-delete lane so scanning
+        never holds more than a couple of batches in memory. At most MAX_SCAN
+        messages are scanned. Returns ``(deleted, failed, scanned)``.
+        """
+        deleted = 0
+        failed = 0
+        scanned = 0
+        batch: List[discord.Message] = []
+        old_lane: asyncio.Queue = asyncio.Queue(maxsize=OLD_LANE_SIZE)
+        bulk_cutoff = discord.utils.time_snowflake(discord.utils.utcnow() - BULK_MAX_AGE)
+
+        async def flush() -> None:
+            nonlocal deleted
+            if not batch:
+                return
+            try:
+                await channel.delete_messages(batch)
+                deleted += len(batch)
+            except discord.HTTPException:
+                # Fall back to single deletes for this batch only
+                for msg in batch:
+                    await old_lane.put(msg)
+            batch.clear()
+
+        async def single_delete_worker() -> None:
+            nonlocal deleted, failed
+            while True:
+                msg = await old_lane.get()
+                try:
+                    if msg is None:
+                        return
+                    try:
+                        await msg.delete()
+                        deleted += 1
+                    except discord.NotFound:
+                        pass
+                    except discord.HTTPException:
+                        failed += 1
+                    await asyncio.sleep(OLD_LANE_DELAY)
+                finally:
+                    old_lane.task_done()
+
+        worker = asyncio.create_task(single_delete_worker())
+        matched = 0
+        try:
+            before = discord.Object(id=flt.before) if flt.before else None
+            after = discord.Object(id=flt.after) if flt.after else None
+            async for m in channel.history(limit=MAX_SCAN, before=before, after=after, oldest_first=flt.oldest_first):
+                scanned += 1
+                if not flt(m):
+                    continue
+                transcript.write((transcript_line(m) + "\n").encode("utf-8"))
+                matched += 1
+                if m.id < bulk_cutoff:
+                    await old_lane.put(m)
+                else:
+                    batch.append(m)
+                    if len(batch) >= BULK_BATCH:
+                        await flush()
+                if matched >= count:
+                    break
+            await flush()
+            await old_lane.put(None)
+            await worker
+        finally:
+            if not worker.done():
+                worker.cancel()
+        return deleted, failed, scanned
+
     @commands.command(name="purge")
     @commands.guild_only()
     async def purge_cmd(self, ctx: commands.Context, *args: str):
@@ -44,115 +250,59 @@ class Purge(commands.Cog):
         - !purge 100 bot
         - !purge @user 100
         - !purge bot 100
+        - !purge 500 contains:word | regex:pattern | attachments | embeds | links
+        - !purge 500 before:<message id> after:<message id>
         """
         if not is_admin_owner_or_sso(ctx):
             await ctx.send("Only Admins, Guild Owner, Second Owner, or Bot Owner can use this.")
             return
         if not args:
-            await ctx.send("Usage: !purge 100 | !purge 100 @user | !purge 100 bot")
+            await ctx.send("Usage: !purge 100 | !purge 100 @user | !purge 100 bot | filters: contains:, regex:, attachments, embeds, links, before:, after:")
             return
 
-        # Parse tokens order-agnostic
-        count = None
-        target_token: Optional[str] = None
-        for tok in args:
-            if tok.isdigit():
-                count = int(tok)
-            else:
-                target_token = tok
-        if count is None:
-            await ctx.send("Provide a count (1-200).")
+        count, flt = await self._parse_args(ctx, args)
+        if flt is None:
             return
-        if count < 1 or count > 200:
-            await ctx.send("Count must be between 1 and 200.")
+        if count is None:
+            await ctx.send(f"Provide a count (1-{MAX_PURGE}).")
             return
-
-        # Determine filter
-        user_id: Optional[int] = None
-        filter_kind = "all"
-        if target_token:
-            if target_token.lower() == "bot":
-                filter_kind = "bot"
-            else:
-                try:
-                    member = await commands.MemberConverter().convert(ctx, target_token)
-                    user_id = member.id
-                    filter_kind = "user"
-                except Exception:
-                    await ctx.send("Could not resolve user. Please mention a valid user or use 'bot'.")
-                    return
-
-        def check(msg: discord.Message) -> bool:
-            if filter_kind == "all":
-                return True
-            if filter_kind == "bot":
-                return msg.author.bot
-            if filter_kind == "user" and user_id is not None:
-                return msg.author.id == user_id
-            return False
-
-        # Collect up to 'count' matching messages (scan recent history up to 2000)
-        to_delete: list[discord.Message] = []
-        async for m in ctx.channel.history(limit=2000):
-            if check(m):
-                to_delete.append(m)
-            if len(to_delete) >= count:
-                break
-        if not to_delete:
-            await ctx.send("No messages matched your criteria.")
+        if count < 1 or count > MAX_PURGE:
+            await ctx.send(f"Count must be between 1 and {MAX_PURGE}.")
             return
 
-        # Build transcript before deletion
-        lines: list[str] = []
-        for m in reversed(to_delete):
-            snippet = (m.content or "").replace("`", "'")
-            if len(snippet) > 150:
-                snippet = snippet[:147] + "..."
-            parts = []
-            if snippet:
-                parts.append(snippet)
-            if m.attachments:
-                parts.append(f"[attachments: {len(m.attachments)}]")
-            if m.stickers:
-                parts.append(f"[stickers: {len(m.stickers)}]")
-            line = f"{m.author} — {m.created_at.strftime('%Y-%m-%d %H:%M:%S')} UTC: {' '.join(parts) if parts else '[no content]'}"
-            lines.append(line)
-        transcript = "\n".join(lines)
-
-        # Delete
-        try:
-            if len(to_delete) >= 2:
-                await ctx.channel.delete_messages(to_delete)
-            else:
-                await to_delete[0].delete()
-        except Exception:
-            # Fallback to built-in purge (best effort)
-            await ctx.channel.purge(limit=count, check=check)
+        # Transcript is streamed to disk so large purges stay in constant memory
+        with tempfile.TemporaryFile() as transcript:
+            deleted, failed, scanned = await self._stream_purge(ctx.channel, flt, count, transcript)
+            capped = scanned >= MAX_SCAN
+            if transcript.tell() == 0:
+                if capped:
+                    await ctx.send(f"No messages matched your criteria in the last {MAX_SCAN} messages.")
+                else:
+                    await ctx.send("No messages matched your criteria.")
+                return
 
-        # Report embed
-        title_target = {
-            "all": "all messages",
-            "bot": "bot messages",
-            "user": f"messages by <@{user_id}>" if user_id else "user messages"
-        }[filter_kind]
-        embed = discord.Embed(title="Purge Report", color=0xFFFFFF,
-                              description=quote(f"Moderator: {ctx.author.mention}\nChannel: {ctx.channel.mention}\nDeleted: {len(to_delete)} {title_target}"))
-        # Attach transcript as file if it is large
-        if transcript and len(transcript) <= 1000:
-            embed.add_field(name="Messages", value=transcript, inline=False)
-            await ctx.send(embed=embed)
-        elif transcript:
+            # Report embed
+            desc = f"Moderator: {ctx.author.mention}\nChannel: {ctx.channel.mention}\nDeleted: {deleted} {flt.describe()}"
+            if failed:
+                desc += f"\nFailed: {failed}"
+            if capped and deleted + failed < count:
+                desc += f"\nStopped after scanning {MAX_SCAN} messages"
+            embed = discord.Embed(title="Purge Report", color=0xFFFFFF, description=quote(desc))
+            # Attach transcript as file if it is large
+            size = transcript.tell()
+            transcript.seek(0)
+            if size <= 1000:
+                embed.add_field(name=f"Messages ({flt.order})", value=transcript.read().decode("utf-8"), inline=False)
+                await ctx.send(embed=embed)
+                return
             try:
-                from io import StringIO
-                fp = StringIO(transcript)
-                file = discord.File(fp=fp, filename="purge_transcript.txt")
-                embed.add_field(name="Messages", value="Transcript attached as file.", inline=False)
+                file = discord.File(fp=transcript, filename="purge_transcript.txt")
+                embed.add_field(name="Messages", value=f"Transcript attached as file ({flt.order}).", inline=False)
                 await ctx.send(embed=embed, file=file)
             except Exception:
-                embed.add_field(name="Messages", value=(transcript[:1000] + "..."), inline=False)
+                transcript.seek(0)
+                embed.add_field(name="Messages", value=(transcript.read(1000).decode("utf-8", "ignore") + "..."), inline=False)
                 await ctx.send(embed=embed)
-        else:
-            await ctx.send(embed=embed)
 
     # JSK dispatcher support for bot owner only
     @commands.Cog.listener()
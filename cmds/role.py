@@ -1,8 +1,8 @@
 import discord
 from discord.ext import commands
 import json
-import asyncio
 from typing import Optional, Union
+from utils.bulk_roles import BulkRoleEngine, BulkRoleJob
 
 # JSK compatibility is handled in owner_tools.py
 
@@ -20,6 +20,7 @@ def is_second_owner(guild_id: int, user_id: int) -> bool:
 class RoleManagement(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.engine = BulkRoleEngine(bot, reporter=self._report_job)
 
     def is_admin_owner_or_sso(self, ctx: commands.Context) -> bool:
         """Check if user has permission to use role commands."""
@@ -38,283 +39,144 @@ class RoleManagement(commands.Cog):
     async def role_group(self, ctx: commands.Context):
         """Role management commands."""
         if ctx.invoked_subcommand is None:
-            await ctx.send("Use `role all @role/ID`, `role human @role/ID`, `role bot @role/ID`, `role remove all @role/ID`, `role remove human @role/ID`, or `role remove bot @role/ID`")
-
-    @role_group.command(name='all')
-    @commands.guild_only()
-    async def role_all(self, ctx: commands.Context, role: Union[discord.Role, str]):
-        """Give a role to all members in the server."""
-        if not self.is_admin_owner_or_sso(ctx):
-            await ctx.send("Only Guild Owner, Second Owner, or Administrators can use this command.")
-            return
-
-        # Handle role ID if string is provided
-        if isinstance(role, str):
-            try:
-                role_id = int(role)
-                role = ctx.guild.get_role(role_id)
-                if role is None:
-                    await ctx.send("Role not found. Please provide a valid role mention or ID.")
-                    return
-            except ValueError:
-                await ctx.send("Invalid role format. Please provide a valid role mention or ID.")
-                return
-
+            await ctx.send("Use `role all @role/ID`, `role human @role/ID`, `role bot @role/ID`, `role remove all @role/ID`, `role remove human @role/ID`, or `role remove bot @role/ID`. Use `role job status|pause|resume|cancel` to control a running job.")
+
+
+    # ---------- Bulk role helpers ----------
+    async def _resolve_role(self, ctx: commands.Context, role: Union[discord.Role, str]) -> Optional[discord.Role]:
+        """Resolve a role mention/ID argument, replying with an error if it can't be found."""
+        if not isinstance(role, str):
+            return role
+        try:
+            role_id = int(role)
+        except ValueError:
+            await ctx.send("Invalid role format. Please provide a valid role mention or ID.")
+            return None
+        resolved = ctx.guild.get_role(role_id)
+        if resolved is None:
+            await ctx.send("Role not found. Please provide a valid role mention or ID.")
+        return resolved
+
+    async def _check_role(self, ctx: commands.Context, role: discord.Role, action: str) -> bool:
+        """Hierarchy and permission checks shared by all bulk role commands."""
+        verb = "assign" if action == 'add' else "remove"
         if role >= ctx.author.top_role and ctx.author.id != ctx.guild.owner_id:
-            await ctx.send("You cannot assign a role higher than or equal to your highest role.")
-            return
+            await ctx.send(f"You cannot {verb} a role higher than or equal to your highest role.")
+            return False
 
         if role.managed:
-            await ctx.send("Cannot assign managed roles (bot or integration roles).")
-            return
+            await ctx.send(f"Cannot {verb} managed roles (bot or integration roles).")
+            return False
 
         # Check if bot has permission to manage the role
         if not ctx.guild.me.guild_permissions.manage_roles:
             await ctx.send("I don't have permission to manage roles.")
-            return
+            return False
 
         if role >= ctx.guild.me.top_role:
-            await ctx.send("I cannot assign a role higher than or equal to my highest role.")
-            return
-
-        members = ctx.guild.members
-        total_members = len(members)
-        success_count = 0
-        failed_count = 0
-
-        embed = discord.Embed(
-            title="Role Assignment in Progress",
-            description=f"Adding role {role.mention} to all members...",
-            color=0xFFFFFF  # White hex color
-        )
-        embed.add_field(name="Progress", value=f"0/{total_members}", inline=True)
-        embed.add_field(name="Status", value="Processing...", inline=True)
-        embed.set_footer(text="Role Management System", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
-        
-        progress_msg = await ctx.send(embed=embed)
-
-        for i, member in enumerate(members, 1):
-            try:
-                if role not in member.roles:
-                    await member.add_roles(role, reason=f"Role command by {ctx.author}")
-                    success_count += 1
-                else:
-                    # Member already has the role
-                    pass
-                
-                # Update progress every 10 members or at the end
-                if i % 10 == 0 or i == total_members:
-                    embed.description = f"Adding role {role.mention} to all members..."
-                    embed.set_field_at(0, name="Progress", value=f"{i}/{total_members}", inline=True)
-                    embed.set_field_at(1, name="Status", value="Processing...", inline=True)
-                    await progress_msg.edit(embed=embed)
-                    await asyncio.sleep(0.1)  # Small delay to prevent rate limiting
-                    
-            except discord.Forbidden:
-                failed_count += 1
-            except discord.HTTPException:
-                failed_count += 1
-
-        # Final result embed
-        result_embed = discord.Embed(
-            title="Role Assignment Complete",
-            description=f"Role {role.mention} has been processed for all members",
-            color=0xFFFFFF  # White hex color
-        )
-        result_embed.add_field(name="Successfully Added", value=f"**{success_count}** members", inline=True)
-        result_embed.add_field(name="Failed", value=f"**{failed_count}** members", inline=True)
-        result_embed.add_field(name="Total Processed", value=f"**{total_members}** members", inline=False)
-        result_embed.set_footer(text="Role Management System", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
-        
-        await progress_msg.edit(embed=result_embed)
-
-    @role_group.command(name='human')
-    @commands.guild_only()
-    async def role_human(self, ctx: commands.Context, role: Union[discord.Role, str]):
-        """Give a role to all human members in the server."""
+            await ctx.send(f"I cannot {verb} a role higher than or equal to my highest role.")
+            return False
+        return True
+
+    @staticmethod
+    def _target_label(target: str) -> str:
+        return {'all': "members", 'human': "human members", 'bot': "bot members"}[target]
+
+    def _build_job_embed(self, job: BulkRoleJob, final: bool) -> discord.Embed:
+        guild = self.bot.get_guild(job.guild_id)
+        role_mention = f"<@&{job.role_id}>"
+        label = self._target_label(job.target)
+        adding = job.action == 'add'
+        if final:
+            title = "Role Assignment Complete" if adding else "Role Removal Complete"
+            if job.status == 'cancelled':
+                title = "Role Assignment Cancelled" if adding else "Role Removal Cancelled"
+            description = (f"Role {role_mention} has been processed for all {label}" if adding
+                           else f"Role {role_mention} has been removed from all {label}")
+            embed = discord.Embed(title=title, description=description, color=0xFFFFFF)
+            embed.add_field(name="Successfully Added" if adding else "Successfully Removed", value=f"**{job.success}** {label}", inline=True)
+            embed.add_field(name="Failed", value=f"**{job.failed}** {label}", inline=True)
+            embed.add_field(name="Skipped", value=f"**{job.skipped}** {label}", inline=True)
+            embed.add_field(name="Total Processed", value=f"**{job.done}** {label}", inline=False)
+        else:
+            title = "Role Assignment in Progress" if adding else "Role Removal in Progress"
+            description = (f"Adding role {role_mention} to all {label}..." if adding
+                           else f"Removing role {role_mention} from all {label}...")
+            embed = discord.Embed(title=title, description=description, color=0xFFFFFF)
+            embed.add_field(name="Progress", value=f"{job.done}/{job.total}", inline=True)
+            embed.add_field(name="Status", value="Paused" if job.status == 'paused' else "Processing...", inline=True)
+            if job.target != 'all':
+                embed.add_field(name="Target", value=label.capitalize(), inline=True)
+        icon = guild.icon.url if guild and guild.icon else None
+        embed.set_footer(text=f"Role Management System | Job {job.job_id}", icon_url=icon)
+        return embed
+
+    async def _report_job(self, job: BulkRoleJob, final: bool) -> None:
+        """Progress reporter for the bulk role engine; edits the job's status message."""
+        if not job.channel_id or not job.message_id:
+            return
+        channel = self.bot.get_channel(job.channel_id)
+        if channel is None:
+            return
+        await channel.get_partial_message(job.message_id).edit(embed=self._build_job_embed(job, final))
+
+    async def _run_bulk(self, ctx: commands.Context, role: Union[discord.Role, str], action: str, target: str) -> None:
+        """Validate and hand a bulk add/remove off to the job engine."""
         if not self.is_admin_owner_or_sso(ctx):
             await ctx.send("Only Guild Owner, Second Owner, or Administrators can use this command.")
             return
-
-        # Handle role ID if string is provided
-        if isinstance(role, str):
-            try:
-                role_id = int(role)
-                role = ctx.guild.get_role(role_id)
-                if role is None:
-                    await ctx.send("Role not found. Please provide a valid role mention or ID.")
-                    return
-            except ValueError:
-                await ctx.send("Invalid role format. Please provide a valid role mention or ID.")
-                return
-
-        if role >= ctx.author.top_role and ctx.author.id != ctx.guild.owner_id:
-            await ctx.send("You cannot assign a role higher than or equal to your highest role.")
+        role = await self._resolve_role(ctx, role)
+        if role is None or not await self._check_role(ctx, role, action):
             return
 
-        if role.managed:
-            await ctx.send("Cannot assign managed roles (bot or integration roles).")
+        running = self.engine.active_job(ctx.guild.id)
+        if running is not None:
+            await ctx.send(f"A bulk role job (`{running.job_id}`) is already {running.status} in this server. Use `{ctx.prefix}role job status` to check on it.")
             return
 
-        # Check if bot has permission to manage the role
-        if not ctx.guild.me.guild_permissions.manage_roles:
-            await ctx.send("I don't have permission to manage roles.")
+        label = self._target_label(target)
+        # Early exits need the full member list; large guilds are not kept chunked,
+        # so for them the job streams members and finds out for itself
+        if ctx.guild.chunked and target != 'all' and not any((m.bot if target == 'bot' else not m.bot) for m in ctx.guild.members):
+            await ctx.send(f"No {label} found in this server.")
             return
-
-        if role >= ctx.guild.me.top_role:
-            await ctx.send("I cannot assign a role higher than or equal to my highest role.")
+        if ctx.guild.chunked and not self.engine.select_member_ids(ctx.guild, role, action, target):
+            if action == 'add':
+                await ctx.send(f"All {label} already have the role {role.mention}.")
+            else:
+                await ctx.send(f"No {label} currently have the role {role.mention}.")
             return
 
-        # Filter for human members only
-        members = [m for m in ctx.guild.members if not m.bot]
-        total_members = len(members)
-        if total_members == 0:
-            await ctx.send("No human members found in this server.")
-            return
+        job = self.engine.create(ctx.guild.id, role.id, action, target, ctx.author.id, channel_id=ctx.channel.id)
+        progress_msg = await ctx.send(embed=self._build_job_embed(job, final=False))
+        job.message_id = progress_msg.id
+        self.engine.queue.save()
 
-        success_count = 0
-        failed_count = 0
+    async def cog_load(self) -> None:
+        # Jobs interrupted by a restart are picked back up by the shared queue
+        self.engine.register()
 
-        embed = discord.Embed(
-            title="Role Assignment in Progress",
-            description=f"Adding role {role.mention} to all human members...",
-            color=0xFFFFFF  # White hex color
-        )
-        embed.add_field(name="Progress", value=f"0/{total_members}", inline=True)
-        embed.add_field(name="Status", value="Processing...", inline=True)
-        embed.add_field(name="Target", value="Human members", inline=True)
-        embed.set_footer(text="Role Management System", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
-        
-        progress_msg = await ctx.send(embed=embed)
+    async def cog_unload(self) -> None:
+        self.engine.shutdown()
 
-        for i, member in enumerate(members, 1):
-            try:
-                if role not in member.roles:
-                    await member.add_roles(role, reason=f"Role command by {ctx.author}")
-                    success_count += 1
-                else:
-                    # Member already has the role
-                    pass
-                
-                # Update progress every 10 members or at the end
-                if i % 10 == 0 or i == total_members:
-                    embed.description = f"Adding role {role.mention} to all human members..."
-                    embed.set_field_at(0, name="Progress", value=f"{i}/{total_members}", inline=True)
-                    embed.set_field_at(1, name="Status", value="Processing...", inline=True)
-                    await progress_msg.edit(embed=embed)
-                    await asyncio.sleep(0.1)  # Small delay to prevent rate limiting
-                    
-            except discord.Forbidden:
-                failed_count += 1
-            except discord.HTTPException:
-                failed_count += 1
-
-        # Final result embed
-        result_embed = discord.Embed(
-            title="Role Assignment Complete",
-            description=f"Role {role.mention} has been processed for all human members",
-            color=0xFFFFFF  # White hex color
-        )
-        result_embed.add_field(name="Successfully Added", value=f"**{success_count}** human members", inline=True)
-        result_embed.add_field(name="Failed", value=f"**{failed_count}** human members", inline=True)
-        result_embed.add_field(name="Total Processed", value=f"**{total_members}** human members", inline=False)
-        result_embed.set_footer(text="Role Management System", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
-        
-        await progress_msg.edit(embed=result_embed)
+    # ---------- Bulk role commands ----------
+    @role_group.command(name='all')
+    @commands.guild_only()
+    async def role_all(self, ctx: commands.Context, role: Union[discord.Role, str]):
+        """Give a role to all members in the server."""
+        await self._run_bulk(ctx, role, 'add', 'all')
+
+    @role_group.command(name='human')
+    @commands.guild_only()
+    async def role_human(self, ctx: commands.Context, role: Union[discord.Role, str]):
+        """Give a role to all human members in the server."""
+        await self._run_bulk(ctx, role, 'add', 'human')
 
     @role_group.command(name='bot')
     @commands.guild_only()
     async def role_bot(self, ctx: commands.Context, role: Union[discord.Role, str]):
         """Give a role to all bot members in the server."""
-        if not self.is_admin_owner_or_sso(ctx):
-            await ctx.send("Only Guild Owner, Second Owner, or Administrators can use this command.")
-            return
-
-        # Handle role ID if string is provided
-        if isinstance(role, str):
-            try:
-                role_id = int(role)
-                role = ctx.guild.get_role(role_id)
-                if role is None:
-                    await ctx.send("Role not found. Please provide a valid role mention or ID.")
-                    return
-            except ValueError:
-                await ctx.send("Invalid role format. Please provide a valid role mention or ID.")
-                return
-
-        if role >= ctx.author.top_role and ctx.author.id != ctx.guild.owner_id:
-            await ctx.send("You cannot assign a role higher than or equal to your highest role.")
-            return
-
-        if role.managed:
-            await ctx.send("Cannot assign managed roles (bot or integration roles).")
-            return
-
-        # Check if bot has permission to manage the role
-        if not ctx.guild.me.guild_permissions.manage_roles:
-            await ctx.send("I don't have permission to manage roles.")
-            return
-
-        if role >= ctx.guild.me.top_role:
-            await ctx.send("I cannot assign a role higher than or equal to my highest role.")
-            return
-
-        # Filter for bot members only
-        members = [m for m in ctx.guild.members if m.bot]
-        total_members = len(members)
-        if total_members == 0:
-            await ctx.send("No bot members found in this server.")
-            return
-
-        success_count = 0
-        failed_count = 0
-
-        embed = discord.Embed(
-            title="Role Assignment in Progress",
-            description=f"Adding role {role.mention} to all bot members...",
-            color=0xFFFFFF  # White hex color
-        )
-        embed.add_field(name="Progress", value=f"0/{total_members}", inline=True)
-        embed.add_field(name="Status", value="Processing...", inline=True)
-        embed.add_field(name="Target", value="Bot members", inline=True)
-        embed.set_footer(text="Role Management System", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
-        
-        progress_msg = await ctx.send(embed=embed)
-
-        for i, member in enumerate(members, 1):
-            try:
-                if role not in member.roles:
-                    await member.add_roles(role, reason=f"Role command by {ctx.author}")
-                    success_count += 1
-                else:
-                    # Member already has the role
-                    pass
-                
-                # Update progress every 10 members or at the end
-                if i % 10 == 0 or i == total_members:
-                    embed.description = f"Adding role {role.mention} to all bot members..."
-                    embed.set_field_at(0, name="Progress", value=f"{i}/{total_members}", inline=True)
-                    embed.set_field_at(1, name="Status", value="Processing...", inline=True)
-                    await progress_msg.edit(embed=embed)
-                    await asyncio.sleep(0.1)  # Small delay to prevent rate limiting
-                    
-            except discord.Forbidden:
-                failed_count += 1
-            except discord.HTTPException:
-                failed_count += 1
-
-        # Final result embed
-        result_embed = discord.Embed(
-            title="Role Assignment Complete",
-            description=f"Role {role.mention} has been processed for all bot members",
-            color=0xFFFFFF  # White hex color
-        )
-        result_embed.add_field(name="Successfully Added", value=f"**{success_count}** bot members", inline=True)
-        result_embed.add_field(name="Failed", value=f"**{failed_count}** bot members", inline=True)
-        result_embed.add_field(name="Total Processed", value=f"**{total_members}** bot members", inline=False)
-        result_embed.set_footer(text="Role Management System", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
-        
-        await progress_msg.edit(embed=result_embed)
+        await self._run_bulk(ctx, role, 'add', 'bot')
 
     @role_group.group(name='remove')
     @commands.guild_only()
@@ -327,272 +189,72 @@ class RoleManagement(commands.Cog):
     @commands.guild_only()
     async def role_remove_all(self, ctx: commands.Context, role: Union[discord.Role, str]):
         """Remove a role from all members in the server."""
-        if not self.is_admin_owner_or_sso(ctx):
-            await ctx.send("Only Guild Owner, Second Owner, or Administrators can use this command.")
-            return
-
-        # Handle role ID if string is provided
-        if isinstance(role, str):
-            try:
-                role_id = int(role)
-                role = ctx.guild.get_role(role_id)
-                if role is None:
-                    await ctx.send("Role not found. Please provide a valid role mention or ID.")
-                    return
-            except ValueError:
-                await ctx.send("Invalid role format. Please provide a valid role mention or ID.")
-                return
-
-        if role >= ctx.author.top_role and ctx.author.id != ctx.guild.owner_id:
-            await ctx.send("You cannot remove a role higher than or equal to your highest role.")
-            return
-
-        if role.managed:
-            await ctx.send("Cannot remove managed roles (bot or integration roles).")
-            return
-
-        # Check if bot has permission to manage the role
-        if not ctx.guild.me.guild_permissions.manage_roles:
-            await ctx.send("I don't have permission to manage roles.")
-            return
-
-        if role >= ctx.guild.me.top_role:
-            await ctx.send("I cannot remove a role higher than or equal to my highest role.")
-            return
-
-        members = [m for m in ctx.guild.members if role in m.roles]
-        total_members = len(members)
-        
-        if total_members == 0:
-            await ctx.send(f"No members currently have the role {role.mention}.")
-            return
-
-        success_count = 0
-        failed_count = 0
-
-        embed = discord.Embed(
-            title="Role Removal in Progress",
-            description=f"Removing role {role.mention} from all members...",
-            color=0xFFFFFF  # White hex color
-        )
-        embed.add_field(name="Progress", value=f"0/{total_members}", inline=True)
-        embed.add_field(name="Status", value="Processing...", inline=True)
-        embed.set_footer(text="Role Management System", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
-        
-        progress_msg = await ctx.send(embed=embed)
-
-        for i, member in enumerate(members, 1):
-            try:
-                await member.remove_roles(role, reason=f"Role removal command by {ctx.author}")
-                success_count += 1
-                
-                # Update progress every 10 members or at the end
-                if i % 10 == 0 or i == total_members:
-                    embed.description = f"Removing role {role.mention} from all members..."
-                    embed.set_field_at(0, name="Progress", value=f"{i}/{total_members}", inline=True)
-                    embed.set_field_at(1, name="Status", value="Processing...", inline=True)
-                    await progress_msg.edit(embed=embed)
-                    await asyncio.sleep(0.1)  # Small delay to prevent rate limiting
-                    
-            except discord.Forbidden:
-                failed_count += 1
-            except discord.HTTPException:
-                failed_count += 1
-
-        # Final result embed
-        result_embed = discord.Embed(
-            title="Role Removal Complete",
-            description=f"Role {role.mention} has been removed from all members",
-            color=0xFFFFFF  # White hex color
-        )
-        result_embed.add_field(name="Successfully Removed", value=f"**{success_count}** members", inline=True)
-        result_embed.add_field(name="Failed", value=f"**{failed_count}** members", inline=True)
-        result_embed.add_field(name="Total Processed", value=f"**{total_members}** members", inline=False)
-        result_embed.set_footer(text="Role Management System", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
-        
-        await progress_msg.edit(embed=result_embed)
+        await self._run_bulk(ctx, role, 'remove', 'all')
 
     @role_remove.command(name='human')
     @commands.guild_only()
     async def role_remove_human(self, ctx: commands.Context, role: Union[discord.Role, str]):
         """Remove a role from all human members in the server."""
-        if not self.is_admin_owner_or_sso(ctx):
-            await ctx.send("Only Guild Owner, Second Owner, or Administrators can use this command.")
-            return
-
-        # Handle role ID if string is provided
-        if isinstance(role, str):
-            try:
-                role_id = int(role)
-                role = ctx.guild.get_role(role_id)
-                if role is None:
-                    await ctx.send("Role not found. Please provide a valid role mention or ID.")
-                    return
-            except ValueError:
-                await ctx.send("Invalid role format. Please provide a valid role mention or ID.")
-                return
-
-        if role >= ctx.author.top_role and ctx.author.id != ctx.guild.owner_id:
-            await ctx.send("You cannot remove a role higher than or equal to your highest role.")
-            return
-
-        if role.managed:
-            await ctx.send("Cannot remove managed roles (bot or integration roles).")
-            return
-
-        # Check if bot has permission to manage the role
-        if not ctx.guild.me.guild_permissions.manage_roles:
-            await ctx.send("I don't have permission to manage roles.")
-            return
-
-        if role >= ctx.guild.me.top_role:
-            await ctx.send("I cannot remove a role higher than or equal to my highest role.")
-            return
-
-        # Filter for human members only who have the role
-        members = [m for m in ctx.guild.members if not m.bot and role in m.roles]
-        total_members = len(members)
-        
-        if total_members == 0:
-            await ctx.send(f"No human members currently have the role {role.mention}.")
-            return
-
-        success_count = 0
-        failed_count = 0
-
-        embed = discord.Embed(
-            title="Role Removal in Progress",
-            description=f"Removing role {role.mention} from all human members...",
-            color=0xFFFFFF  # White hex color
-        )
-        embed.add_field(name="Progress", value=f"0/{total_members}", inline=True)
-        embed.add_field(name="Status", value="Processing...", inline=True)
-        embed.add_field(name="Target", value="Human members", inline=True)
-        embed.set_footer(text="Role Management System", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
-        
-        progress_msg = await ctx.send(embed=embed)
-
-        for i, member in enumerate(members, 1):
-            try:
-                await member.remove_roles(role, reason=f"Role removal command by {ctx.author}")
-                success_count += 1
-                
-                # Update progress every 10 members or at the end
-                if i % 10 == 0 or i == total_members:
-                    embed.description = f"Removing role {role.mention} from all human members..."
-                    embed.set_field_at(0, name="Progress", value=f"{i}/{total_members}", inline=True)
-                    embed.set_field_at(1, name="Status", value="Processing...", inline=True)
-                    await progress_msg.edit(embed=embed)
-                    await asyncio.sleep(0.1)  # Small delay to prevent rate limiting
-                    
-            except discord.Forbidden:
-                failed_count += 1
-            except discord.HTTPException:
-                failed_count += 1
-
-        # Final result embed
-        result_embed = discord.Embed(
-            title="Role Removal Complete",
-            description=f"Role {role.mention} has been removed from all human members",
-            color=0xFFFFFF  # White hex color
-        )
-        result_embed.add_field(name="Successfully Removed", value=f"**{success_count}** human members", inline=True)
-        result_embed.add_field(name="Failed", value=f"**{failed_count}** human members", inline=True)
-        result_embed.add_field(name="Total Processed", value=f"**{total_members}** human members", inline=False)
-        result_embed.set_footer(text="Role Management System", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
-        
-        await progress_msg.edit(embed=result_embed)
+        await self._run_bulk(ctx, role, 'remove', 'human')
 
     @role_remove.command(name='bot')
     @commands.guild_only()
     async def role_remove_bot(self, ctx: commands.Context, role: Union[discord.Role, str]):
         """Remove a role from all bot members in the server."""
-        if not self.is_admin_owner_or_sso(ctx):
-            await ctx.send("Only Guild Owner, Second Owner, or Administrators can use this command.")
-            return
+        await self._run_bulk(ctx, role, 'remove', 'bot')
 
-        # Handle role ID if string is provided
-        if isinstance(role, str):
-            try:
-                role_id = int(role)
-                role = ctx.guild.get_role(role_id)
-                if role is None:
-                    await ctx.send("Role not found. Please provide a valid role mention or ID.")
-                    return
-            except ValueError:
-                await ctx.send("Invalid role format. Please provide a valid role mention or ID.")
-                return
+    # ---------- Bulk role job control ----------
+    @role_group.group(name='job', invoke_without_command=True)
+    @commands.guild_only()
+    async def role_job(self, ctx: commands.Context):
+        """Show the current or most recent bulk role job."""
+        await self.role_job_status(ctx)
 
-        if role >= ctx.author.top_role and ctx.author.id != ctx.guild.owner_id:
-            await ctx.send("You cannot remove a role higher than or equal to your highest role.")
-            return
+    @role_job.command(name='status')
+    @commands.guild_only()
+    async def role_job_status(self, ctx: commands.Context):
+        """Show the current or most recent bulk role job."""
+        job = self.engine.active_job(ctx.guild.id) or self.engine.latest_job(ctx.guild.id)
+        if job is None:
+            await ctx.send("No bulk role jobs have been run in this server.")
+            return
+        embed = self._build_job_embed(job, final=job.finished)
+        embed.add_field(name="Job Status", value=job.status.capitalize(), inline=False)
+        await ctx.send(embed=embed)
 
-        if role.managed:
-            await ctx.send("Cannot remove managed roles (bot or integration roles).")
+    async def _control_job(self, ctx: commands.Context, op: str) -> None:
+        if not self.is_admin_owner_or_sso(ctx):
+            await ctx.send("Only Guild Owner, Second Owner, or Administrators can use this command.")
             return
-
-        # Check if bot has permission to manage the role
-        if not ctx.guild.me.guild_permissions.manage_roles:
-            await ctx.send("I don't have permission to manage roles.")
+        job = self.engine.active_job(ctx.guild.id)
+        if job is None:
+            await ctx.send("There is no bulk role job running in this server.")
             return
-
-        if role >= ctx.guild.me.top_role:
-            await ctx.send("I cannot remove a role higher than or equal to my highest role.")
-            return
-
-        # Filter for bot members only who have the role
-        members = [m for m in ctx.guild.members if m.bot and role in m.roles]
-        total_members = len(members)
-        
-        if total_members == 0:
-            await ctx.send(f"No bot members currently have the role {role.mention}.")
+        done = {'pause': 'paused', 'resume': 'resumed', 'cancel': 'cancelled'}[op]
+        if not getattr(self.engine, op)(job.job_id):
+            await ctx.send(f"Job `{job.job_id}` is {job.status} and can't be {done}.")
             return
+        await ctx.send(f"Job `{job.job_id}` {done}.")
+        if job.status == 'paused':
+            await self._report_job(job, final=False)
 
-        success_count = 0
-        failed_count = 0
+    @role_job.command(name='pause')
+    @commands.guild_only()
+    async def role_job_pause(self, ctx: commands.Context):
+        """Pause the running bulk role job."""
+        await self._control_job(ctx, 'pause')
 
-        embed = discord.Embed(
-            title="Role Removal in Progress",
-            description=f"Removing role {role.mention} from all bot members...",
-            color=0xFFFFFF  # White hex color
-        )
-        embed.add_field(name="Progress", value=f"0/{total_members}", inline=True)
-        embed.add_field(name="Status", value="Processing...", inline=True)
-        embed.add_field(name="Target", value="Bot members", inline=True)
-        embed.set_footer(text="Role Management System", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
-        
-        progress_msg = await ctx.send(embed=embed)
+    @role_job.command(name='resume')
+    @commands.guild_only()
+    async def role_job_resume(self, ctx: commands.Context):
+        """Resume a paused bulk role job."""
+        await self._control_job(ctx, 'resume')
 
-        for i, member in enumerate(members, 1):
-            try:
-                await member.remove_roles(role, reason=f"Role removal command by {ctx.author}")
-                success_count += 1
-                
-                # Update progress every 10 members or at the end
-                if i % 10 == 0 or i == total_members:
-                    embed.description = f"Removing role {role.mention} from all bot members..."
-                    embed.set_field_at(0, name="Progress", value=f"{i}/{total_members}", inline=True)
-                    embed.set_field_at(1, name="Status", value="Processing...", inline=True)
-                    await progress_msg.edit(embed=embed)
-                    await asyncio.sleep(0.1)  # Small delay to prevent rate limiting
-                    
-            except discord.Forbidden:
-                failed_count += 1
-            except discord.HTTPException:
-                failed_count += 1
-
-        # Final result embed
-        result_embed = discord.Embed(
-            title="Role Removal Complete",
-            description=f"Role {role.mention} has been removed from all bot members",
-            color=0xFFFFFF  # White hex color
-        )
-        result_embed.add_field(name="Successfully Removed", value=f"**{success_count}** bot members", inline=True)
-        result_embed.add_field(name="Failed", value=f"**{failed_count}** bot members", inline=True)
-        result_embed.add_field(name="Total Processed", value=f"**{total_members}** bot members", inline=False)
-        result_embed.set_footer(text="Role Management System", icon_url=ctx.guild.icon.url if ctx.guild.icon else None)
-        
-        await progress_msg.edit(embed=result_embed)
+    @role_job.command(name='cancel')
+    @commands.guild_only()
+    async def role_job_cancel(self, ctx: commands.Context):
+        """Cancel the running bulk role job."""
+        await self._control_job(ctx, 'cancel')
 
     # JSK compatibility command
     @commands.command(name='roleinfo', aliases=['ri'])
@@ -631,9 +293,13 @@ class RoleManagement(commands.Cog):
         embed.add_field(name="Hoisted", value="Yes" if role.hoist else "No", inline=True)
         embed.add_field(name="Mentionable", value="Yes" if role.mentionable else "No", inline=True)
         
-        # Member count
+        # Member count (only cached members are visible unless the guild is chunked)
         member_count = len(role.members)
-        embed.add_field(name="Members", value=f"**{member_count}** members", inline=True)
+        if ctx.guild.chunked:
+            members_value = f"**{member_count}** members"
+        else:
+            members_value = f"**{member_count}** cached members"
+        embed.add_field(name="Members", value=members_value, inline=True)
         
         # Key permissions
         key_perms = []
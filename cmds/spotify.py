@@ -9,6 +9,8 @@ from typing import Optional, Dict, Any
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 
+from utils.cluster import update_json
+
 SPOTIFY_CONFIG_PATH = 'spotify_config.json'
 USER_TOKENS_PATH = 'spotify_tokens.json'
 
@@ -34,11 +36,6 @@ def load_tokens() -> Dict[str, Any]:
         return {}
 
 
-def save_tokens(tokens: Dict[str, Any]) -> None:
-    with open(USER_TOKENS_PATH, 'w') as f:
-        json.dump(tokens, f, indent=2)
-
-
 def build_auth_url(client_id: str, redirect_uri: str, scope: str, state: str) -> str:
     from urllib.parse import urlencode
     params = {
@@ -383,9 +380,9 @@ class SpotifyCog(commands.Cog, name='spotify'):
                 os.remove(f'.cache-{user_id}')
             except FileNotFoundError:
                 pass
-            if str(user_id) in self.user_tokens:
-                del self.user_tokens[str(user_id)]
-                save_tokens(self.user_tokens)
+            self.user_tokens.pop(str(user_id), None)
+            # The token file is shared by every cluster, so only this user's entry is dropped, under a lock
+            update_json(USER_TOKENS_PATH, lambda tokens: tokens.pop(str(user_id), None), indent=2)
             await ctx.send('🔌 Disconnected your Spotify.')
         except Exception as e:
             await ctx.send(f'❌ Logout failed: {e}')
@@ -8,9 +8,14 @@ from utils.formatting import quote
 from typing import Optional, Dict
 from datetime import datetime, timezone
 import asyncio
+from utils.cluster import cluster_file
+from utils.jobs import get_queue
 
-CONFIG_FILE = 'ticket_config.json'
+CONFIG_FILE = cluster_file('ticket_config.json')
+TICKETS_FILE = cluster_file('tickets.json')
 OWNER_IDS = [386889350010634252, 164202861356515328]  # Update as needed
+# Placeholder in the ticket index while a user's ticket channel is being created
+PENDING_TICKET = 0
 
 def load_config():
     if not os.path.exists(CONFIG_FILE):
@@ -22,6 +27,42 @@ def save_config(config):
     with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
         json.dump(config, f, indent=4)
 
+def load_tickets():
+    # {guild_id: {channel_id: {user_id, reason, status, claimed_by, opened_at, claimed_at, updated_at}}}
+    if not os.path.exists(TICKETS_FILE):
+        return {}
+    try:
+        with open(TICKETS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def save_tickets(tickets):
+    with open(TICKETS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(tickets, f, indent=4)
+
+_second_owners: Dict[str, str] = {}
+_second_owners_mtime: Optional[float] = None
+
+def load_second_owners() -> Dict[str, str]:
+    """second_owners.json, re-read only when the file changes"""
+    global _second_owners, _second_owners_mtime
+    try:
+        mtime = os.path.getmtime('second_owners.json')
+    except OSError:
+        return {}
+    if mtime != _second_owners_mtime:
+        try:
+            with open('second_owners.json', 'r') as f:
+                _second_owners = json.load(f)
+        except Exception:
+            _second_owners = {}
+        _second_owners_mtime = mtime
+    return _second_owners
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
 class TicketSelectMenu(ui.Select):
     def __init__(self, options):
         select_options = [discord.SelectOption(label=opt, value=opt) for opt in options]
@@ -54,117 +95,310 @@ class TicketPanel(ui.View):
             # If no custom options, show the create button directly
             self.add_item(ui.Button(label=config.get('button_label', 'Create Ticket'), style=discord.ButtonStyle.blurple, custom_id='ticket_create'))
 
-class TicketActionView(ui.View):
-    def __init__(self, cog, conf, user, reason, mod_role, second_owner, owner, ticket_channel):
-        super().__init__(timeout=None)
-        self.cog = cog
-        self.conf = conf
-        self.user = user
-        self.reason = reason
-        self.mod_role = mod_role
-        self.second_owner = second_owner
-        self.owner = owner
-        self.ticket_channel = ticket_channel
-        self.claimed_by = None
-        self.creation_time = datetime.now(timezone.utc)
-        # Buttons are declared via @ui.button decorators below
+# Action buttons carry the ticket channel id in their custom_id (``ticket:<action>:<channel_id>``)
+# and are registered once at startup; the ticket itself is looked up in tickets.json on each
+# click, so nothing is held in memory per open ticket. Older panels used ``ticket_<action>``
+# and always live in the ticket channel, so for those the channel is where the click came from.
+TICKET_BUTTONS = [
+    ('delete', 'Delete', discord.ButtonStyle.danger),
+    ('claim', 'Claim', discord.ButtonStyle.success),
+    ('close', 'Close', discord.ButtonStyle.secondary),
+    ('transcript', 'Transcript', discord.ButtonStyle.primary),
+]
+
+
+class TicketActionButton(ui.DynamicItem[ui.Button], template=r'ticket[:_](?P<action>delete|claim|close|transcript)(?::(?P<channel_id>[0-9]+))?$'):
+    def __init__(self, action: str, channel_id: Optional[int], *, disabled: bool = False):
+        label, style = next((label, style) for name, label, style in TICKET_BUTTONS if name == action)
+        custom_id = f"ticket:{action}:{channel_id}" if channel_id else f"ticket_{action}"
+        super().__init__(ui.Button(label=label, style=style, custom_id=custom_id, disabled=disabled))
+        self.action = action
+        self.channel_id = channel_id
+        self.cog = None
+        self.ticket_channel = None
+        self.ticket = None
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Button, match, /):
+        button = cls(match['action'], int(match['channel_id']) if match['channel_id'] else interaction.channel_id)
+        button.cog = interaction.client.get_cog('Ticket')
+        if button.cog is not None and interaction.guild is not None:
+            button.ticket_channel = interaction.guild.get_channel(button.channel_id)
+            if button.ticket_channel is not None:
+                button.ticket = button.cog.get_ticket(button.ticket_channel)
+        return button
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if self.ticket is None:
+            await interaction.response.send_message("This ticket no longer exists.", ephemeral=True)
+            return False
         # Only allow ticket mod, second owner, or guild owner
+        guild = interaction.guild
+        conf = self.cog.config.get(str(guild.id), {})
         allowed = False
-        if self.mod_role and self.mod_role in interaction.user.roles:
+        mod_role_id = conf.get("ticket_mod")
+        if mod_role_id and any(role.id == mod_role_id for role in getattr(interaction.user, 'roles', [])):
             allowed = True
-        if self.second_owner and interaction.user.id == self.second_owner.id:
+        if interaction.user.id == self.cog.second_owner_id(guild.id):
             allowed = True
-        if self.owner and interaction.user.id == self.owner.id:
+        if interaction.user.id == guild.owner_id:
             allowed = True
         # Allow the ticket creator to use Close and Transcript buttons
-        if not allowed:
-            try:
-                custom_id = interaction.data.get("custom_id") if interaction.data else None
-            except Exception:
-                custom_id = None
-            if interaction.user.id == self.user.id and custom_id in ("ticket_close", "ticket_transcript"):
-                allowed = True
+        if not allowed and interaction.user.id == self.ticket.get("user_id") and self.action in ("close", "transcript"):
+            allowed = True
         if not allowed:
             await interaction.response.send_message("You are not allowed to use this button.", ephemeral=True)
         return allowed
 
-    @ui.button(label="Delete", style=discord.ButtonStyle.danger, custom_id="ticket_delete")
-    async def delete_button(self, interaction: discord.Interaction, button: ui.Button):
+    async def callback(self, interaction: discord.Interaction):
+        await getattr(self, f"_{self.action}")(interaction)
+
+    async def _delete(self, interaction: discord.Interaction):
         await interaction.response.send_message("Deleting ticket...", ephemeral=True)
-        
+
         # Log ticket deletion
-        await self.log_ticket_action("deleted", interaction.user)
-        
-        await interaction.channel.delete(reason=f"Ticket deleted by {interaction.user}")
+        await self.cog.log_ticket_action(self.ticket_channel, self.ticket, "deleted", interaction.user)
+
+        self.cog.forget_ticket(interaction.guild.id, self.ticket_channel.id)
+        await self.ticket_channel.delete(reason=f"Ticket deleted by {interaction.user}")
 
-    @ui.button(label="Claim", style=discord.ButtonStyle.success, custom_id="ticket_claim")
-    async def claim_button(self, interaction: discord.Interaction, button: ui.Button):
-        if self.claimed_by:
-            await interaction.response.send_message(f"Already claimed by {self.claimed_by.mention}.", ephemeral=True)
+    async def _claim(self, interaction: discord.Interaction):
+        if self.ticket.get("claimed_by"):
+            await interaction.response.send_message(f"Already claimed by <@{self.ticket['claimed_by']}>.", ephemeral=True)
             return
-        
-        self.claimed_by = interaction.user
+
+        self.cog.update_ticket(interaction.guild.id, self.ticket_channel.id, claimed_by=interaction.user.id, claimed_at=datetime.now(timezone.utc).isoformat())
         await interaction.response.send_message(f"Ticket claimed by {interaction.user.mention}. Please wait until they show up for help.", ephemeral=False)
-        
+
         # Log ticket claim
-        await self.log_ticket_action("claimed", interaction.user)
-        
+        await self.cog.log_ticket_action(self.ticket_channel, self.ticket, "claimed", interaction.user)
+
         # Disable the claim button for others
-        button.disabled = True
-        await interaction.message.edit(view=self)
+        await interaction.message.edit(view=TicketActionView(self.ticket_channel.id, claimed=True))
 
-    @ui.button(label="Close", style=discord.ButtonStyle.secondary, custom_id="ticket_close")
-    async def close_button(self, interaction: discord.Interaction, button: ui.Button):
+    async def _close(self, interaction: discord.Interaction):
+        # Transcript and deletion run as a delayed background job so a restart doesn't lose them
+        params = {
+            'channel_id': self.ticket_channel.id,
+            'user_id': self.ticket.get('user_id'),
+            'reason': self.ticket.get('reason'),
+            'closed_by': interaction.user.id,
+            'claimed_by': self.ticket.get('claimed_by'),
+            'opened_at': self.ticket.get('opened_at'),
+        }
+        _, created = get_queue(self.cog.bot).submit(
+            'ticket_close', interaction.guild.id, params, delay=600,  # 10 minutes
+            dedup_key=f"ticket_close:{interaction.guild.id}:{self.ticket_channel.id}",
+            requested_by=interaction.user.id,
+        )
+        if not created:
+            await interaction.response.send_message("This ticket is already scheduled to close.", ephemeral=True)
+            return
+        self.cog.update_ticket(interaction.guild.id, self.ticket_channel.id, status="closing")
         await interaction.response.send_message("Ticket will close in 10 minutes.", ephemeral=True)
-        await interaction.channel.send(f"⚠️ This ticket will close in 10 minutes by {interaction.user.mention}.")
-        
+        await self.ticket_channel.send(f"⚠️ This ticket will close in 10 minutes by {interaction.user.mention}.")
+
         # Log ticket close
-        await self.log_ticket_action("closed", interaction.user)
-        
-        # Wait 10 minutes then delete
-        await asyncio.sleep(600)  # 10 minutes
-        
-        # Generate transcript before deletion
-        await self.generate_transcript(interaction.user, "closed")
-        
-        await interaction.channel.delete(reason=f"Ticket closed by {interaction.user}")
+        await self.cog.log_ticket_action(self.ticket_channel, self.ticket, "closed", interaction.user)
 
-    @ui.button(label="Transcript", style=discord.ButtonStyle.primary, custom_id="ticket_transcript")
-    async def transcript_button(self, interaction: discord.Interaction, button: ui.Button):
+    async def _transcript(self, interaction: discord.Interaction):
         await interaction.response.send_message("Generating transcript and sending to your DMs...", ephemeral=True)
         # Build transcript embed and DM to the clicking staff member
         try:
-            embed = await self.build_transcript_embed(interaction.user, "transcript")
+            embed = await self.cog.build_transcript_embed(self.ticket_channel, self.ticket, interaction.user, "transcript")
             await interaction.user.send(embed=embed)
         except discord.Forbidden:
             await interaction.followup.send("I couldn't DM you. Please enable DMs from server members.", ephemeral=True)
         except Exception:
             await interaction.followup.send("Failed to deliver transcript via DM.", ephemeral=True)
         # Also log to the configured log channel if set
-        await self.generate_transcript(interaction.user, "transcript")
+        await self.cog.generate_transcript(self.ticket_channel, self.ticket, interaction.user, "transcript")
+
+class TicketActionView(ui.View):
+    """Delete/Claim/Close/Transcript for one ticket; only used to send or re-render the buttons."""
+
+    def __init__(self, channel_id: int, claimed: bool = False):
+        super().__init__(timeout=None)
+        for action, _, _ in TICKET_BUTTONS:
+            self.add_item(TicketActionButton(action, channel_id, disabled=(action == "claim" and claimed)))
+
+class Ticket(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.config = load_config()
+        self.tickets = load_tickets()
+        # guild_id -> ticket creator id -> ticket channel id, derived from the store
+        self.by_user: Dict[int, Dict[int, int]] = {}
+        for guild_id, guild_tickets in self.tickets.items():
+            for channel_id, ticket in guild_tickets.items():
+                self._index(int(guild_id), int(channel_id), ticket)
+        self._reconciled = False
+        self._panel_update_locks: Dict[str, asyncio.Lock] = {}
+
+    async def cog_load(self):
+        self.bot.add_dynamic_items(TicketActionButton)
+        self.jobs = get_queue(self.bot)
+        self.jobs.register('ticket_close', self._run_ticket_close, guild_concurrency=2)
+        if self.bot.is_ready():
+            self._reconcile()
+
+    async def cog_unload(self):
+        self.bot.remove_dynamic_items(TicketActionButton)
+        self.jobs.unregister('ticket_close')
+
+    # --- Open ticket store ---
+    def _index(self, guild_id: int, channel_id: int, ticket: Dict) -> None:
+        if ticket.get("user_id"):
+            self.by_user.setdefault(guild_id, {})[int(ticket["user_id"])] = channel_id
+
+    def _unindex(self, guild_id: int, channel_id: int, ticket: Dict) -> None:
+        guild_index = self.by_user.get(guild_id, {})
+        user_id = int(ticket["user_id"]) if ticket.get("user_id") else None
+        if guild_index.get(user_id) == channel_id:
+            del guild_index[user_id]
+            if not guild_index:
+                self.by_user.pop(guild_id, None)
 
-    async def log_ticket_action(self, action: str, user: discord.Member):
+    def open_ticket(self, channel: discord.TextChannel, user_id: int, reason: str) -> Dict:
+        now = _now()
+        ticket = {
+            "user_id": user_id,
+            "reason": reason,
+            "status": "open",
+            "claimed_by": None,
+            "opened_at": now,
+            "claimed_at": None,
+            "updated_at": now,
+        }
+        self.tickets.setdefault(str(channel.guild.id), {})[str(channel.id)] = ticket
+        self._index(channel.guild.id, channel.id, ticket)
+        save_tickets(self.tickets)
+        return ticket
+
+    def get_ticket(self, channel: discord.TextChannel) -> Optional[Dict]:
+        """The stored ticket for ``channel``; tickets opened before the store existed are adopted from their topic."""
+        ticket = self.tickets.get(str(channel.guild.id), {}).get(str(channel.id))
+        if ticket is not None:
+            return ticket
+        ticket = self._adopt(channel)
+        if ticket is not None:
+            save_tickets(self.tickets)
+        return ticket
+
+    def _adopt(self, channel: discord.abc.GuildChannel) -> Optional[Dict]:
+        match = re.fullmatch(r"Ticket for (\d+)", getattr(channel, 'topic', None) or "")
+        if not match:
+            return None
+        opened_at = channel.created_at.isoformat()
+        ticket = {
+            "user_id": int(match.group(1)), "reason": None, "status": "open", "claimed_by": None,
+            "opened_at": opened_at, "claimed_at": None, "updated_at": opened_at,
+        }
+        self.tickets.setdefault(str(channel.guild.id), {})[str(channel.id)] = ticket
+        self._index(channel.guild.id, channel.id, ticket)
+        return ticket
+
+    def find_user_ticket(self, guild: discord.Guild, user_id: int) -> Optional[discord.TextChannel]:
+        """The channel of ``user_id``'s open ticket, if any"""
+        channel_id = self.by_user.get(guild.id, {}).get(user_id)
+        if channel_id is None or channel_id == PENDING_TICKET:
+            return None
+        channel = guild.get_channel(channel_id)
+        if channel is None:
+            self.forget_ticket(guild.id, channel_id)  # deleted while we weren't watching
+        return channel
+
+    def update_ticket(self, guild_id: int, channel_id: int, **fields) -> None:
+        ticket = self.tickets.get(str(guild_id), {}).get(str(channel_id))
+        if ticket is not None:
+            ticket.update(fields, updated_at=_now())
+            save_tickets(self.tickets)
+
+    def forget_ticket(self, guild_id: int, channel_id: int, save: bool = True) -> None:
+        guild_tickets = self.tickets.get(str(guild_id), {})
+        ticket = guild_tickets.pop(str(channel_id), None)
+        if ticket is not None:
+            self._unindex(guild_id, channel_id, ticket)
+            if not guild_tickets:
+                self.tickets.pop(str(guild_id), None)
+            if save:
+                save_tickets(self.tickets)
+
+    def ticket_counts(self, guild_id: int) -> Dict[str, int]:
+        counts = {"open": 0, "claimed": 0, "closing": 0}
+        for ticket in self.tickets.get(str(guild_id), {}).values():
+            counts["closing" if ticket.get("status") == "closing" else "open"] += 1
+            if ticket.get("claimed_by"):
+                counts["claimed"] += 1
+        return counts
+
+    def _reconcile(self) -> None:
+        """Drop tickets whose channel is gone and adopt legacy tickets in the ticket categories, once per start"""
+        if self._reconciled:
+            return
+        self._reconciled = True
+        changed = False
+        for guild_id, guild_tickets in list(self.tickets.items()):
+            guild = self.bot.get_guild(int(guild_id))
+            if guild is None or guild.unavailable:
+                continue
+            for channel_id in list(guild_tickets):
+                if guild.get_channel(int(channel_id)) is None:
+                    self.forget_ticket(guild.id, int(channel_id), save=False)
+                    changed = True
+        for guild_id, conf in self.config.items():
+            guild = self.bot.get_guild(int(guild_id))
+            category = guild.get_channel(conf.get("category_id")) if guild and conf.get("category_id") else None
+            if not isinstance(category, discord.CategoryChannel):
+                continue
+            for channel in category.text_channels:
+                if str(channel.id) not in self.tickets.get(guild_id, {}) and self._adopt(channel) is not None:
+                    changed = True
+        if changed:
+            save_tickets(self.tickets)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        self._reconcile()
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        self.forget_ticket(channel.guild.id, channel.id)
+
+    @staticmethod
+    def second_owner_id(guild_id: int) -> Optional[int]:
+        try:
+            return int(load_second_owners()[str(guild_id)])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _opened_at(ticket: Dict) -> datetime:
+        try:
+            return datetime.fromisoformat(ticket["opened_at"])
+        except Exception:
+            return datetime.now(timezone.utc)
+
+    async def log_ticket_action(self, channel: discord.TextChannel, ticket: Dict, action: str, user: discord.abc.User):
         """Log ticket actions to the configured log channel"""
-        log_channel_id = self.conf.get("log_channel_id")
+        log_channel_id = self.config.get(str(channel.guild.id), {}).get("log_channel_id")
         if not log_channel_id:
             return
             
-        log_channel = self.ticket_channel.guild.get_channel(log_channel_id)
+        log_channel = channel.guild.get_channel(log_channel_id)
         if not log_channel:
             return
             
         embed = discord.Embed(
             title=f"Ticket {action.title()}",
-            description=f"**Ticket:** {self.ticket_channel.mention}\n**User:** {self.user.mention}",
+            description=f"**Ticket:** {channel.mention}\n**User:** <@{ticket.get('user_id')}>",
             color=0xFFFFFF,
             timestamp=datetime.now(timezone.utc)
         )
         
-        embed.add_field(name="Reason", value=self.reason, inline=False)
-        embed.add_field(name="Created by", value=self.user.mention, inline=True)
-        embed.add_field(name="Created at", value=self.creation_time.strftime('%Y-%m-%d %H:%M:%S UTC'), inline=True)
+        embed.add_field(name="Reason", value=ticket.get('reason') or 'Unknown', inline=False)
+        embed.add_field(name="Created by", value=f"<@{ticket.get('user_id')}>", inline=True)
+        embed.add_field(name="Created at", value=self._opened_at(ticket).strftime('%Y-%m-%d %H:%M:%S UTC'), inline=True)
         
         if action == "claimed":
             embed.add_field(name="Claimed by", value=user.mention, inline=True)
@@ -176,32 +410,32 @@ class TicketActionView(ui.View):
             embed.add_field(name="Deleted by", value=user.mention, inline=True)
             embed.add_field(name="Deleted at", value=datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'), inline=True)
         
-        if self.claimed_by:
-            embed.add_field(name="Was claimed by", value=self.claimed_by.mention, inline=True)
+        if ticket.get('claimed_by'):
+            embed.add_field(name="Was claimed by", value=f"<@{ticket['claimed_by']}>", inline=True)
         
         await log_channel.send(embed=embed)
 
-    async def build_transcript_embed(self, user: discord.Member, action: str) -> discord.Embed:
+    async def build_transcript_embed(self, channel: discord.TextChannel, ticket: Dict, user: discord.abc.User, action: str) -> discord.Embed:
         """Build the transcript embed without sending it anywhere."""
         # Gather ticket info
         embed = discord.Embed(
             title="Ticket Transcript",
-            description=f"**Ticket:** {self.ticket_channel.mention}\n**User:** {self.user.mention}",
+            description=f"**Ticket:** {channel.mention}\n**User:** <@{ticket.get('user_id')}>",
             color=0xFFFFFF,
             timestamp=datetime.now(timezone.utc)
         )
-        embed.add_field(name="Reason", value=self.reason, inline=False)
-        embed.add_field(name="Opened by", value=self.user.mention, inline=True)
-        embed.add_field(name="Opened at", value=self.creation_time.strftime('%Y-%m-%d %H:%M:%S UTC'), inline=True)
-        if self.claimed_by:
-            embed.add_field(name="Claimed by", value=self.claimed_by.mention, inline=True)
+        embed.add_field(name="Reason", value=ticket.get('reason') or 'Unknown', inline=False)
+        embed.add_field(name="Opened by", value=f"<@{ticket.get('user_id')}>", inline=True)
+        embed.add_field(name="Opened at", value=self._opened_at(ticket).strftime('%Y-%m-%d %H:%M:%S UTC'), inline=True)
+        if ticket.get('claimed_by'):
+            embed.add_field(name="Claimed by", value=f"<@{ticket['claimed_by']}>", inline=True)
         if action == "closed":
             embed.add_field(name="Closed by", value=user.mention, inline=True)
             embed.add_field(name="Closed at", value=datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'), inline=True)
         # Add ticket messages (last 100 messages)
         try:
             messages = []
-            async for message in self.ticket_channel.history(limit=100):
+            async for message in channel.history(limit=100):
                 if not message.author.bot:
                     messages.append(f"**{message.author.name}** ({message.created_at.strftime('%H:%M:%S')}): {message.content}")
             if messages:
@@ -216,23 +450,50 @@ class TicketActionView(ui.View):
             embed.add_field(name="Messages", value="Could not retrieve messages", inline=False)
         return embed
 
-    async def generate_transcript(self, user: discord.Member, action: str):
+    async def generate_transcript(self, channel: discord.TextChannel, ticket: Dict, user: discord.abc.User, action: str):
         """Generate and send transcript to log channel"""
-        log_channel_id = self.conf.get("log_channel_id")
+        log_channel_id = self.config.get(str(channel.guild.id), {}).get("log_channel_id")
         if not log_channel_id:
             return
             
-        log_channel = self.ticket_channel.guild.get_channel(log_channel_id)
+        log_channel = channel.guild.get_channel(log_channel_id)
         if not log_channel:
             return
-        embed = await self.build_transcript_embed(user, action)
+        embed = await self.build_transcript_embed(channel, ticket, user, action)
         await log_channel.send(embed=embed)
 
-class Ticket(commands.Cog):
-    def __init__(self, bot: commands.Bot):
-        self.bot = bot
-        self.config = load_config()
-        self._panel_update_locks: Dict[str, asyncio.Lock] = {}
+    async def _resolve_user(self, guild: discord.Guild, user_id: Optional[int]):
+        if not user_id:
+            return None
+        member = guild.get_member(user_id)
+        if member is not None:
+            return member
+        return await self.bot.fetch_user(user_id)
+
+    async def _run_ticket_close(self, job):
+        """Send the closing transcript and delete the ticket channel"""
+        params = job.job.params
+        guild = self.bot.get_guild(job.job.guild_id)
+        channel = guild.get_channel(params['channel_id']) if guild else None
+        if channel is None:
+            return  # Already deleted by hand
+        if not job.job.state.get('transcript_sent'):
+            closed_by = await self._resolve_user(guild, params['closed_by'])
+            # The stored ticket has the latest claim; the job params cover tickets closed before it existed
+            ticket = self.tickets.get(str(guild.id), {}).get(str(channel.id)) or {
+                'user_id': params['user_id'],
+                'reason': params['reason'],
+                'claimed_by': params.get('claimed_by'),
+                'opened_at': params['opened_at'],
+            }
+            # Generate transcript before deletion
+            await self.generate_transcript(channel, ticket, closed_by, "closed")
+            job.checkpoint(force=True, transcript_sent=True)
+        try:
+            await channel.delete(reason=f"Ticket closed by {params['closed_by']}")
+        except discord.NotFound:
+            pass
+        self.forget_ticket(guild.id, channel.id)
     
     @staticmethod
     async def _reply_embed(ctx: commands.Context, title: str, text: str) -> None:
@@ -251,13 +512,8 @@ class Ticket(commands.Cog):
         if ctx.author.guild_permissions.administrator:
             return True
         # Second owner check
-        try:
-            with open('second_owners.json', 'r') as f:
-                data = json.load(f)
-            if str(ctx.author.id) == data.get(str(ctx.guild.id)):
-                return True
-        except Exception:
-            pass
+        if ctx.guild and ctx.author.id == self.second_owner_id(ctx.guild.id):
+            return True
         return False
 
     async def send_permission_error(self, ctx, command_name):
@@ -277,6 +533,29 @@ class Ticket(commands.Cog):
             await interaction.response.send_message("Ticket system not configured.", ephemeral=True)
             return
 
+        # One open ticket per user, looked up in the ticket index
+        guild_index = self.by_user.setdefault(interaction.guild.id, {})
+        if guild_index.get(interaction.user.id) == PENDING_TICKET:
+            await interaction.response.send_message("⚠️ Your ticket is already being created.", ephemeral=True)
+            return
+        existing = self.find_user_ticket(interaction.guild, interaction.user.id)
+        if existing:
+            await interaction.response.send_message(f"⚠️ You already have an open ticket: {existing.mention}", ephemeral=True)
+            return
+
+        # Reserve the slot before the first await so a double submit can't open a second ticket;
+        # open_ticket replaces the reservation with the channel id
+        guild_index[interaction.user.id] = PENDING_TICKET
+        try:
+            await self._create_ticket_channel(interaction, conf, reason, selected_option)
+        finally:
+            guild_index = self.by_user.get(interaction.guild.id, {})
+            if guild_index.get(interaction.user.id) == PENDING_TICKET:
+                del guild_index[interaction.user.id]
+                if not guild_index:
+                    self.by_user.pop(interaction.guild.id, None)
+
+    async def _create_ticket_channel(self, interaction, conf, reason, selected_option):
         # Ensure the configured category exists
         category = interaction.guild.get_channel(conf.get("category_id")) if conf.get("category_id") else None
         if category is None or not isinstance(category, discord.CategoryChannel):
@@ -290,7 +569,7 @@ class Ticket(commands.Cog):
 
         ticket_mod_id = conf.get("ticket_mod")
         
-        # Build a safe, unique channel name and check for an existing ticket
+        # Build a safe, unique channel name
         def slugify_username(name: str) -> str:
             safe = name.lower()
             safe = re.sub(r"[^a-z0-9-]+", "-", safe)
@@ -299,22 +578,6 @@ class Ticket(commands.Cog):
 
         safe_name = slugify_username(interaction.user.name)
         desired_name_with_id = f"{safe_name}-ticket-{interaction.user.id}"
-        desired_name_legacy = f"{safe_name}-ticket"
-
-        existing = None
-        for ch in category.text_channels:
-            if ch.name == desired_name_with_id or ch.name == desired_name_legacy or ch.name.endswith(f"-ticket-{interaction.user.id}"):
-                existing = ch
-                break
-            try:
-                if ch.topic and str(interaction.user.id) in ch.topic:
-                    existing = ch
-                    break
-            except Exception:
-                pass
-        if existing:
-            await interaction.response.send_message(f"⚠️ You already have an open ticket: {existing.mention}", ephemeral=True)
-            return
 
         # Create channel
         overwrites = {
@@ -328,15 +591,10 @@ class Ticket(commands.Cog):
             overwrites[mod_role] = discord.PermissionOverwrite(view_channel=True, send_messages=True, manage_channels=True)
         
         # Second owner
-        try:
-            with open('second_owners.json', 'r') as f:
-                data = json.load(f)
-            second_owner_id = int(data.get(str(interaction.guild.id)))
-            second_owner = interaction.guild.get_member(second_owner_id)
-            if second_owner:
-                overwrites[second_owner] = discord.PermissionOverwrite(view_channel=True, send_messages=True, manage_channels=True)
-        except Exception:
-            second_owner = None
+        second_owner_id = self.second_owner_id(interaction.guild.id)
+        second_owner = interaction.guild.get_member(second_owner_id) if second_owner_id else None
+        if second_owner:
+            overwrites[second_owner] = discord.PermissionOverwrite(view_channel=True, send_messages=True, manage_channels=True)
         
         # Guild owner
         owner = interaction.guild.get_member(interaction.guild.owner_id)
@@ -371,8 +629,8 @@ class Ticket(commands.Cog):
         await ticket_channel.send(f"{ping_target}", embed=embed)
         
         # Add action buttons
-        view = TicketActionView(self, conf, interaction.user, ticket_reason, mod_role, second_owner, owner, ticket_channel)
-        await ticket_channel.send("**Ticket Actions:**", view=view)
+        self.open_ticket(ticket_channel, interaction.user.id, ticket_reason)
+        await ticket_channel.send("**Ticket Actions:**", view=TicketActionView(ticket_channel.id))
         
         # Log ticket creation
         if conf.get("log_channel_id"):
@@ -462,6 +720,8 @@ class Ticket(commands.Cog):
         embed.add_field(name="Button", value=conf.get('button_label', 'Create Ticket'), inline=True)
         mod_role = ctx.guild.get_role(conf.get('ticket_mod')) if conf.get('ticket_mod') else None
         embed.add_field(name="Ticket Mod", value=(mod_role.mention if mod_role else 'None'), inline=True)
+        counts = self.ticket_counts(ctx.guild.id)
+        embed.add_field(name="Open Tickets", value=f"{counts['open'] + counts['closing']} ({counts['claimed']} claimed, {counts['closing']} closing)", inline=True)
         await ctx.send(embed=embed)
 
     @ticket_group.command(name="send")
@@ -1,13 +1,47 @@
 import discord
 from discord.ext import commands
-from typing import Dict, Optional
+from collections import defaultdict
+from typing import Dict, NamedTuple, Optional, Set, Tuple
+import asyncio
 import json
 import os
+import random
+from utils.cluster import cluster_file
 from utils.formatting import quote
+from utils.cooldown import Cooldown
+from utils.member_cache import get_member_cache
 from discord.ext import tasks
 
 
-CONFIG_FILE = 'vanity_config.json'
+CONFIG_FILE = cluster_file('vanity_config.json')
+
+# Presence events drive vanity enforcement; the sweep is only a safety net for
+# missed events. Each run covers one slice of the configured guilds after a random
+# delay, so a given guild is re-checked every SWEEP_INTERVAL_MINUTES * SWEEP_SHARDS.
+# Guilds whose gateway shard is disconnected are skipped: their presence cache is stale.
+SWEEP_INTERVAL_MINUTES = 15
+SWEEP_SHARDS = 4
+SWEEP_JITTER = 120.0
+# Role removals share the per-guild member-edit rate limit; keep them bounded
+REMOVAL_CONCURRENCY = 3
+
+
+class VanityRule(NamedTuple):
+    """Precompiled vanity settings for one enabled guild."""
+    needle: str
+    role_id: int
+    announce_channel_id: Optional[int]
+    announce_text: Optional[str]
+
+
+def compile_rule(conf: Dict) -> Optional[VanityRule]:
+    if not conf.get('vanity_enabled'):
+        return None
+    needle = (conf.get('vanity_message_match') or '').strip().casefold()
+    role_id = conf.get('vanity_role_id')
+    if not needle or not role_id:
+        return None
+    return VanityRule(needle, role_id, conf.get('vanity_announce_channel_id'), conf.get('vanity_announce_text'))
 
 
 def load_config() -> Dict:
@@ -29,9 +63,43 @@ class Vanity(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         self.config: Dict = load_config()
-        self._vanity_last_sent: Dict[str, float] = {}
-        self._booster_last_sent: Dict[str, float] = {}
-        self._enforce_vanity_loop.start()
+        # Per (guild_id, user_id) announcement debounce
+        self._vanity_cooldown = Cooldown(30, max_size=50000)
+        self._booster_cooldown = Cooldown(60, max_size=10000)
+        # guild_id -> member IDs whose custom status currently matches
+        self._matching: Dict[int, Set[int]] = defaultdict(set)
+        self._removal_queue: asyncio.Queue = asyncio.Queue()
+        self._pending_removals: Set[Tuple[int, int]] = set()
+        self._removal_workers = []
+        self._sweep_shard = 0
+        # guild_id -> compiled rule, only for guilds with vanity fully configured
+        self._rules: Dict[int, VanityRule] = {}
+        # Enforcement reads role holders and presences from the member cache, so
+        # configured guilds are always fully cached regardless of size
+        self.member_cache = get_member_cache(bot)
+        for key, conf in self.config.items():
+            rule = compile_rule(conf)
+            if rule is not None:
+                self._rules[int(key)] = rule
+                self.member_cache.pin(int(key))
+        if self.presence_enabled:
+            self._safety_sweep.start()
+        else:
+            print("[Vanity] Presence intent disabled; vanity status enforcement is paused")
+
+    @property
+    def presence_enabled(self) -> bool:
+        # Custom status is only delivered with the presence intent; neither REST member
+        # fetches nor gateway member requests expose it without the intent.
+        return self.bot.intents.presences
+
+    async def cog_load(self) -> None:
+        self._removal_workers = [asyncio.create_task(self._removal_worker()) for _ in range(REMOVAL_CONCURRENCY)]
+
+    async def cog_unload(self) -> None:
+        self._safety_sweep.cancel()
+        for worker in self._removal_workers:
+            worker.cancel()
 
     # ------------------ Helpers ------------------
     @staticmethod
@@ -62,6 +130,30 @@ class Vanity(commands.Cog):
             }
         return self.config[key]
 
+    def _shard_online(self, guild: discord.Guild) -> bool:
+        get_shard = getattr(self.bot, 'get_shard', None)
+        if get_shard is None:
+            return not self.bot.is_closed()
+        gateway_shard = get_shard(guild.shard_id)
+        return gateway_shard is not None and not gateway_shard.is_closed()
+
+    def _peek_guild_conf(self, guild_id: int) -> Dict:
+        """Read-only lookup that never creates an entry for unconfigured guilds."""
+        return self.config.get(str(guild_id)) or {}
+
+    def _save(self, guild_id: int) -> None:
+        save_config(self.config)
+        # Recompile the presence-path matcher for this guild
+        old = self._rules.pop(guild_id, None)
+        rule = compile_rule(self._peek_guild_conf(guild_id))
+        if rule is not None:
+            self._rules[guild_id] = rule
+            self.member_cache.pin(guild_id)
+        else:
+            self.member_cache.unpin(guild_id)
+        if rule is None or old is None or rule.needle != old.needle:
+            self._matching.pop(guild_id, None)
+
     def _require_vanity_enabled(self, ctx: commands.Context, conf: Dict) -> bool:
         if conf.get('vanity_enabled'):
             return True
@@ -78,14 +170,10 @@ class Vanity(commands.Cog):
 
     @staticmethod
     def _extract_custom_status_text(member: discord.Member) -> str:
-        texts = []
-        for act in getattr(member, 'activities', []) or []:
-            try:
-                if isinstance(act, discord.CustomActivity) and act.state:
-                    texts.append(str(act.state))
-            except Exception:
-                continue
-        return " \n".join(texts)
+        for act in member.activities:
+            if isinstance(act, discord.CustomActivity) and act.state:
+                return str(act.state)
+        return ''
 
     # ------------------ Vanity commands ------------------
     @commands.group(name='vanity', invoke_without_command=True)
@@ -100,8 +188,11 @@ class Vanity(commands.Cog):
             return
         conf = self._get_guild_conf(ctx.guild.id)
         conf['vanity_enabled'] = True
-        save_config(self.config)
-        await self._reply_embed(ctx, 'Vanity', 'Vanity tracking enabled.')
+        self._save(ctx.guild.id)
+        if self.presence_enabled:
+            await self._reply_embed(ctx, 'Vanity', 'Vanity tracking enabled.')
+        else:
+            await self._reply_embed(ctx, 'Vanity', 'Vanity tracking enabled. Enforcement is paused because this bot runs without the presence intent.')
 
     @vanity_group.command(name='disable')
     async def vanity_disable(self, ctx: commands.Context) -> None:
@@ -110,7 +201,7 @@ class Vanity(commands.Cog):
             return
         conf = self._get_guild_conf(ctx.guild.id)
         conf['vanity_enabled'] = False
-        save_config(self.config)
+        self._save(ctx.guild.id)
         await self._reply_embed(ctx, 'Vanity', 'Vanity tracking disabled.')
 
     @vanity_group.command(name='role')
@@ -122,7 +213,7 @@ class Vanity(commands.Cog):
         if not self._require_vanity_enabled(ctx, conf):
             return
         conf['vanity_role_id'] = role.id
-        save_config(self.config)
+        self._save(ctx.guild.id)
         await self._reply_embed(ctx, 'Vanity', f'Vanity role set to {role.mention}.')
 
     @vanity_group.group(name='message', invoke_without_command=True)
@@ -137,7 +228,7 @@ class Vanity(commands.Cog):
             await self._reply_embed(ctx, 'Input required', 'Provide a message to match in user status, e.g. `discord.gg/vanity`.')
             return
         conf['vanity_message_match'] = text
-        save_config(self.config)
+        self._save(ctx.guild.id)
         await self._reply_embed(ctx, 'Vanity', 'Vanity match message updated.')
 
     @vanity_message.command(name='send')
@@ -150,18 +241,20 @@ class Vanity(commands.Cog):
             return
         conf['vanity_announce_channel_id'] = channel.id
         conf['vanity_announce_text'] = text
-        save_config(self.config)
+        self._save(ctx.guild.id)
         await self._reply_embed(ctx, 'Vanity', f'Vanity announcement set for {channel.mention}.')
 
     @vanity_group.command(name='status')
     async def vanity_status(self, ctx: commands.Context) -> None:
-        conf = self._get_guild_conf(ctx.guild.id)
+        conf = self._peek_guild_conf(ctx.guild.id)
         role = ctx.guild.get_role(conf.get('vanity_role_id')) if conf.get('vanity_role_id') else None
         channel = ctx.guild.get_channel(conf.get('vanity_announce_channel_id')) if conf.get('vanity_announce_channel_id') else None
         embed = discord.Embed(title='Vanity Status', color=0xFFFFFF)
         embed.add_field(name='Enabled', value=str(conf.get('vanity_enabled')), inline=True)
         embed.add_field(name='Role', value=(role.mention if role else 'None'), inline=True)
         embed.add_field(name='Announce Channel', value=(channel.mention if channel else 'None'), inline=True)
+        if not self.presence_enabled:
+            embed.add_field(name='Enforcement', value='Paused (presence intent disabled)', inline=False)
         message_match = conf.get('vanity_message_match') or 'None'
         embed.add_field(name='Match Text', value=quote(message_match), inline=False)
         announce_text = conf.get('vanity_announce_text') or 'None'
@@ -181,7 +274,7 @@ class Vanity(commands.Cog):
             return
         conf = self._get_guild_conf(ctx.guild.id)
         conf['booster_enabled'] = True
-        save_config(self.config)
+        self._save(ctx.guild.id)
         await self._reply_embed(ctx, 'Booster', 'Booster messages enabled.')
 
     @booster_group.command(name='disable')
@@ -191,7 +284,7 @@ class Vanity(commands.Cog):
             return
         conf = self._get_guild_conf(ctx.guild.id)
         conf['booster_enabled'] = False
-        save_config(self.config)
+        self._save(ctx.guild.id)
         await self._reply_embed(ctx, 'Booster', 'Booster messages disabled.')
 
     @booster_group.command(name='message')
@@ -207,12 +300,12 @@ class Vanity(commands.Cog):
             return
         conf['booster_channel_id'] = channel.id
         conf['booster_text'] = text
-        save_config(self.config)
+        self._save(ctx.guild.id)
         await self._reply_embed(ctx, 'Booster', f'Booster message set for {channel.mention}.')
 
     @booster_group.command(name='status')
     async def booster_status(self, ctx: commands.Context) -> None:
-        conf = self._get_guild_conf(ctx.guild.id)
+        conf = self._peek_guild_conf(ctx.guild.id)
         channel = ctx.guild.get_channel(conf.get('booster_channel_id')) if conf.get('booster_channel_id') else None
         embed = discord.Embed(title='Booster Status', color=0xFFFFFF)
         embed.add_field(name='Enabled', value=str(conf.get('booster_enabled')), inline=True)
@@ -221,75 +314,104 @@ class Vanity(commands.Cog):
         embed.add_field(name='Message', value=quote(text), inline=False)
         await ctx.send(embed=embed)
 
+    # ------------------ Reconciler ------------------
+    def _queue_removal(self, guild_id: int, member_id: int) -> None:
+        key = (guild_id, member_id)
+        if key in self._pending_removals:
+            return
+        self._pending_removals.add(key)
+        self._removal_queue.put_nowait(key)
+
+    async def _removal_worker(self) -> None:
+        while True:
+            guild_id, member_id = await self._removal_queue.get()
+            try:
+                await self._remove_if_unmatched(guild_id, member_id)
+            except Exception:
+                pass
+            finally:
+                self._pending_removals.discard((guild_id, member_id))
+                self._removal_queue.task_done()
+
+    async def _remove_if_unmatched(self, guild_id: int, member_id: int) -> None:
+        guild = self.bot.get_guild(guild_id)
+        rule = self._rules.get(guild_id)
+        if guild is None or rule is None:
+            return
+        # The status may have matched again while this removal was queued
+        if member_id in self._matching.get(guild_id, ()):
+            return
+        member = guild.get_member(member_id)
+        role = guild.get_role(rule.role_id)
+        if member is None or role is None or member.get_role(role.id) is None:
+            return
+        try:
+            await member.remove_roles(role, reason='Vanity status no longer matches')
+        except discord.Forbidden:
+            pass
+
     # ------------------ Listeners ------------------
     @commands.Cog.listener()
     async def on_presence_update(self, before: discord.Member, after: discord.Member) -> None:  # type: ignore[override]
-        # Vanity: give role if custom status contains the configured text
-        if after.guild is None:
+        # Fast path: most presence updates come from guilds without vanity or
+        # change something other than the custom status.
+        rule = self._rules.get(after.guild.id)
+        if rule is None:
             return
-        conf = self._get_guild_conf(after.guild.id)
-        if not conf.get('vanity_enabled'):
+        before_text = self._extract_custom_status_text(before)
+        after_text = self._extract_custom_status_text(after)
+        if before_text == after_text:
             return
-        target_text = (conf.get('vanity_message_match') or '').strip()
-        role_id = conf.get('vanity_role_id')
-        if not target_text or not role_id:
-            return
-        role = after.guild.get_role(role_id)
+        role = after.guild.get_role(rule.role_id)
         if role is None:
             return
         # Only fire when transitioning from not-matching to matching to avoid duplicates
-        before_text = self._extract_custom_status_text(before).lower()
-        after_text = self._extract_custom_status_text(after).lower()
-        if not after_text:
-            return
-        if (target_text.lower() in after_text) and (target_text.lower() not in before_text):
+        was_matching = rule.needle in before_text.casefold()
+        is_matching = rule.needle in after_text.casefold()
+        matching = self._matching[after.guild.id]
+        if is_matching:
+            matching.add(after.id)
+        else:
+            matching.discard(after.id)
+        if is_matching and not was_matching:
             # Debounce per user for 30 seconds
-            key = f"{after.guild.id}:{after.id}"
-            import time
-            now = time.monotonic()
-            last = self._vanity_last_sent.get(key, 0)
-            if now - last < 30:
+            if not self._vanity_cooldown.hit((after.guild.id, after.id)):
                 return
-            self._vanity_last_sent[key] = now
             try:
-                if role not in after.roles:
+                if after.get_role(role.id) is None:
                     await after.add_roles(role, reason='Vanity status matched')
             except discord.Forbidden:
                 pass
             # Send confirmation message if configured
-            channel_id = conf.get('vanity_announce_channel_id')
-            text_tmpl = conf.get('vanity_announce_text')
-            if channel_id and text_tmpl:
-                channel = after.guild.get_channel(channel_id)
+            if rule.announce_channel_id and rule.announce_text:
+                channel = after.guild.get_channel(rule.announce_channel_id)
                 if isinstance(channel, (discord.TextChannel, discord.Thread)):
                     try:
-                        await channel.send(text_tmpl.replace('{user.mention}', after.mention))
+                        await channel.send(rule.announce_text.replace('{user.mention}', after.mention))
                     except Exception:
                         pass
-        elif (target_text.lower() not in after_text) and role in after.roles:
+        elif not is_matching and after.get_role(role.id) is not None:
             # User removed the vanity string; remove the role silently
-            try:
-                await after.remove_roles(role, reason='Vanity status removed')
-            except discord.Forbidden:
-                pass
+            self._queue_removal(after.guild.id, after.id)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member) -> None:
+        matching = self._matching.get(member.guild.id)
+        if matching is not None:
+            matching.discard(member.id)
 
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
         # Booster: send message when a member starts boosting
         if after.guild is None:
             return
-        conf = self._get_guild_conf(after.guild.id)
+        conf = self._peek_guild_conf(after.guild.id)
         if not conf.get('booster_enabled'):
             return
         if getattr(before, 'premium_since', None) is None and getattr(after, 'premium_since', None) is not None:
             # Debounce per user for 60 seconds
-            key = f"boost:{after.guild.id}:{after.id}"
-            import time
-            now = time.monotonic()
-            last = self._booster_last_sent.get(key, 0)
-            if now - last < 60:
+            if not self._booster_cooldown.hit((after.guild.id, after.id)):
                 return
-            self._booster_last_sent[key] = now
             channel_id = conf.get('booster_channel_id')
             text_tmpl = conf.get('booster_text')
             if channel_id and text_tmpl:
@@ -300,29 +422,32 @@ class Vanity(commands.Cog):
                     except Exception:
                         pass
 
-    # Background enforcement to remove vanity role quickly if message is removed
-    @tasks.loop(seconds=10)
-    async def _enforce_vanity_loop(self):
-        for guild in list(self.bot.guilds):
-            conf = self._get_guild_conf(guild.id)
-            if not conf.get('vanity_enabled'):
+    # Safety net for missed presence events; normal enforcement is event-driven
+    @tasks.loop(minutes=SWEEP_INTERVAL_MINUTES)
+    async def _safety_sweep(self):
+        await asyncio.sleep(random.uniform(0, SWEEP_JITTER))
+        shard = self._sweep_shard % SWEEP_SHARDS
+        self._sweep_shard += 1
+        for guild_id, rule in list(self._rules.items()):
+            if guild_id % SWEEP_SHARDS != shard:
                 continue
-            role_id = conf.get('vanity_role_id')
-            match_text = (conf.get('vanity_message_match') or '').lower().strip()
-            if not role_id or not match_text:
+            guild = self.bot.get_guild(guild_id)
+            if guild is None or not self._shard_online(guild):
                 continue
-            role = guild.get_role(role_id)
+            role = guild.get_role(rule.role_id)
             if role is None:
                 continue
-            for member in list(role.members):
-                status_text = self._extract_custom_status_text(member).lower()
-                if match_text not in status_text:
-                    try:
-                        await member.remove_roles(role, reason='Vanity status no longer matches')
-                    except Exception:
-                        pass
-
-    @_enforce_vanity_loop.before_loop
+            matching = self._matching[guild.id]
+            for i, member in enumerate(role.members):
+                if i % 500 == 0:
+                    await asyncio.sleep(0)
+                if rule.needle in self._extract_custom_status_text(member).casefold():
+                    matching.add(member.id)
+                else:
+                    matching.discard(member.id)
+                    self._queue_removal(guild.id, member.id)
+
+    @_safety_sweep.before_loop
     async def _wait_for_ready(self):
         await self.bot.wait_until_ready()
 
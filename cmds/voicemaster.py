@@ -2,83 +2,156 @@ import discord
 from discord.ext import commands
 import json
 import asyncio
+import os
+import re
+import time
 from typing import Dict, Optional, Set, List
+from utils.cluster import cluster_file
 from utils.formatting import quote, grey_strip
+from utils.voice_analytics import DURATION_BINS, get_voice_analytics
 
-CONFIG_FILE = 'voicemaster_config.json'
+CONFIG_FILE = cluster_file('voicemaster_config.json')
+# Temp channels this process created (owner, bans, panel message); survives restarts
+REGISTRY_FILE = cluster_file('voicemaster_channels.json')
+# How long a temp channel may sit empty before it is deleted (per guild: 'cleanup_grace')
+CLEANUP_GRACE = 3.0
+MAX_CLEANUP_GRACE = 300
+# Channels that come due together are deleted a few at a time
+CLEANUP_BATCH = 5
+CLEANUP_PAUSE = 1.0
+# Optional per-guild pool of hidden, pre-created channels ('warm_pool' in the config)
+POOL_FILE = cluster_file('voicemaster_pool.json')
+MAX_WARM_POOL = 5
+SPARE_NAME = "VoiceMaster spare"
+# Settings for a join-to-create hub; each hub in a guild's 'hubs' config may override them.
+# ``name`` is formatted with {user} (display name); a category_id of None means the hub's own.
+DEFAULT_HUB = {'name': "{user}'s VC", 'user_limit': 0, 'bitrate': None, 'category_id': None}
 
-class VoicePanel(discord.ui.View):
-    def __init__(self, owner_id: int, vm: 'VoiceMaster', channel_id: int, *, timeout: Optional[float] = None):
-        # Keep the panel responsive for the lifetime of the process
-        super().__init__(timeout=timeout)
-        self.owner_id = owner_id
-        self.vm = vm
+
+def load_registry() -> Dict[str, Dict]:
+    if not os.path.exists(REGISTRY_FILE):
+        return {}
+    try:
+        with open(REGISTRY_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def save_registry(data: Dict[str, Dict]) -> None:
+    try:
+        with open(REGISTRY_FILE, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    except Exception:
+        pass
+
+
+def load_pool() -> Dict[int, List[int]]:
+    if not os.path.exists(POOL_FILE):
+        return {}
+    try:
+        with open(POOL_FILE, 'r', encoding='utf-8') as f:
+            return {int(k): [int(x) for x in v] for k, v in json.load(f).items()}
+    except Exception:
+        return {}
+
+
+def save_pool(pool: Dict[int, List[int]]) -> None:
+    try:
+        with open(POOL_FILE, 'w', encoding='utf-8') as f:
+            json.dump({str(k): v for k, v in pool.items() if v}, f, indent=2)
+    except Exception:
+        pass
+
+
+# Panel buttons carry the temp channel id in their custom_id (``vm:<action>:<channel_id>``)
+# and are registered once with add_dynamic_items, so no View object is kept per channel
+# and panels keep working across restarts. Owner and bans are read from the VoiceMaster
+# registry on each click. Panels sent before this used ``vm_<action>`` and were always
+# posted in the VC chat, so for those the channel is the one the click came from.
+PANEL_BUTTONS = [
+    ('lock', 'Lock'), ('unlock', 'Unlock'), ('reveal', 'Reveal'), ('hide', 'Hide'),
+    ('rename', 'Rename'), ('claim', 'Claim'), ('transfer', 'Transfer'), ('delete', 'Delete'),
+    ('kick', 'Kick'), ('ban', 'Ban'), ('unban', 'Unban'), ('set_limit', 'Set Limit'),
+    ('increase', 'Increase'), ('decrease', 'Decrease'), ('info', 'Information'),
+]
+PANEL_LABELS = dict(PANEL_BUTTONS)
+
+
+def _user_id_from(raw: str) -> Optional[int]:
+    m = re.search(r"(\d{15,25})", raw)
+    return int(m.group(1)) if m else None
+
+
+class VoicePanelButton(discord.ui.DynamicItem[discord.ui.Button], template=r'vm[:_](?P<action>[a-z_]+?)(?::(?P<channel_id>[0-9]+))?$'):
+    def __init__(self, action: str, channel_id: Optional[int]) -> None:
+        custom_id = f'vm:{action}:{channel_id}' if channel_id else f'vm_{action}'
+        super().__init__(discord.ui.Button(label=PANEL_LABELS.get(action, action), style=discord.ButtonStyle.secondary, custom_id=custom_id))
+        self.action = action
         self.channel_id = channel_id
+        self.vm: Optional['VoiceMaster'] = None
+        self.channel: Optional[discord.VoiceChannel] = None
 
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match, /):  # type: ignore[override]
+        panel = cls(match['action'], int(match['channel_id']) if match['channel_id'] else None)
+        if panel.channel_id is None:
+            panel.channel_id = interaction.channel_id
+        panel.vm = interaction.client.get_cog('VoiceMaster')  # type: ignore[attr-defined]
+        channel = interaction.client.get_channel(panel.channel_id) if panel.channel_id else None
+        panel.channel = channel if isinstance(channel, discord.VoiceChannel) else None
+        return panel
+
+    @property
+    def owner_id(self) -> Optional[int]:
+        return self.vm.owner_by_channel.get(self.channel_id) if self.vm and self.channel_id else None
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:  # type: ignore[override]
+        owner_id = self.owner_id
+        if self.channel is None or owner_id is None:
+            await interaction.response.send_message("This voice channel is no longer managed by VoiceMaster.", ephemeral=True)
+            return False
         # Allow owner for everything
-        if interaction.user.id == self.owner_id:
+        if interaction.user.id == owner_id:
             return True
         # Permit claim when original owner is not in channel
-        cid = (interaction.data or {}).get('custom_id')
-        if cid == 'vm_claim':
-            channel = interaction.channel
-            if isinstance(channel, discord.VoiceChannel):
-                if all(m.id != self.owner_id for m in channel.members):
-                    return True
-                await interaction.response.send_message("Original owner is still in the channel.", ephemeral=True)
-                return False
+        if self.action == 'claim':
+            if all(m.id != owner_id for m in self.channel.members):
+                return True
+            await interaction.response.send_message("Original owner is still in the channel.", ephemeral=True)
+            return False
         # Non-owners get a clear ephemeral notice
-        try:
-            owner_mention = f"<@{self.owner_id}>"
-        except Exception:
-            owner_mention = "the channel owner"
         await interaction.response.send_message(
-            f"Only the VC owner can configure this channel. Ask {owner_mention} or use Claim if they're gone.",
+            f"Only the VC owner can configure this channel. Ask <@{owner_id}> or use Claim if they're gone.",
             ephemeral=True,
         )
         return False
 
-    @discord.ui.button(label='Lock', style=discord.ButtonStyle.secondary, custom_id='vm_lock')
-    async def lock(self, interaction: discord.Interaction, button: discord.ui.Button):
-        channel: discord.VoiceChannel = interaction.channel  # type: ignore
-        everyone = interaction.guild.default_role  # type: ignore
-        overwrites = channel.overwrites_for(everyone)
-        overwrites.connect = False
-        await channel.set_permissions(everyone, overwrite=overwrites)
-        await interaction.response.send_message("Channel locked (no one can connect).", ephemeral=True)
+    async def callback(self, interaction: discord.Interaction) -> None:  # type: ignore[override]
+        handler = getattr(self, f'_{self.action}', None)
+        if handler is not None:
+            await handler(interaction, self.channel)
 
-    @discord.ui.button(label='Unlock', style=discord.ButtonStyle.secondary, custom_id='vm_unlock')
-    async def unlock(self, interaction: discord.Interaction, button: discord.ui.Button):
-        channel: discord.VoiceChannel = interaction.channel  # type: ignore
-        everyone = interaction.guild.default_role  # type: ignore
+    async def _set_everyone(self, interaction: discord.Interaction, channel: discord.VoiceChannel, message: str, **perms) -> None:
+        everyone = channel.guild.default_role
         overwrites = channel.overwrites_for(everyone)
-        overwrites.connect = True
+        overwrites.update(**perms)
         await channel.set_permissions(everyone, overwrite=overwrites)
-        await interaction.response.send_message("Channel unlocked (everyone can connect).", ephemeral=True)
+        await interaction.response.send_message(message, ephemeral=True)
 
-    @discord.ui.button(label='Reveal', style=discord.ButtonStyle.secondary, custom_id='vm_reveal')
-    async def reveal(self, interaction: discord.Interaction, button: discord.ui.Button):
-        channel: discord.VoiceChannel = interaction.channel  # type: ignore
-        everyone = interaction.guild.default_role  # type: ignore
-        overwrites = channel.overwrites_for(everyone)
-        overwrites.view_channel = True
-        await channel.set_permissions(everyone, overwrite=overwrites)
-        await interaction.response.send_message("Channel revealed.", ephemeral=True)
+    async def _lock(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
+        await self._set_everyone(interaction, channel, "Channel locked (no one can connect).", connect=False)
 
-    @discord.ui.button(label='Hide', style=discord.ButtonStyle.secondary, custom_id='vm_hide')
-    async def hide(self, interaction: discord.Interaction, button: discord.ui.Button):
-        channel: discord.VoiceChannel = interaction.channel  # type: ignore
-        everyone = interaction.guild.default_role  # type: ignore
-        overwrites = channel.overwrites_for(everyone)
-        overwrites.view_channel = False
-        await channel.set_permissions(everyone, overwrite=overwrites)
-        await interaction.response.send_message("Channel hidden.", ephemeral=True)
+    async def _unlock(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
+        await self._set_everyone(interaction, channel, "Channel unlocked (everyone can connect).", connect=True)
+
+    async def _reveal(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
+        await self._set_everyone(interaction, channel, "Channel revealed.", view_channel=True)
 
-    
+    async def _hide(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
+        await self._set_everyone(interaction, channel, "Channel hidden.", view_channel=False)
 
-    @discord.ui.button(label='Rename', style=discord.ButtonStyle.secondary, custom_id='vm_rename')
-    async def rename(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def _rename(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
         class RenameModal(discord.ui.Modal, title="Rename Voice Channel"):
             def __init__(self) -> None:
                 super().__init__()
@@ -91,34 +164,28 @@ class VoicePanel(discord.ui.View):
                 self.add_item(self.name_input)
 
             async def on_submit(self, inter: discord.Interaction) -> None:  # type: ignore[override]
-                ch = inter.channel
-                if not isinstance(ch, discord.VoiceChannel):
-                    await inter.response.send_message("Not in a voice channel.", ephemeral=True)
-                    return
                 new_name = str(self.name_input.value).strip()[:96]
-                await ch.edit(name=new_name)
+                await channel.edit(name=new_name)
                 await inter.response.send_message("Channel renamed.", ephemeral=True)
 
         await interaction.response.send_modal(RenameModal())
-    @discord.ui.button(label='Claim', style=discord.ButtonStyle.secondary, custom_id='vm_claim')
-    async def claim(self, interaction: discord.Interaction, button: discord.ui.Button):
+
+    async def _claim(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
         # Transfer ownership to the user
         # Only allow claim if the previous owner is not present
-        channel = interaction.channel
-        if isinstance(channel, discord.VoiceChannel):
-            if any(m.id == self.owner_id for m in channel.members):
-                await interaction.response.send_message("Original owner is still in the channel.", ephemeral=True)
-                return
-        self.owner_id = interaction.user.id
-        self.vm.owner_by_channel[self.channel_id] = self.owner_id
+        if any(m.id == self.owner_id for m in channel.members):
+            await interaction.response.send_message("Original owner is still in the channel.", ephemeral=True)
+            return
+        self.vm.set_owner(channel.id, interaction.user.id)
         await interaction.response.send_message("You are now the channel owner.", ephemeral=True)
 
-    @discord.ui.button(label='Transfer', style=discord.ButtonStyle.secondary, custom_id='vm_transfer')
-    async def transfer(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def _transfer(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
         # Only current owner may transfer ownership
         if interaction.user.id != self.owner_id:
             await interaction.response.send_message("Only the VC owner can transfer ownership.", ephemeral=True)
             return
+        panel = self
+
         class TransferModal(discord.ui.Modal, title="Transfer VC Ownership"):
             def __init__(self) -> None:
                 super().__init__()
@@ -131,55 +198,38 @@ class VoicePanel(discord.ui.View):
                 self.add_item(self.user_input)
 
             async def on_submit(self, inter: discord.Interaction) -> None:  # type: ignore[override]
-                ch = inter.channel
-                if not isinstance(ch, discord.VoiceChannel):
-                    await inter.response.send_message("Not in a voice channel.", ephemeral=True)
-                    return
-                import re
-                raw = str(self.user_input.value).strip()
-                m = re.search(r"(\d{15,25})", raw)
-                uid = int(m.group(1)) if m else None
+                uid = _user_id_from(str(self.user_input.value).strip())
                 if not uid:
                     await inter.response.send_message("Couldn't read that user.", ephemeral=True)
                     return
-                member = ch.guild.get_member(uid)
-                if not member or member not in ch.members:
+                member = channel.guild.get_member(uid)
+                if not member or member not in channel.members:
                     await inter.response.send_message("Target must be in this voice channel.", ephemeral=True)
                     return
-                view_ref: VoicePanel = inter.view  # type: ignore
-                if member.id == view_ref.owner_id:
+                if member.id == panel.owner_id:
                     await inter.response.send_message("That user already owns this VC.", ephemeral=True)
                     return
                 # Transfer ownership
-                view_ref.owner_id = member.id
-                view_ref.vm.owner_by_channel[view_ref.channel_id] = member.id
+                panel.vm.set_owner(channel.id, member.id)
                 await inter.response.send_message(f"Transferred ownership to {member.mention}.", ephemeral=True)
 
         await interaction.response.send_modal(TransferModal())
 
-    @discord.ui.button(label='Delete', style=discord.ButtonStyle.secondary, custom_id='vm_delete')
-    async def delete(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def _delete(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
         if interaction.user.id != self.owner_id:
             await interaction.response.send_message("Only the channel owner can delete this VC.", ephemeral=True)
             return
-        ch = interaction.channel
-        self.vm.owner_by_channel.pop(self.channel_id, None)
+        self.vm.forget_channel(channel.id)
         try:
             await interaction.response.send_message("Deleting...", ephemeral=True)
-            await ch.delete(reason="VoiceMaster owner delete")  # type: ignore
+            await channel.delete(reason="VoiceMaster owner delete")
         except Exception:
             pass
 
     # ---- member management (kick / ban / unban) ----
-    def _channel_and_members(self, interaction: discord.Interaction) -> Optional[tuple[discord.VoiceChannel, List[discord.Member]]]:
-        ch = interaction.channel
-        if not isinstance(ch, discord.VoiceChannel):
-            return None
-        members = list(ch.members)
-        return ch, members
+    async def _kick(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
+        panel = self
 
-    @discord.ui.button(label='Kick', style=discord.ButtonStyle.secondary, custom_id='vm_kick')
-    async def kick_member(self, interaction: discord.Interaction, button: discord.ui.Button):
         class KickModal(discord.ui.Modal, title="Kick Member from VC"):
             def __init__(self) -> None:
                 super().__init__()
@@ -192,21 +242,12 @@ class VoicePanel(discord.ui.View):
                 self.add_item(self.user_input)
 
             async def on_submit(self, inter: discord.Interaction) -> None:  # type: ignore[override]
-                ch = inter.channel
-                if not isinstance(ch, discord.VoiceChannel):
-                    await inter.response.send_message("Not in a voice channel.", ephemeral=True)
-                    return
-                raw = str(self.user_input.value).strip()
-                uid = None
-                import re
-                m = re.search(r"(\d{15,25})", raw)
-                if m:
-                    uid = int(m.group(1))
-                member = ch.guild.get_member(uid) if uid else None  # type: ignore
+                uid = _user_id_from(str(self.user_input.value).strip())
+                member = channel.guild.get_member(uid) if uid else None
                 if not member:
                     await inter.response.send_message("Couldn't find that user.", ephemeral=True)
                     return
-                if member.id == getattr(inter.view, 'owner_id', 0):  # type: ignore[attr-defined]
+                if member.id == panel.owner_id:
                     await inter.response.send_message("You cannot kick the channel owner.", ephemeral=True)
                     return
                 try:
@@ -222,8 +263,9 @@ class VoicePanel(discord.ui.View):
 
         await interaction.response.send_modal(KickModal())
 
-    @discord.ui.button(label='Ban', style=discord.ButtonStyle.secondary, custom_id='vm_ban')
-    async def ban_member(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def _ban(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
+        panel = self
+
         class BanModal(discord.ui.Modal, title="Ban Member from this VC"):
             def __init__(self) -> None:
                 super().__init__()
@@ -236,31 +278,22 @@ class VoicePanel(discord.ui.View):
                 self.add_item(self.user_input)
 
             async def on_submit(self, inter: discord.Interaction) -> None:  # type: ignore[override]
-                ch = inter.channel
-                if not isinstance(ch, discord.VoiceChannel):
-                    await inter.response.send_message("Not in a voice channel.", ephemeral=True)
-                    return
-                raw = str(self.user_input.value).strip()
-                import re
-                m = re.search(r"(\d{15,25})", raw)
-                uid = int(m.group(1)) if m else None
-                member = ch.guild.get_member(uid) if uid else None  # type: ignore
+                uid = _user_id_from(str(self.user_input.value).strip())
+                member = channel.guild.get_member(uid) if uid else None
                 if not member:
                     await inter.response.send_message("Couldn't find that user.", ephemeral=True)
                     return
-                if member.id == getattr(inter.view, 'owner_id', 0):  # type: ignore[attr-defined]
+                if member.id == panel.owner_id:
                     await inter.response.send_message("You cannot ban the channel owner.", ephemeral=True)
                     return
-                ow = ch.overwrites_for(member)
+                ow = channel.overwrites_for(member)
                 ow.connect = False
-                await ch.set_permissions(member, overwrite=ow)
+                await channel.set_permissions(member, overwrite=ow)
                 try:
                     await member.move_to(None, reason="VoiceMaster VC ban")
                 except Exception:
                     pass
-                self_ref = getattr(inter.view, 'vm', None)  # type: ignore[attr-defined]
-                if self_ref:
-                    self_ref.banned_by_channel.setdefault(ch.id, set()).add(member.id)
+                panel.vm.set_banned(channel.id, member.id, True)
                 embed = discord.Embed(description=f"Banned {member.mention} from this VC.", color=0xFFFFFF)
                 try:
                     embed.set_thumbnail(url=member.display_avatar.url)
@@ -270,8 +303,9 @@ class VoicePanel(discord.ui.View):
 
         await interaction.response.send_modal(BanModal())
 
-    @discord.ui.button(label='Unban', style=discord.ButtonStyle.secondary, custom_id='vm_unban')
-    async def unban_member(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def _unban(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
+        panel = self
+
         class UnbanModal(discord.ui.Modal, title="Unban Member for this VC"):
             def __init__(self) -> None:
                 super().__init__()
@@ -284,26 +318,18 @@ class VoicePanel(discord.ui.View):
                 self.add_item(self.user_input)
 
             async def on_submit(self, inter: discord.Interaction) -> None:  # type: ignore[override]
-                ch = inter.channel
-                if not isinstance(ch, discord.VoiceChannel):
-                    await inter.response.send_message("Not in a voice channel.", ephemeral=True)
-                    return
-                import re
-                raw = str(self.user_input.value).strip()
-                m = re.search(r"(\d{15,25})", raw)
-                uid = int(m.group(1)) if m else None
+                uid = _user_id_from(str(self.user_input.value).strip())
                 if not uid:
                     await inter.response.send_message("Couldn't read that user.", ephemeral=True)
                     return
-                member = ch.guild.get_member(uid)
+                member = channel.guild.get_member(uid)
                 target = member or discord.Object(id=uid)
                 try:
-                    await ch.set_permissions(target, overwrite=None)
+                    await channel.set_permissions(target, overwrite=None)
                 except Exception:
                     pass
-                s = getattr(inter.view, 'vm', None)
-                if s and uid in s.banned_by_channel.get(ch.id, set()):
-                    s.banned_by_channel.get(ch.id, set()).discard(uid)
+                if uid in panel.vm.banned_by_channel.get(channel.id, set()):
+                    panel.vm.set_banned(channel.id, uid, False)
                 embed = discord.Embed(description=f"Unbanned <@{uid}> for this VC.", color=0xFFFFFF)
                 if member:
                     try:
@@ -315,8 +341,7 @@ class VoicePanel(discord.ui.View):
         await interaction.response.send_modal(UnbanModal())
 
     # Set limit via modal
-    @discord.ui.button(label='Set Limit', style=discord.ButtonStyle.secondary, custom_id='vm_set_limit')
-    async def set_limit(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def _set_limit(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
         class SetLimitModal(discord.ui.Modal, title="Set User Limit"):
             def __init__(self) -> None:
                 super().__init__()
@@ -329,10 +354,6 @@ class VoicePanel(discord.ui.View):
                 self.add_item(self.limit_input)
 
             async def on_submit(self, inter: discord.Interaction) -> None:  # type: ignore[override]
-                ch = inter.channel
-                if not isinstance(ch, discord.VoiceChannel):
-                    await inter.response.send_message("Not in a voice channel.", ephemeral=True)
-                    return
                 raw = str(self.limit_input.value or '').strip()
                 if raw == "":
                     new_limit = 0
@@ -342,50 +363,32 @@ class VoicePanel(discord.ui.View):
                     except Exception:
                         await inter.response.send_message("Please provide a valid number between 0 and 99.", ephemeral=True)
                         return
-                await ch.edit(user_limit=new_limit)
-                await inter.response.send_message(f"User limit set to {ch.user_limit}.", ephemeral=True)
+                await channel.edit(user_limit=new_limit)
+                await inter.response.send_message(f"User limit set to {channel.user_limit}.", ephemeral=True)
 
         await interaction.response.send_modal(SetLimitModal())
 
-    @discord.ui.button(label='Increase', style=discord.ButtonStyle.secondary, custom_id='vm_increase')
-    async def increase_limit(self, interaction: discord.Interaction, button: discord.ui.Button):
-        channel: discord.VoiceChannel = interaction.channel  # type: ignore
-        if not isinstance(channel, discord.VoiceChannel):
-            await interaction.response.send_message("Not in a voice channel.", ephemeral=True)
-            return
-        
+    async def _increase(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
         current_limit = channel.user_limit or 0
         if current_limit >= 99:
             await interaction.response.send_message("User limit is already at maximum (99).", ephemeral=True)
             return
-        
+
         new_limit = min(99, current_limit + 1)
         await channel.edit(user_limit=new_limit)
         await interaction.response.send_message(f"User limit increased to {new_limit}.", ephemeral=True)
 
-    @discord.ui.button(label='Decrease', style=discord.ButtonStyle.secondary, custom_id='vm_decrease')
-    async def decrease_limit(self, interaction: discord.Interaction, button: discord.ui.Button):
-        channel: discord.VoiceChannel = interaction.channel  # type: ignore
-        if not isinstance(channel, discord.VoiceChannel):
-            await interaction.response.send_message("Not in a voice channel.", ephemeral=True)
-            return
-        
+    async def _decrease(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
         current_limit = channel.user_limit or 0
         if current_limit <= 0:
             await interaction.response.send_message("User limit is already at minimum (0).", ephemeral=True)
             return
-        
+
         new_limit = max(0, current_limit - 1)
         await channel.edit(user_limit=new_limit)
         await interaction.response.send_message(f"User limit decreased to {new_limit}.", ephemeral=True)
 
-    @discord.ui.button(label='Information', style=discord.ButtonStyle.secondary, custom_id='vm_info')
-    async def show_info(self, interaction: discord.Interaction, button: discord.ui.Button):
-        channel: discord.VoiceChannel = interaction.channel  # type: ignore
-        if not isinstance(channel, discord.VoiceChannel):
-            await interaction.response.send_message("Not in a voice channel.", ephemeral=True)
-            return
-        
+    async def _info(self, interaction: discord.Interaction, channel: discord.VoiceChannel) -> None:
         embed = discord.Embed(title="Voice Channel Information", color=0xFFFFFF)
         embed.add_field(name="Channel Name", value=channel.name, inline=True)
         embed.add_field(name="User Limit", value=f"{channel.user_limit or 'No limit'}", inline=True)
@@ -393,15 +396,342 @@ class VoicePanel(discord.ui.View):
         embed.add_field(name="Category", value=channel.category.name if channel.category else "None", inline=True)
         embed.add_field(name="Created At", value=f"<t:{int(channel.created_at.timestamp())}:R>", inline=True)
         embed.add_field(name="Owner", value=f"<@{self.owner_id}>", inline=True)
-        
+
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+
+class VoicePanel(discord.ui.View):
+    """The buttons for one temp channel's panel. Only used to send it; clicks are
+    dispatched to a fresh VoicePanelButton, so nothing is kept once it is sent."""
+
+    def __init__(self, channel_id: int) -> None:
+        super().__init__(timeout=None)
+        for action, _ in PANEL_BUTTONS:
+            self.add_item(VoicePanelButton(action, channel_id))
+
+
+class CleanupScheduler:
+    """Deletes temp channels that stay empty for their guild's grace period.
+
+    Arming records a deadline and a rejoin removes it; a single loop timer
+    fires for the earliest deadline, so no coroutine sleeps per channel.
+    Channels that come due together are deleted in small batches.
+    """
+
+    def __init__(self, vm: 'VoiceMaster') -> None:
+        self.vm = vm
+        self._due: Dict[int, float] = {}  # channel_id -> monotonic deadline
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushing: Optional[asyncio.Task] = None
+
+    def arm(self, channel_id: int, grace: float) -> None:
+        self._due[channel_id] = time.monotonic() + grace
+        self._reschedule()
+
+    def cancel(self, channel_id: int) -> None:
+        self._due.pop(channel_id, None)
+
+    def pending(self) -> int:
+        return len(self._due)
+
+    def _reschedule(self) -> None:
+        if self._flushing is not None:
+            return  # the flush reschedules when it finishes
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._due:
+            delay = max(0.0, min(self._due.values()) - time.monotonic())
+            self._timer = asyncio.get_running_loop().call_later(delay, self._fire)
+
+    def _fire(self) -> None:
+        self._timer = None
+        self._flushing = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        try:
+            now = time.monotonic()
+            due = [cid for cid, at in self._due.items() if at <= now]
+            for cid in due:
+                del self._due[cid]
+            channels = [ch for ch in map(self.vm.bot.get_channel, due) if isinstance(ch, discord.VoiceChannel)]
+            for i in range(0, len(channels), CLEANUP_BATCH):
+                if i:
+                    await asyncio.sleep(CLEANUP_PAUSE)
+                batch = [ch for ch in channels[i:i + CLEANUP_BATCH] if ch.id not in self._due]  # re-armed meanwhile
+                await asyncio.gather(*(self.vm._delete_if_empty(ch, "VoiceMaster auto-clean") for ch in batch))
+        finally:
+            self._flushing = None
+            self._reschedule()
+
+    def shutdown(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._flushing is not None:
+            self._flushing.cancel()
+
+
 class VoiceMaster(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         self.config: Dict[str, Dict] = self.load_config()
+        # hub channel_id -> template overrides, for every enabled guild
+        self.hubs: Dict[int, Dict] = {}
+        self._rebuild_hubs()
         self.owner_by_channel: Dict[int, int] = {}
         self.banned_by_channel: Dict[int, Set[int]] = {}
+        # channel_id -> {'guild_id', 'panel_message_id', 'created_at'}
+        self.temp_channels: Dict[int, Dict] = {}
+        self._reconciled = False
+        self.cleanup = CleanupScheduler(self)
+        self.analytics = get_voice_analytics(bot)
+        # guild_id -> ids of hidden spare channels, oldest first
+        self.pool: Dict[int, List[int]] = load_pool()
+        self._refills: Dict[int, asyncio.Task] = {}
+        self._rehydrate()
+
+    async def cog_load(self) -> None:
+        self.bot.add_dynamic_items(VoicePanelButton)
+        # After a hot reload the bot is already connected; otherwise on_ready triggers it
+        if self.bot.is_ready():
+            asyncio.create_task(self._reconcile())
+
+    async def cog_unload(self) -> None:
+        self.bot.remove_dynamic_items(VoicePanelButton)
+        self.cleanup.shutdown()
+        for task in self._refills.values():
+            task.cancel()
+
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        if not self._reconciled:
+            await self._reconcile()
+
+    # --------------- temp channel registry ---------------
+    def _rehydrate(self) -> None:
+        for key, entry in load_registry().items():
+            channel_id = int(key)
+            self.owner_by_channel[channel_id] = int(entry['owner_id'])
+            if entry.get('banned'):
+                self.banned_by_channel[channel_id] = {int(x) for x in entry['banned']}
+            self.temp_channels[channel_id] = {
+                'guild_id': entry.get('guild_id'),
+                'panel_message_id': entry.get('panel_message_id'),
+                'created_at': entry.get('created_at'),
+            }
+
+    def _save_registry(self) -> None:
+        data: Dict[str, Dict] = {}
+        for channel_id, owner_id in self.owner_by_channel.items():
+            meta = self.temp_channels.get(channel_id, {})
+            data[str(channel_id)] = {
+                'guild_id': meta.get('guild_id'),
+                'owner_id': owner_id,
+                'banned': sorted(self.banned_by_channel.get(channel_id, ())),
+                'panel_message_id': meta.get('panel_message_id'),
+                'created_at': meta.get('created_at'),
+            }
+        save_registry(data)
+
+    def register_channel(self, channel: discord.VoiceChannel, owner_id: int) -> None:
+        self.owner_by_channel[channel.id] = owner_id
+        self.temp_channels[channel.id] = {'guild_id': channel.guild.id, 'panel_message_id': None, 'created_at': int(time.time())}
+        self._save_registry()
+        self.analytics.channel_created(channel.guild.id, channel.id)
+
+    def set_panel(self, channel_id: int, message_id: int) -> None:
+        if channel_id in self.owner_by_channel:
+            self.temp_channels.setdefault(channel_id, {})['panel_message_id'] = message_id
+            self._save_registry()
+
+    def set_owner(self, channel_id: int, owner_id: int) -> None:
+        self.owner_by_channel[channel_id] = owner_id
+        self._save_registry()
+
+    def set_banned(self, channel_id: int, user_id: int, banned: bool) -> None:
+        if banned:
+            self.banned_by_channel.setdefault(channel_id, set()).add(user_id)
+        else:
+            self.banned_by_channel.get(channel_id, set()).discard(user_id)
+        self._save_registry()
+
+    def forget_channel(self, channel_id: int, save: bool = True) -> None:
+        if self.owner_by_channel.pop(channel_id, None) is not None:
+            guild_id = self.temp_channels.get(channel_id, {}).get('guild_id')
+            if guild_id:
+                self.analytics.channel_deleted(guild_id, channel_id)
+        self.banned_by_channel.pop(channel_id, None)
+        self.temp_channels.pop(channel_id, None)
+        self.cleanup.cancel(channel_id)
+        if save:
+            self._save_registry()
+
+    async def _delete_if_empty(self, channel: discord.VoiceChannel, reason: str) -> None:
+        if channel.members:
+            return
+        try:
+            await channel.delete(reason=reason)
+        except discord.NotFound:
+            pass
+        except Exception as e:
+            print(f"[VoiceMaster] Failed to delete {channel.id}: {e}")
+            return
+        self.forget_channel(channel.id)
+
+    async def _reconcile(self) -> None:
+        """Drop entries for deleted temp channels and schedule cleanup of the ones left empty by a restart."""
+        self._reconciled = True
+        orphans = 0
+        for channel_id in list(self.owner_by_channel):
+            guild = self.bot.get_guild(self.temp_channels.get(channel_id, {}).get('guild_id') or 0)
+            if guild is None:
+                continue  # unavailable right now; keep the entry
+            channel = guild.get_channel(channel_id)
+            if not isinstance(channel, discord.VoiceChannel):
+                self.forget_channel(channel_id, save=False)
+            else:
+                self.analytics.seed(guild.id, channel_id, self.temp_channels[channel_id].get('created_at'), [m.id for m in channel.members])
+                if not channel.members:
+                    self.cleanup.arm(channel_id, self.cleanup_grace(guild.id))
+                    orphans += 1
+        self._save_registry()
+        if orphans:
+            print(f"[VoiceMaster] Scheduled cleanup of {orphans} empty temp channel(s) left from before restart")
+        for guild_id in set(self.pool) | {int(g) for g in self.config}:
+            guild = self.bot.get_guild(guild_id)
+            if guild is None:
+                continue
+            self.pool[guild_id] = [cid for cid in self.pool.get(guild_id, []) if isinstance(guild.get_channel(cid), discord.VoiceChannel)]
+            self.refill_pool(guild)
+        save_pool(self.pool)
+
+    # --------------- warm pool ---------------
+    def pool_size(self, guild_id: int) -> int:
+        entry = self.config.get(str(guild_id)) or {}
+        if not entry.get('enabled'):
+            return 0
+        return int(entry.get('warm_pool', 0))
+
+    def _take_spare(self, guild: discord.Guild, category_id: Optional[int]) -> Optional[discord.VoiceChannel]:
+        spares = self.pool.get(guild.id)
+        if not spares:
+            return None
+        taken: Optional[discord.VoiceChannel] = None
+        for channel_id in list(spares):
+            channel = guild.get_channel(channel_id)
+            if not isinstance(channel, discord.VoiceChannel):
+                spares.remove(channel_id)
+            elif channel.category_id == category_id and not channel.members:
+                spares.remove(channel_id)
+                taken = channel
+                break
+        save_pool(self.pool)
+        return taken
+
+    def _return_spare(self, channel: discord.VoiceChannel) -> None:
+        self.pool.setdefault(channel.guild.id, []).insert(0, channel.id)
+        save_pool(self.pool)
+
+    def refill_pool(self, guild: discord.Guild) -> None:
+        """Bring the guild's pool to its configured size in the background."""
+        task = self._refills.get(guild.id)
+        if task is not None and not task.done():
+            return
+        if len(self.pool.get(guild.id, [])) != self.pool_size(guild.id):
+            self._refills[guild.id] = asyncio.create_task(self._refill(guild.id))
+
+    async def _refill(self, guild_id: int) -> None:
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            return
+        spares = self.pool.setdefault(guild_id, [])
+        # Shrink first (pool disabled or made smaller)
+        while len(spares) > self.pool_size(guild_id):
+            channel = guild.get_channel(spares.pop())
+            save_pool(self.pool)
+            if channel is not None:
+                try:
+                    await channel.delete(reason="VoiceMaster warm pool shrink")
+                except Exception:
+                    pass
+        join_id = self.get_join_channel_id(guild_id)
+        join = guild.get_channel(join_id) if join_id else None
+        if not isinstance(join, discord.VoiceChannel):
+            return
+        while len(spares) < self.pool_size(guild_id):
+            # Same permissions as the category, but hidden from everyone until claimed
+            overwrites = dict(join.category.overwrites) if join.category else {}
+            hidden = overwrites.get(guild.default_role, discord.PermissionOverwrite())
+            hidden.update(view_channel=False)
+            overwrites[guild.default_role] = hidden
+            overwrites[guild.me] = discord.PermissionOverwrite(view_channel=True, connect=True, send_messages=True, embed_links=True)
+            try:
+                channel = await guild.create_voice_channel(name=SPARE_NAME, category=join.category, overwrites=overwrites, reason="VoiceMaster warm pool")
+            except Exception as e:
+                print(f"[VoiceMaster] Failed to refill warm pool for {guild_id}: {e}")
+                return
+            spares.append(channel.id)
+            save_pool(self.pool)
+
+    async def _claim_spare(self, member: discord.Member, category: Optional[discord.CategoryChannel], **fields) -> Optional[discord.VoiceChannel]:
+        """Move ``member`` into a spare in ``category``, then apply ``fields`` and reveal it; None if there is none."""
+        spare = self._take_spare(member.guild, category.id if category else None)
+        if spare is None:
+            return None
+        # The move is the only call the member waits on; the rest happens once they're in
+        try:
+            await member.move_to(spare, reason="VoiceMaster move")
+        except Exception:
+            self._return_spare(spare)
+            return None
+        self.register_channel(spare, member.id)
+        overwrites = dict(spare.overwrites)
+        base = spare.category.overwrites.get(member.guild.default_role) if spare.category else None
+        if base is None:
+            overwrites.pop(member.guild.default_role, None)
+        else:
+            overwrites[member.guild.default_role] = base
+        try:
+            await spare.edit(overwrites=overwrites, reason="VoiceMaster create", **fields)
+        except Exception as e:
+            print(f"[VoiceMaster] Failed to reveal spare {spare.id}: {e}")
+        self.refill_pool(member.guild)
+        return spare
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        if channel.id in self.owner_by_channel:
+            self.forget_channel(channel.id)
+        if channel.id in self.hubs:
+            self.remove_hub(channel.guild.id, channel.id)
+        spares = self.pool.get(channel.guild.id)
+        if spares and channel.id in spares:
+            spares.remove(channel.id)
+            save_pool(self.pool)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        if self.pool.pop(guild.id, None) is not None:
+            save_pool(self.pool)
+        stale = [cid for cid, meta in self.temp_channels.items() if meta.get('guild_id') == guild.id]
+        for channel_id in stale:
+            self.forget_channel(channel_id, save=False)
+        if stale:
+            self._save_registry()
+
+    # --------------- state handoff for `jsk reload` (see utils/hot_reload.py) ---------------
+    def export_state(self) -> Dict:
+        return {
+            'owner_by_channel': {str(k): v for k, v in self.owner_by_channel.items()},
+            'banned_by_channel': {str(k): sorted(v) for k, v in self.banned_by_channel.items()},
+        }
+
+    def import_state(self, state: Dict) -> None:
+        for k, v in state.get('owner_by_channel', {}).items():
+            self.owner_by_channel[int(k)] = int(v)
+        for k, v in state.get('banned_by_channel', {}).items():
+            self.banned_by_channel.setdefault(int(k), set()).update(int(x) for x in v)
+        self._save_registry()
 
     # --------------- config ---------------
     @staticmethod
@@ -415,6 +745,34 @@ class VoiceMaster(commands.Cog):
     def save_config(self) -> None:
         with open(CONFIG_FILE, 'w') as f:
             json.dump(self.config, f, indent=2)
+        self._rebuild_hubs()
+
+    # --------------- join-to-create hubs ---------------
+    def _rebuild_hubs(self) -> None:
+        hubs: Dict[int, Dict] = {}
+        for entry in self.config.values():
+            if not entry.get('enabled'):
+                continue
+            for channel_id, template in (entry.get('hubs') or {}).items():
+                hubs[int(channel_id)] = template
+            if entry.get('join_channel_id'):
+                hubs.setdefault(int(entry['join_channel_id']), {})
+        self.hubs = hubs
+
+    def hub_template(self, channel_id: int) -> Dict:
+        return {**DEFAULT_HUB, **self.hubs.get(channel_id, {})}
+
+    def remove_hub(self, guild_id: int, channel_id: int) -> bool:
+        entry = self.config.get(str(guild_id))
+        if not entry:
+            return False
+        removed = (entry.get('hubs') or {}).pop(str(channel_id), None) is not None
+        if entry.get('join_channel_id') and int(entry['join_channel_id']) == channel_id:
+            entry['join_channel_id'] = None
+            removed = True
+        if removed:
+            self.save_config()
+        return removed
 
     # --------------- helpers ---------------
     def build_panel(self, member: discord.Member, channel_id: int) -> tuple[discord.Embed, VoicePanel]:
@@ -436,8 +794,12 @@ class VoiceMaster(commands.Cog):
             + grey_strip("**Delete** - Delete your voice channel") + "\n"
             + grey_strip("**Information** - View information on the current voice channel")
         )
-        view = VoicePanel(owner_id=member.id, vm=self, channel_id=channel_id)
+        view = VoicePanel(channel_id)
         return embed, view
+    def cleanup_grace(self, guild_id: int) -> float:
+        entry = self.config.get(str(guild_id)) or {}
+        return float(entry.get('cleanup_grace', CLEANUP_GRACE))
+
     def get_join_channel_id(self, guild_id: int) -> Optional[int]:
         entry = self.config.get(str(guild_id))
         if not entry or not entry.get('enabled'):
@@ -470,19 +832,34 @@ class VoiceMaster(commands.Cog):
         return bool(entry and entry.get('power_enabled'))
 
     async def create_temporary_channel(self, member: discord.Member, join_channel: discord.VoiceChannel) -> Optional[discord.VoiceChannel]:
-        category = join_channel.category
-        name = f"{member.display_name}'s VC"
-        # Some discord.py versions require overwrites to be a dict; use empty dict
+        template = self.hub_template(join_channel.id)
+        category = member.guild.get_channel(template['category_id']) if template['category_id'] else None
+        if not isinstance(category, discord.CategoryChannel):
+            category = join_channel.category
         try:
-            new_vc = await member.guild.create_voice_channel(name=name, category=category, reason="VoiceMaster create")
-        except discord.Forbidden:
-            return None
-        # Move the member
-        try:
-            await member.move_to(new_vc, reason="VoiceMaster move")
-        except Exception:
-            pass
-        self.owner_by_channel[new_vc.id] = member.id
+            name = template['name'].format(user=member.display_name)[:100]
+        except (KeyError, IndexError, ValueError):
+            name = f"{member.display_name}'s VC"
+        fields = {'name': name}
+        if template['user_limit']:
+            fields['user_limit'] = int(template['user_limit'])
+        if template['bitrate']:
+            fields['bitrate'] = min(int(template['bitrate']), int(member.guild.bitrate_limit))
+        new_vc = await self._claim_spare(member, category, **fields)
+        if new_vc is None:
+            # Some discord.py versions require overwrites to be a dict; use empty dict
+            try:
+                new_vc = await member.guild.create_voice_channel(category=category, reason="VoiceMaster create", **fields)
+            except discord.Forbidden:
+                return None
+            # Move the member
+            try:
+                await member.move_to(new_vc, reason="VoiceMaster move")
+            except Exception:
+                pass
+            self.register_channel(new_vc, member.id)
+        if member.voice and member.voice.channel == new_vc:
+            self.analytics.member_joined(member.guild.id, new_vc.id, member.id)
         # Send the panel directly in the voice channel's chat if available; set minimal permission overwrites to allow posting if needed.
         embed, view = self.build_panel(member, new_vc.id)
         # Ensure the bot can speak in the VC chat; if not, grant view/send for the bot user only
@@ -499,8 +876,9 @@ class VoiceMaster(commands.Cog):
         except Exception:
             pass
 
+        panel_msg: Optional[discord.Message] = None
         try:
-            await new_vc.send(embed=embed, view=view)  # type: ignore[attr-defined]
+            panel_msg = await new_vc.send(embed=embed, view=view)  # type: ignore[attr-defined]
         except Exception as e:
             # Fallback 1: a text channel in the same category
             fallback: Optional[discord.TextChannel] = None
@@ -536,49 +914,41 @@ class VoiceMaster(commands.Cog):
             if fallback is not None:
                 try:
                     note = f"Panel for {new_vc.mention} (couldn't post in the voice chat due to permissions or API limits)."
-                    await fallback.send(content=note, embed=embed, view=view)
+                    panel_msg = await fallback.send(content=note, embed=embed, view=view)
                 except Exception as e2:
                     print(f"[VoiceMaster] Failed to send panel to fallback channel: {e2}")
             else:
                 # Final fallback: DM the owner
                 try:
-                    await member.send(content="Here is your VoiceMaster panel (use it to control your VC):", embed=embed, view=view)
+                    panel_msg = await member.send(content="Here is your VoiceMaster panel (use it to control your VC):", embed=embed, view=view)
                 except Exception as e3:
                     print(f"[VoiceMaster] Failed to DM panel: {e3}")
             print(f"[VoiceMaster] Failed to send panel in voice chat: {e}")
+        if panel_msg is not None:
+            self.set_panel(new_vc.id, panel_msg.id)
         return new_vc
 
     # --------------- events ---------------
     @commands.Cog.listener()
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
-        # Joined a channel -> create new VC if it's the join channel
-        try:
-            join_id = self.get_join_channel_id(member.guild.id)
-            if after.channel:
-                # Debug log
-                print(f"[VoiceMaster] {member} joined {after.channel} (join_id={join_id})")
-                is_join = False
-                if join_id is not None and after.channel.id == join_id:
-                    is_join = True
-                elif after.channel.name and after.channel.name.lower().startswith('join to create'):
-                    is_join = True
-                if is_join:
-                    created = await self.create_temporary_channel(member, after.channel)
-                    print(f"[VoiceMaster] created VC: {created}")
-                    return
-        except Exception as e:
-            print(f"[VoiceMaster] on_voice_state_update error: {e}")
-        # Left a temporary channel -> delete if empty after 3 seconds
+        moved = before.channel != after.channel
+        # Rejoined a temporary channel -> keep it
+        if after.channel and after.channel.id in self.owner_by_channel:
+            self.cleanup.cancel(after.channel.id)
+            if moved:
+                self.analytics.member_joined(member.guild.id, after.channel.id, member.id)
+        # Left a temporary channel -> delete it once it has stayed empty for the grace period
         target_channel = before.channel
-        if target_channel and target_channel.id in self.owner_by_channel:
-            await asyncio.sleep(3)
-            # If still empty, delete
-            if target_channel and len(target_channel.members) == 0:
-                try:
-                    await target_channel.delete(reason="VoiceMaster auto-clean")
-                except Exception:
-                    pass
-                self.owner_by_channel.pop(target_channel.id, None)
+        if target_channel and target_channel.id in self.owner_by_channel and moved:
+            self.analytics.member_left(member.guild.id, target_channel.id, member.id)
+            if not target_channel.members:
+                self.cleanup.arm(target_channel.id, self.cleanup_grace(member.guild.id))
+        # Joined a join-to-create hub -> create their VC
+        if after.channel is not None and after.channel.id in self.hubs and before.channel != after.channel:
+            try:
+                await self.create_temporary_channel(member, after.channel)
+            except Exception as e:
+                print(f"[VoiceMaster] on_voice_state_update error: {e}")
 
     # --------------- commands ---------------
     @commands.group(name='voice', invoke_without_command=True)
@@ -626,6 +996,128 @@ class VoiceMaster(commands.Cog):
         """Show VoiceMaster status (no underscores)."""
         await self.vm_status.callback(self, ctx)  # type: ignore[attr-defined]
 
+    @voice_group.command(name='grace')
+    @commands.has_permissions(administrator=True)
+    async def voice_grace(self, ctx: commands.Context, seconds: Optional[float] = None):
+        """Show or set how long an empty temp channel is kept before deletion."""
+        g = str(ctx.guild.id)
+        if seconds is None:
+            embed = discord.Embed(title="VoiceMaster — Cleanup", color=0xFFFFFF)
+            embed.description = quote(f"Empty channels are deleted after {self.cleanup_grace(ctx.guild.id):g}s.")
+            await ctx.send(embed=embed)
+            return
+        seconds = max(0.0, min(float(MAX_CLEANUP_GRACE), seconds))
+        self.config.setdefault(g, {})
+        self.config[g]['cleanup_grace'] = seconds
+        self.save_config()
+        embed = discord.Embed(title="VoiceMaster — Cleanup", color=0xFFFFFF)
+        embed.description = quote(f"Empty channels will now be deleted after {seconds:g}s.")
+        await ctx.send(embed=embed)
+
+    @voice_group.command(name='stats')
+    async def voice_stats(self, ctx: commands.Context, hours: int = 24):
+        """Temp channel usage over the last N hours."""
+        await self.vm_stats.callback(self, ctx, hours)  # type: ignore[attr-defined]
+
+    @voice_group.command(name='pool')
+    @commands.has_permissions(administrator=True)
+    async def voice_pool(self, ctx: commands.Context, size: Optional[int] = None):
+        """Show or set how many hidden spare channels are kept ready (0 disables)."""
+        g = str(ctx.guild.id)
+        embed = discord.Embed(title="VoiceMaster — Warm Pool", color=0xFFFFFF)
+        if size is None:
+            ready = len(self.pool.get(ctx.guild.id, []))
+            embed.description = quote(f"{ready}/{self.pool_size(ctx.guild.id)} spare channels ready.")
+            await ctx.send(embed=embed)
+            return
+        size = max(0, min(MAX_WARM_POOL, size))
+        self.config.setdefault(g, {})
+        self.config[g]['warm_pool'] = size
+        self.save_config()
+        self.refill_pool(ctx.guild)
+        if size:
+            embed.description = quote(f"Keeping {size} hidden spare channel(s) ready next to the join channel.")
+        else:
+            embed.description = quote("Warm pool disabled; spare channels will be removed.")
+        await ctx.send(embed=embed)
+
+    @voice_group.group(name='hub', invoke_without_command=True)
+    @commands.has_permissions(administrator=True)
+    async def voice_hub(self, ctx: commands.Context):
+        """List this server's join-to-create hubs and their templates."""
+        lines = []
+        for channel_id in self.hubs:
+            channel = ctx.guild.get_channel(channel_id)
+            if channel is None:
+                continue
+            t = self.hub_template(channel_id)
+            category = ctx.guild.get_channel(t['category_id']) if t['category_id'] else channel.category
+            lines.append(
+                f"{channel.mention}: `{t['name']}`, limit {t['user_limit'] or 'none'}, "
+                f"bitrate {t['bitrate'] or 'default'}, in {category.name if category else 'no category'}"
+            )
+        await self._hub_reply(ctx, "\n".join(lines) if lines else f"No hubs. Use `{ctx.prefix}voice hub add <channel>` to add one.")
+
+    @staticmethod
+    async def _hub_reply(ctx: commands.Context, text: str) -> None:
+        embed = discord.Embed(title="VoiceMaster — Hubs", color=0xFFFFFF)
+        embed.description = quote(text)
+        await ctx.send(embed=embed)
+
+    @voice_hub.command(name='add')
+    @commands.has_permissions(administrator=True)
+    async def voice_hub_add(self, ctx: commands.Context, channel: discord.VoiceChannel, *, name: Optional[str] = None):
+        """Make a voice channel a join-to-create hub, optionally with a name template like "{user}'s room"."""
+        g = str(ctx.guild.id)
+        self.config.setdefault(g, {})
+        self.config[g]['enabled'] = True
+        template = self.config[g].setdefault('hubs', {}).setdefault(str(channel.id), {})
+        if name:
+            template['name'] = name[:100]
+        self.save_config()
+        await self._hub_reply(ctx, f"Joining {channel.mention} now creates `{self.hub_template(channel.id)['name']}`.")
+
+    @voice_hub.command(name='set')
+    @commands.has_permissions(administrator=True)
+    async def voice_hub_set(self, ctx: commands.Context, channel: discord.VoiceChannel, setting: str, *, value: Optional[str] = None):
+        """Set a hub's name, limit, bitrate or category (no value resets it)."""
+        g = str(ctx.guild.id)
+        if channel.id not in self.hubs:
+            await self._hub_reply(ctx, f"{channel.mention} is not a hub.")
+            return
+        setting = setting.lower()
+        key = {'name': 'name', 'limit': 'user_limit', 'bitrate': 'bitrate', 'category': 'category_id'}.get(setting)
+        if key is None:
+            await self._hub_reply(ctx, "Setting must be one of: name, limit, bitrate, category.")
+            return
+        template = self.config[g].setdefault('hubs', {}).setdefault(str(channel.id), {})
+        if not value:
+            template.pop(key, None)
+        elif key == 'name':
+            template[key] = value[:100]
+        elif key == 'category_id':
+            try:
+                template[key] = (await commands.CategoryChannelConverter().convert(ctx, value)).id
+            except commands.BadArgument:
+                await self._hub_reply(ctx, "Couldn't find that category.")
+                return
+        else:
+            try:
+                number = int(value)
+            except ValueError:
+                await self._hub_reply(ctx, "Please provide a number.")
+                return
+            template[key] = max(0, min(99, number)) if key == 'user_limit' else max(8000, number)
+        self.save_config()
+        await self._hub_reply(ctx, f"Updated {setting} for {channel.mention}.")
+
+    @voice_hub.command(name='remove')
+    @commands.has_permissions(administrator=True)
+    async def voice_hub_remove(self, ctx: commands.Context, channel: discord.VoiceChannel):
+        """Stop treating a voice channel as a join-to-create hub."""
+        removed = self.remove_hub(ctx.guild.id, channel.id)
+        await self._hub_reply(ctx, f"{channel.mention} is no longer a hub." if removed else f"{channel.mention} is not a hub.")
+
     # ----- Voice Power (mute/deafen/disconnect) -----
     @voice_group.command(name='power')
     @commands.has_permissions(manage_channels=True)
@@ -910,5 +1402,40 @@ class VoiceMaster(commands.Cog):
         
         await ctx.send(embed=embed)
 
+    @commands.command(name='vm_stats')
+    @commands.guild_only()
+    async def vm_stats(self, ctx: commands.Context, hours: int = 24):
+        """Temp channel usage over the last N hours (default 24, max 30 days)."""
+        hours = max(1, min(24 * 30, hours))
+        r = await self.analytics.rollup(ctx.guild.id, hours)
+        embed = discord.Embed(title=f"VoiceMaster Stats — last {hours}h", color=0xFFFFFF)
+        if not (r.created or r.joins):
+            embed.description = quote("No temp channel activity recorded in this window.")
+            await ctx.send(embed=embed)
+            return
+        embed.add_field(name="Peak Channels", value=grey_strip(str(r.channels_peak)), inline=True)
+        embed.add_field(name="Peak Users", value=grey_strip(str(r.users_peak)), inline=True)
+        embed.add_field(name="Created / Deleted", value=grey_strip(f"{r.created} / {r.deleted}"), inline=True)
+        embed.add_field(name="Joins / Leaves", value=grey_strip(f"{r.joins} / {r.leaves}"), inline=True)
+        embed.add_field(name="Churn", value=grey_strip(f"{(r.joins + r.leaves) / hours:.1f}/hour"), inline=True)
+        embed.add_field(name="\u200b", value="\u200b", inline=True)
+        embed.add_field(name="Session Length", value=grey_strip(f"p50 {_fmt_bound(r.session_p50)} · p95 {_fmt_bound(r.session_p95)}"), inline=True)
+        embed.add_field(name="Channel Lifetime", value=grey_strip(f"p50 {_fmt_bound(r.lifetime_p50)} · p95 {_fmt_bound(r.lifetime_p95)}"), inline=True)
+        await ctx.send(embed=embed)
+
+
+def _fmt_bound(seconds: Optional[int]) -> str:
+    """Histogram percentiles are bin upper bounds, e.g. 300 -> '≤5m'."""
+    if seconds is None:
+        return "n/a"
+    if seconds > DURATION_BINS[-1]:
+        return f">{DURATION_BINS[-1] // 3600}h"
+    if seconds < 60:
+        return f"≤{seconds}s"
+    if seconds < 3600:
+        return f"≤{seconds // 60}m"
+    return f"≤{seconds // 3600}h"
+
+
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(VoiceMaster(bot))
@@ -0,0 +1,111 @@
+import asyncio
+import os
+import signal
+import sys
+from typing import Dict, List, Optional
+
+import aiohttp
+from dotenv import load_dotenv
+
+from utils.cluster import IPC_DIR, ensure_ipc_dir, rebalance_state, shard_range
+
+
+# Run `python launcher.py` instead of `python main.py` to split the shards over
+# CLUSTER_COUNT worker processes (defaults to one per CPU core). Guild-scoped state
+# files are kept per cluster and re-split here whenever the layout changes.
+GATEWAY_URL = 'https://discord.com/api/v10/gateway/bot'
+IDENTIFY_INTERVAL = 5.0  # Discord allows max_concurrency IDENTIFYs per 5 seconds
+RESTART_BACKOFF_MAX = 60.0
+
+
+async def fetch_gateway_info(token: str) -> Dict:
+    headers = {'Authorization': f'Bot {token}'}
+    async with aiohttp.ClientSession() as session:
+        async with session.get(GATEWAY_URL, headers=headers) as resp:
+            resp.raise_for_status()
+            return await resp.json()
+
+
+class Launcher:
+    def __init__(self, shard_count: int, cluster_count: int, max_concurrency: int) -> None:
+        self.shard_count = shard_count
+        self.cluster_count = cluster_count
+        self.max_concurrency = max(1, max_concurrency)
+        self.processes: Dict[int, asyncio.subprocess.Process] = {}
+        self.stopping = False
+
+    def worker_env(self, cluster_id: int) -> Dict[str, str]:
+        shards = shard_range(cluster_id, self.cluster_count, self.shard_count)
+        env = dict(os.environ)
+        env.update({
+            'CLUSTER_ID': str(cluster_id),
+            'CLUSTER_COUNT': str(self.cluster_count),
+            'CLUSTER_IPC_DIR': IPC_DIR,
+            'SHARD_COUNT': str(self.shard_count),
+            'SHARD_IDS': f'{shards.start}-{shards.stop - 1}',
+        })
+        return env
+
+    def identify_time(self, cluster_id: int) -> float:
+        """Seconds a cluster needs to IDENTIFY all of its shards."""
+        shards = len(shard_range(cluster_id, self.cluster_count, self.shard_count))
+        return IDENTIFY_INTERVAL * -(-shards // self.max_concurrency)
+
+    async def run_worker(self, cluster_id: int) -> None:
+        failures = 0
+        while not self.stopping:
+            shards = shard_range(cluster_id, self.cluster_count, self.shard_count)
+            print(f"🚀 Starting cluster {cluster_id} (shards {shards.start}-{shards.stop - 1})")
+            proc = await asyncio.create_subprocess_exec(sys.executable, 'main.py', env=self.worker_env(cluster_id))
+            self.processes[cluster_id] = proc
+            code = await proc.wait()
+            self.processes.pop(cluster_id, None)
+            if self.stopping:
+                break
+            failures += 1
+            delay = min(RESTART_BACKOFF_MAX, IDENTIFY_INTERVAL * failures)
+            print(f"❌ Cluster {cluster_id} exited with code {code}; restarting in {delay:.0f}s")
+            await asyncio.sleep(delay)
+
+    def stop(self) -> None:
+        self.stopping = True
+        for proc in self.processes.values():
+            if proc.returncode is None:
+                proc.terminate()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stop)
+        workers: List[asyncio.Task] = []
+        for cluster_id in range(self.cluster_count):
+            if self.stopping:
+                break
+            workers.append(asyncio.create_task(self.run_worker(cluster_id)))
+            # Stagger start-up so clusters don't compete for the IDENTIFY rate limit
+            if cluster_id + 1 < self.cluster_count:
+                await asyncio.sleep(self.identify_time(cluster_id))
+        await asyncio.gather(*workers)
+
+
+async def main() -> None:
+    load_dotenv()
+    token = os.getenv('DISCORD_TOKEN')
+    if not token:
+        print("Error: No Discord token found. Please create a .env file with your DISCORD_TOKEN.")
+        return
+    info = await fetch_gateway_info(token)
+    shard_count: Optional[int] = int(os.getenv('SHARD_COUNT')) if os.getenv('SHARD_COUNT') else None
+    shard_count = shard_count or int(info.get('shards', 1))
+    cluster_count = int(os.getenv('CLUSTER_COUNT') or (os.cpu_count() or 1))
+    cluster_count = max(1, min(cluster_count, shard_count))
+    ensure_ipc_dir()
+    # No worker is running yet, so guilds can safely move between per-cluster files
+    rebalance_state(shard_count, cluster_count)
+    max_concurrency = int(info.get('session_start_limit', {}).get('max_concurrency', 1))
+    print(f"🧭 {shard_count} shards across {cluster_count} clusters")
+    await Launcher(shard_count, cluster_count, max_concurrency).run()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
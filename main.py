@@ -1,10 +1,16 @@
+import asyncio
 import discord
 import random
 from discord.ext import commands
 import os
 import json
+import signal
 from dotenv import load_dotenv
 from utils.formatting import quote
+from utils.cluster import CLUSTER_COUNT, CLUSTER_ID, parse_shard_ids, rebalance_state, update_json
+from utils.command_sync import record_sync, sync_if_changed
+from utils.member_cache import get_member_cache, lean, member_cache_flags
+from utils.extensions import ExtensionLoader, discover
 
 
 # Load environment variables from .env file
@@ -32,8 +38,19 @@ def get_prefix(bot, message):
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True  # needed for accurate human/bot counts across servers
-intents.presences = True  # required for vanity status tracking
-bot = commands.Bot(command_prefix=get_prefix, intents=intents, help_command=None)
+# Presences are only needed for vanity status tracking. Set PRESENCE_INTENT=0 to run
+# without them: much less gateway traffic and member-cache memory, vanity enforcement paused.
+intents.presences = os.getenv('PRESENCE_INTENT', '1').strip().lower() not in ('0', 'false', 'off', 'no')
+# Gateway sharding: leave SHARD_COUNT unset to use Discord's recommended shard count.
+# launcher.py also sets SHARD_IDS so each worker process connects only its own range.
+SHARD_COUNT = int(os.getenv('SHARD_COUNT')) if os.getenv('SHARD_COUNT') else None
+SHARD_IDS = parse_shard_ids(os.getenv('SHARD_IDS'))
+bot = commands.AutoShardedBot(
+    command_prefix=get_prefix, intents=intents, help_command=None,
+    shard_count=SHARD_COUNT, shard_ids=SHARD_IDS if SHARD_COUNT else None,
+    # Member cache policy lives in utils/member_cache.py (MEMBER_CACHE, MEMBER_CHUNK_THRESHOLD)
+    member_cache_flags=member_cache_flags(intents), chunk_guilds_at_startup=not lean(),
+)
 
 # Helper function to check if a user is a second owner
 def is_second_owner(guild_id, user_id):
@@ -44,6 +61,18 @@ def is_second_owner(guild_id, user_id):
     except (FileNotFoundError, json.JSONDecodeError):
         return False
 
+def drop_second_owner(guild_id, user_id=None):
+    """Remove a guild's second owner (only if it is ``user_id``, when given); returns ``(current_id, removed)``"""
+    def drop(second_owners):
+        current = second_owners.get(str(guild_id))
+        if current is None or (user_id is not None and current != str(user_id)):
+            return current, False
+        del second_owners[str(guild_id)]
+        return current, True
+
+    # second_owners.json is shared by every cluster, so it is merged under a lock
+    return update_json('second_owners.json', drop)
+
 
 
 # Wizard-style responses
@@ -81,18 +110,26 @@ WIZARD_INSULTS = [
     "Your logic circuits must be malfunctioning, meatbag!"
 ]
 
-@bot.event
-async def on_ready():
-    print(f'{bot.user.name} is online and ready to cast spells!')
-    print('------')
+def ensure_json_file(path):
+    """Create an empty JSON object file if it's missing or unreadable."""
+    try:
+        with open(path, 'r') as f:
+            json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        with open(path, 'w') as f:
+            json.dump({}, f)
+
+
+async def startup():
+    """One-time work after the first READY; reconnects never repeat it."""
     # Track start time for uptime
     try:
         import datetime as _dt
         bot.start_time = _dt.datetime.utcnow()
     except Exception:
         pass
-    
-    # Set streaming status
+
+    # Set streaming status (kept by the client and re-sent on every new session)
     try:
         streaming_activity = discord.Streaming(
             name="🔗 wizard.spell",
@@ -102,30 +139,52 @@ async def on_ready():
         print('✅ Streaming status set successfully!')
     except Exception as e:
         print(f'❌ Failed to set streaming status: {e}')
-    
-    # Sync slash commands with Discord
-    try:
-        print('🔄 Syncing slash commands...')
-        await bot.tree.sync()
-        print('✅ Slash commands synced successfully!')
-    except Exception as e:
-        print(f'❌ Failed to sync slash commands: {e}')
-    
-    # Create prefixes.json if it doesn't exist
-    try:
-        with open('prefixes.json', 'r') as f:
-            json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        with open('prefixes.json', 'w') as f:
-            json.dump({}, f)
-            
-    # Create second_owners.json if it doesn't exist
-    try:
-        with open('second_owners.json', 'r') as f:
-            json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        with open('second_owners.json', 'w') as f:
-            json.dump({}, f)
+
+    # Heavy optional cogs (spotify, premium, fun, emoji) load once we're connected
+    loader = getattr(bot, 'extension_loader', None)
+    if loader is not None:
+        await loader.load(deferred=True)
+
+    # Sync slash commands only when the command tree changed since the last sync;
+    # in cluster mode every worker has the same tree, so only cluster 0 syncs
+    if CLUSTER_ID == 0:
+        try:
+            if await sync_if_changed(bot):
+                print('✅ Slash commands synced successfully!')
+            else:
+                print('✅ Slash commands unchanged, skipped sync')
+        except Exception as e:
+            print(f'❌ Failed to sync slash commands: {e}')
+
+
+@bot.event
+async def on_ready():
+    print(f'{bot.user.name} is online and ready to cast spells!')
+    print('------')
+    # on_ready fires again after every session re-identify; startup runs once per process
+    if getattr(bot, 'startup_task', None) is None:
+        bot.startup_task = asyncio.create_task(startup())
+
+
+@bot.event
+async def on_guild_available(guild):
+    # Small (and pinned) guilds get their member list filled in the background
+    get_member_cache(bot).schedule(guild)
+
+
+@bot.event
+async def on_guild_join(guild):
+    get_member_cache(bot).schedule(guild)
+
+
+@bot.event
+async def on_shard_ready(shard_id):
+    print(f'✅ Shard {shard_id} ready')
+
+
+@bot.event
+async def on_shard_disconnect(shard_id):
+    print(f'⚠️ Shard {shard_id} disconnected')
 
 
 @bot.event
@@ -214,6 +273,7 @@ async def sync_commands(ctx):
     try:
         await ctx.send("🔄 Syncing slash commands...")
         await bot.tree.sync()
+        record_sync(bot)
         await ctx.send("✅ Slash commands synced successfully!")
     except Exception as e:
         await ctx.send(f"❌ Failed to sync slash commands: {e}")
@@ -234,17 +294,8 @@ async def prefix(ctx, new_prefix=None):
         await ctx.send("You need administrator permissions to change the prefix!")
         return
     
-    # Update prefix in prefixes.json
-    try:
-        with open('prefixes.json', 'r') as f:
-            prefixes = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        prefixes = {}
-    
-    prefixes[str(ctx.guild.id)] = new_prefix
-    
-    with open('prefixes.json', 'w') as f:
-        json.dump(prefixes, f)
+    # Update prefix in prefixes.json (shared by every cluster, so merged under a lock)
+    update_json('prefixes.json', lambda prefixes: prefixes.update({str(ctx.guild.id): new_prefix}))
     
     embed = discord.Embed(
         description=f"Prefix changed to: `{new_prefix}`",
@@ -278,23 +329,17 @@ async def set_second_owner(ctx, member: discord.Member = None):
         await ctx.send("You are already the guild owner, poser!")
         return
         
-    # Update second_owners.json
-    try:
-        with open('second_owners.json', 'r') as f:
-            second_owners = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        second_owners = {}
-    
-    # Check if there's already a second owner
-    if str(ctx.guild.id) in second_owners:
+    # Update second_owners.json, unless there's already a second owner
+    def claim(second_owners):
+        if str(ctx.guild.id) in second_owners:
+            return False
+        second_owners[str(ctx.guild.id)] = str(member.id)
+        return True
+
+    if not update_json('second_owners.json', claim):
         await ctx.send(f"There is already a second owner set for this server. Use `{get_prefix(bot, ctx.message)}remove secondowner` to remove them first.")
         return
     
-    second_owners[str(ctx.guild.id)] = str(member.id)
-    
-    with open('second_owners.json', 'w') as f:
-        json.dump(second_owners, f)
-    
     await ctx.send(f"{member.mention} has been set as the second owner of this server!")
 
 @secondowner.command(name='view')
@@ -340,21 +385,9 @@ async def remove_second_owner(ctx):
         return
     
     # Update second_owners.json
-    try:
-        with open('second_owners.json', 'r') as f:
-            second_owners = json.load(f)
-            
-        if str(ctx.guild.id) in second_owners:
-            del second_owners[str(ctx.guild.id)]
-            
-            with open('second_owners.json', 'w') as f:
-                json.dump(second_owners, f)
-                
-            await ctx.send("Second owner has been removed from this server!")
-        else:
-            await ctx.send("This server does not have a second owner set.")
-            
-    except (FileNotFoundError, json.JSONDecodeError):
+    if drop_second_owner(ctx.guild.id)[1]:
+        await ctx.send("Second owner has been removed from this server!")
+    else:
         await ctx.send("This server does not have a second owner set.")
 
 @bot.command(name='remove_cmd')
@@ -377,26 +410,13 @@ async def remove_cmd(ctx, option=None, member: discord.Member = None):
             await ctx.send("Please mention a user to remove as second owner!")
             return
         
-        # Update second_owners.json
-        try:
-            with open('second_owners.json', 'r') as f:
-                second_owners = json.load(f)
-                
-            if str(ctx.guild.id) in second_owners:
-                # Check if the mentioned user is actually the second owner
-                if str(member.id) == second_owners[str(ctx.guild.id)]:
-                    del second_owners[str(ctx.guild.id)]
-                    
-                    with open('second_owners.json', 'w') as f:
-                        json.dump(second_owners, f)
-                        
-                    await ctx.send(f"{member.mention} has been removed as the second owner of this server!")
-                else:
-                    await ctx.send(f"{member.mention} is not the second owner of this server!")
-            else:
-                await ctx.send("This server does not have a second owner set.")
-                
-        except (FileNotFoundError, json.JSONDecodeError):
+        # Update second_owners.json, but only if the mentioned user is actually the second owner
+        current, removed = drop_second_owner(ctx.guild.id, member.id)
+        if removed:
+            await ctx.send(f"{member.mention} has been removed as the second owner of this server!")
+        elif current:
+            await ctx.send(f"{member.mention} is not the second owner of this server!")
+        else:
             await ctx.send("This server does not have a second owner set.")
     elif option.lower() == 'secondowner':
         # For backward compatibility
@@ -409,21 +429,9 @@ async def remove_cmd(ctx, option=None, member: discord.Member = None):
             return
         
         # Update second_owners.json
-        try:
-            with open('second_owners.json', 'r') as f:
-                second_owners = json.load(f)
-                
-            if str(ctx.guild.id) in second_owners:
-                del second_owners[str(ctx.guild.id)]
-                
-                with open('second_owners.json', 'w') as f:
-                    json.dump(second_owners, f)
-                    
-                await ctx.send("Second owner has been removed from this server!")
-            else:
-                await ctx.send("This server does not have a second owner set.")
-                
-        except (FileNotFoundError, json.JSONDecodeError):
+        if drop_second_owner(ctx.guild.id)[1]:
+            await ctx.send("Second owner has been removed from this server!")
+        else:
             await ctx.send("This server does not have a second owner set.")
     else:
         await ctx.send(f"Unknown option: {option}")
@@ -432,130 +440,42 @@ async def remove_cmd(ctx, option=None, member: discord.Member = None):
 
 # Load command cogs
 async def load_extensions():
-    """Load all command cogs"""
-    try:
-        await bot.load_extension('cmds.jail')
-        print("✅ Loaded jail command")
-    except Exception as e:
-        print(f"❌ Failed to load jail command: {e}")
-    try:
-        await bot.load_extension('cmds.info')
-        print("✅ Loaded info commands (serverinfo/userinfo)")
-    except Exception as e:
-        print(f"❌ Failed to load info commands: {e}")
-    try:
-        await bot.load_extension('cmds.owner_tools')
-        print("✅ Loaded owner tools (jsk + moderation)")
-    except Exception as e:
-        print(f"❌ Failed to load owner tools: {e}")
-    try:
-        await bot.load_extension('cmds.fun')
-        print("✅ Loaded fun commands (bully)")
-    except Exception as e:
-        print(f"❌ Failed to load fun commands: {e}")
-    try:
-        await bot.load_extension('cmds.voicemaster')
-        print("✅ Loaded voice master")
-    except Exception as e:
-        print(f"❌ Failed to load voice master: {e}")
-    try:
-        await bot.load_extension('cmds.purge')
-        print("✅ Loaded purge command")
-    except Exception as e:
-        print(f"❌ Failed to load purge command: {e}")
-    try:
-        await bot.load_extension('cmds.ticket')
-        print("✅ Loaded ticket command")
-    except Exception as e:
-        print(f"❌ Failed to load ticket command: {e}")
-        import traceback
-        traceback.print_exc()
-    try:
-        await bot.load_extension('cmds.vanity')
-        print("✅ Loaded vanity/booster system")
-    except Exception as e:
-        print(f"❌ Failed to load vanity/booster system: {e}")
-    try:
-        await bot.load_extension('welcome')
-        print("✅ Loaded welcome listener")
-    except Exception as e:
-        print(f"❌ Failed to load welcome listener: {e}")
-    try:
-        await bot.load_extension('cmds.wlcm')
-        print("✅ Loaded welcome configuration commands")
-    except Exception as e:
-        print(f"❌ Failed to load welcome configuration commands: {e}")
-    try:
-        await bot.load_extension('cmds.automod')
-        print("✅ Loaded automod")
-    except Exception as e:
-        print(f"❌ Failed to load automod: {e}")
-    try:
-        await bot.load_extension('cmds.antinuke')
-        print("✅ Loaded antinuke")
-    except Exception as e:
-        print(f"❌ Failed to load antinuke: {e}")
-    try:
-        await bot.load_extension('cmds.emoji')
-        print("✅ Loaded emoji tools")
-    except Exception as e:
-        print(f"❌ Failed to load emoji tools: {e}")
-    try:
-        await bot.load_extension('cmds.nickname')
-        print("✅ Loaded nickname command")
-    except Exception as e:
-        print(f"❌ Failed to load nickname command: {e}")
-    try:
-        await bot.load_extension('cmds.manage')
-        print("✅ Loaded channel manage commands (hide/lock)")
-    except Exception as e:
-        print(f"❌ Failed to load channel manage commands: {e}")
-    try:
-        await bot.load_extension('cmds.role')
-        print("✅ Loaded role management system")
-    except Exception as e:
-        print(f"❌ Failed to load role management system: {e}")
-    try:
-        await bot.load_extension('cmds.buttonrole')
-        print("✅ Loaded button role system")
-    except Exception as e:
-        print(f"❌ Failed to load button role system: {e}")
-    try:
-        await bot.load_extension('cmds.embed')
-        print("✅ Loaded embed creator (slash commands)")
-    except Exception as e:
-        print(f"❌ Failed to load embed creator: {e}")
-    try:
-        await bot.load_extension('cmds.giveaway')
-        print("✅ Loaded giveaway system (slash commands)")
-    except Exception as e:
-        print(f"❌ Failed to load giveaway system: {e}")
-    try:
-        await bot.load_extension('cmds.join')
-        print("✅ Loaded join roles")
-    except Exception as e:
-        print(f"❌ Failed to load join roles: {e}")
-    try:
-        await bot.load_extension('cmds.premium')
-        print("✅ Loaded premium/AI commands")
-    except Exception as e:
-        print(f"❌ Failed to load premium/AI commands: {e}")
-    try:
-        await bot.load_extension('cmds.spotify')
-        print("✅ Loaded Spotify integration")
-    except Exception as e:
-        print(f"❌ Failed to load Spotify integration: {e}")
+    """Load all command cogs listed in (or discovered next to) utils/extensions.py"""
+    bot.extension_loader = ExtensionLoader(bot, discover())
+    await bot.extension_loader.load()
+
+async def shutdown():
+    """Flush bot-wide state that is buffered in memory, then close the connection"""
+    analytics = getattr(bot, 'voice_analytics', None)
+    if analytics is not None:
+        try:
+            await analytics.close()
+        except Exception as e:
+            print(f"❌ Failed to flush voice analytics: {e}")
+    if not bot.is_closed():
+        await bot.close()
 
 # Run the bot
 if __name__ == '__main__':
-    import asyncio
-    
     async def main():
+        ensure_json_file('prefixes.json')
+        ensure_json_file('second_owners.json')
+        if CLUSTER_COUNT <= 1:
+            # Run on its own: fold state left by an earlier multi-cluster run back into the plain files
+            rebalance_state(SHARD_COUNT or 1, 1)
         await load_extensions()
         token = os.getenv('DISCORD_TOKEN')
         if not token:
             print("Error: No Discord token found. Please create a .env file with your DISCORD_TOKEN.")
         else:
-            await bot.start(token)
+            # The launcher stops workers with SIGTERM; treat it like Ctrl+C so shutdown() runs
+            try:
+                asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+            except NotImplementedError:
+                pass  # Windows
+            try:
+                await bot.start(token)
+            finally:
+                await shutdown()
     
     asyncio.run(main())
@@ -0,0 +1,25 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+# The bot runs from the repository root (python main.py), so make its packages importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeBot:
+    """Just enough of a bot for the schedulers: it never becomes ready, so their loops stay idle."""
+
+    def __init__(self) -> None:
+        self._never = None
+
+    async def wait_until_ready(self) -> None:
+        if self._never is None:
+            self._never = asyncio.Event()
+        await self._never.wait()
+
+
+@pytest.fixture
+def bot() -> FakeBot:
+    return FakeBot()
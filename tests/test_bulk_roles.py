@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from utils import bulk_roles, jobs
+
+
+@pytest.fixture(autouse=True)
+def jobs_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(jobs, 'JOBS_FILE', str(tmp_path / 'jobs.json'))
+
+
+def test_reloaded_engine_reports_a_finished_job_once(bot):
+    reports = []
+
+    async def reporter(job, final):
+        reports.append((job.job_id, final))
+
+    async def main():
+        # Simulate a few `jsk reload role`: each cog instance builds its own engine on the shared queue
+        engine = None
+        for _ in range(3):
+            if engine is not None:
+                engine.shutdown()
+            engine = bulk_roles.BulkRoleEngine(bot, reporter=reporter)
+            engine.register()
+        job = engine.create(1, 10, 'add', 'all', requested_by=5).job
+        job.status = 'completed'
+        await engine.queue._notify(job)
+        engine.queue.shutdown()
+        return job
+
+    job = asyncio.run(main())
+    assert reports == [(job.job_id, True)]
+
+
+def test_off_finished_removes_only_that_callback(bot):
+    queue = jobs.JobQueue(bot)
+    calls = []
+
+    async def first(job):
+        calls.append('first')
+
+    async def second(job):
+        calls.append('second')
+
+    queue.on_finished('sweep', first)
+    queue.on_finished('sweep', second)
+    queue.off_finished('sweep', first)
+    queue.off_finished('sweep', first)
+    queue.off_finished('other', second)
+    job, _ = queue.submit('sweep', 1, {})
+    asyncio.run(queue._notify(job))
+    assert calls == ['second']
@@ -0,0 +1,112 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from utils import cluster
+
+
+def guild_on(shard_id):
+    """A guild id that Discord routes to ``shard_id``."""
+    return str((shard_id << 22) | 12345)
+
+
+def read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_guild_cluster_follows_shard_ranges():
+    # 4 shards over 2 clusters: shards 0-1 -> cluster 0, 2-3 -> cluster 1
+    assert [cluster.guild_cluster(int(guild_on(s)), 4, 2) for s in range(4)] == [0, 0, 1, 1]
+    assert cluster.guild_cluster(int(guild_on(3)), 4, 1) == 0
+
+
+def test_state_path():
+    assert cluster.state_path('tickets.json', 0, 1) == 'tickets.json'
+    assert cluster.state_path('tickets.json', 2, 4) == 'tickets.cluster2.json'
+
+
+def test_split_into_clusters_and_merge_back():
+    a, b = guild_on(0), guild_on(3)
+    write('jail_config.json', {a: {'enabled': True}, b: {'enabled': False}})
+    write('jobs.json', {'j1': {'guild_id': int(a)}, 'j2': {'guild_id': int(b)}, 'j3': {'guild_id': None}})
+
+    cluster.rebalance_state(4, 2)
+    assert read('jail_config.cluster0.json') == {a: {'enabled': True}}
+    assert read('jail_config.cluster1.json') == {b: {'enabled': False}}
+    assert set(read('jobs.cluster0.json')) == {'j1', 'j3'}
+    assert set(read('jobs.cluster1.json')) == {'j2'}
+    assert read('cluster_layout.json') == {'shard_count': 4, 'cluster_count': 2}
+
+    # Cluster 1 changes its guild; going back to one process keeps that change
+    write('jail_config.cluster1.json', {b: {'enabled': True}})
+    cluster.rebalance_state(4, 1)
+    assert read('jail_config.json') == {a: {'enabled': True}, b: {'enabled': True}}
+    assert not os.path.exists('jail_config.cluster0.json')
+    assert not os.path.exists('jail_config.cluster1.json')
+
+
+def test_reshard_moves_guilds_to_their_new_cluster():
+    guilds = [guild_on(s) for s in range(6)]
+    write('tickets.json', {g: {} for g in guilds})
+    cluster.rebalance_state(6, 2)
+    cluster.rebalance_state(6, 3)
+    for cluster_id in range(3):
+        part = read(f'tickets.cluster{cluster_id}.json')
+        assert sorted(part) == sorted(guilds[cluster_id * 2:cluster_id * 2 + 2])
+
+
+def test_unchanged_layout_is_left_alone():
+    write('tickets.json', {guild_on(0): {}})
+    cluster.rebalance_state(4, 2)
+    write('tickets.cluster0.json', {'edited': {}})
+    cluster.rebalance_state(4, 2)
+    assert read('tickets.cluster0.json') == {'edited': {}}
+
+
+def test_unreadable_state_aborts_the_split():
+    with open('tickets.json', 'w', encoding='utf-8') as f:
+        f.write('{not json')
+    with pytest.raises(ValueError):
+        cluster.rebalance_state(4, 2)
+    assert not os.path.exists('cluster_layout.json')
+    with open('tickets.json', 'r', encoding='utf-8') as f:
+        assert f.read() == '{not json'
+
+
+def test_update_json_returns_result_and_skips_unchanged_writes():
+    assert cluster.update_json('prefixes.json', lambda d: d.setdefault('1', '?')) == '?'
+    assert read('prefixes.json') == {'1': '?'}
+    mtime = os.stat('prefixes.json').st_mtime_ns
+    assert cluster.update_json('prefixes.json', lambda d: d.get('1')) == '?'
+    assert os.stat('prefixes.json').st_mtime_ns == mtime
+
+
+def _increment(path, times):
+    for _ in range(times):
+        cluster.update_json(path, lambda d: d.update(n=d.get('n', 0) + 1))
+
+
+@pytest.mark.skipif(cluster.fcntl is None, reason='file locks need fcntl')
+def test_update_json_is_safe_across_processes(state_dir):
+    path = str(state_dir / 'counter.json')
+    ctx = multiprocessing.get_context('fork')
+    workers = [ctx.Process(target=_increment, args=(path, 50)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert read(path) == {'n': 200}
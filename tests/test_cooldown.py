@@ -0,0 +1,83 @@
+from utils.cooldown import Cooldown, TTLCache
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_entry_lives_for_ttl():
+    clock = Clock()
+    cache = TTLCache(10, clock=clock)
+    cache.set('a', 1)
+    clock.now += 9.9
+    assert cache.get('a') == 1
+    clock.now += 0.1
+    assert cache.get('a') is None
+    assert 'a' not in cache
+
+
+def test_whole_buckets_expire_together():
+    clock = Clock()
+    cache = TTLCache(8, buckets=8, clock=clock)
+    for key in range(3):
+        cache.set(key, key)
+    clock.now += 1
+    cache.set('late', 0)
+    assert len(cache._buckets) == 2
+    clock.now += 8
+    # The first bucket is past the horizon and is dropped without per-key checks
+    assert len(cache) == 1
+    assert list(cache._buckets.values()) == [{'late': (1001.0, 0)}]
+    clock.now += 1
+    assert len(cache) == 0 and not cache._bucket_of
+
+
+def test_set_moves_key_to_current_bucket():
+    clock = Clock()
+    cache = TTLCache(10, clock=clock)
+    cache.set('a', 1)
+    clock.now += 8
+    cache.set('a', 2)
+    clock.now += 8
+    assert cache.get('a') == 2
+    assert len(cache._buckets) == 1
+
+
+def test_touch_resets_expiry_and_keeps_value():
+    clock = Clock()
+    cache = TTLCache(10, clock=clock)
+    hits = cache.touch('a', list)
+    hits.append(1)
+    clock.now += 9
+    assert cache.touch('a', list) == [1]
+    clock.now += 9
+    assert cache.get('a') == [1]
+    clock.now += 10
+    assert cache.touch('a', list) == []
+
+
+def test_max_size_evicts_oldest():
+    clock = Clock()
+    cache = TTLCache(100, max_size=2, clock=clock)
+    for key in 'abc':
+        cache.set(key, key)
+        clock.now += 1
+    assert [key for key, _ in cache.items()] == ['b', 'c']
+
+
+def test_pop_removes_entry():
+    cache = TTLCache(10, clock=Clock())
+    cache.set('a', 1)
+    assert cache.pop('a') == 1
+    assert cache.pop('a', 'gone') == 'gone'
+    assert len(cache) == 0
+
+
+def test_cooldown_hit():
+    cooldown = Cooldown(5)
+    assert cooldown.hit(('guild', 'user'))
+    assert not cooldown.hit(('guild', 'user'))
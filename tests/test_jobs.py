@@ -0,0 +1,187 @@
+import asyncio
+import time
+
+import pytest
+
+from utils import jobs
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch, bot):
+    monkeypatch.setattr(jobs, 'JOBS_FILE', str(tmp_path / 'jobs.json'))
+    return jobs.JobQueue(bot)
+
+
+def run(queue, coro_fn):
+    async def main():
+        try:
+            return await coro_fn()
+        finally:
+            queue.shutdown()
+    return asyncio.run(main())
+
+
+def test_submit_reuses_unfinished_job(queue):
+    job, created = queue.submit('sweep', 1, {'role': 5})
+    again, created_again = queue.submit('sweep', 1, {'role': 5})
+    assert created and not created_again
+    assert again is job
+
+
+def test_submit_dedup_key_ignores_param_order(queue):
+    job, _ = queue.submit('sweep', 1, {'a': 1, 'b': 2})
+    again, created = queue.submit('sweep', 1, {'b': 2, 'a': 1})
+    assert again is job and not created
+
+
+def test_submit_distinguishes_guild_and_params(queue):
+    job, _ = queue.submit('sweep', 1, {'role': 5})
+    assert queue.submit('sweep', 2, {'role': 5})[0] is not job
+    assert queue.submit('sweep', 1, {'role': 6})[0] is not job
+
+
+def test_finished_job_is_not_reused(queue):
+    async def main():
+        job, _ = queue.submit('sweep', 1, {}, dedup_key='sweep:1')
+        queue.cancel(job.job_id)
+        await asyncio.sleep(0)
+        return job
+
+    job = run(queue, main)
+    again, created = queue.submit('sweep', 1, {}, dedup_key='sweep:1')
+    assert created and again is not job
+
+
+def start(queue, job):
+    job.status = 'running'
+    return queue._execute(job)
+
+
+def test_failed_job_retries_with_exponential_backoff(queue):
+    calls = []
+
+    async def handler(ctx):
+        calls.append(ctx.job.attempts)
+        raise RuntimeError('boom')
+
+    async def main():
+        queue.register('sweep', handler)
+        job, _ = queue.submit('sweep', 1, {}, max_attempts=3)
+        delays = []
+        for _ in range(2):
+            before = time.time()
+            await start(queue, job)
+            assert job.status == 'retrying'
+            delays.append(job.run_at - before)
+        await start(queue, job)
+        return job, delays
+
+    job, delays = run(queue, main)
+    assert calls == [0, 1, 2]
+    assert job.status == 'failed' and job.attempts == 3
+    assert job.error == 'RuntimeError: boom'
+    assert delays[0] == pytest.approx(jobs.BACKOFF_BASE, abs=1)
+    assert delays[1] == pytest.approx(jobs.BACKOFF_BASE * 2, abs=1)
+
+
+def test_backoff_is_capped(queue):
+    async def handler(ctx):
+        raise RuntimeError('boom')
+
+    async def main():
+        queue.register('sweep', handler)
+        job, _ = queue.submit('sweep', 1, {}, max_attempts=50)
+        job.attempts = 20
+        before = time.time()
+        await start(queue, job)
+        return job.run_at - before
+
+    assert run(queue, main) == pytest.approx(jobs.BACKOFF_MAX, abs=1)
+
+
+def test_success_after_retry_clears_error(queue):
+    outcomes = [RuntimeError('flaky'), None]
+
+    async def handler(ctx):
+        error = outcomes.pop(0)
+        if error is not None:
+            raise error
+
+    async def main():
+        queue.register('sweep', handler)
+        job, _ = queue.submit('sweep', 1, {})
+        await start(queue, job)
+        await start(queue, job)
+        return job
+
+    job = run(queue, main)
+    assert job.status == 'completed' and job.error is None
+
+
+def test_retrying_job_is_still_deduplicated(queue):
+    async def handler(ctx):
+        raise RuntimeError('boom')
+
+    async def main():
+        queue.register('sweep', handler)
+        job, _ = queue.submit('sweep', 1, {})
+        await start(queue, job)
+        return job
+
+    job = run(queue, main)
+    assert job.status == 'retrying'
+    assert queue.submit('sweep', 1, {}) == (job, False)
+
+
+def test_runnable_respects_run_at_and_guild_lanes(queue):
+    async def handler(ctx):
+        pass
+
+    async def main():
+        queue.register('sweep', handler)
+        now = time.time()
+        first, _ = queue.submit('sweep', 1, {'n': 1})
+        queue.submit('sweep', 1, {'n': 2})  # same lane as first, so it waits
+        other, _ = queue.submit('sweep', 2, {'n': 1})
+        later, _ = queue.submit('sweep', 3, {}, delay=60)
+        ready = queue._runnable(now + 1)
+        assert [j.job_id for j in ready] == [first.job_id, other.job_id]
+        assert later not in ready
+        assert queue._next_wakeup(now + 1) == pytest.approx(59, abs=1)
+
+    run(queue, main)
+
+
+def test_interrupted_job_is_requeued_on_load(queue, bot):
+    job, _ = queue.submit('sweep', 1, {})
+    job.status = 'running'
+    queue.save()
+    reloaded = jobs.JobQueue(bot).get(job.job_id)
+    assert reloaded.status == 'queued'
+
+
+def test_paused_jobs_do_not_hold_slots(queue):
+    async def handler(ctx):
+        pass
+
+    async def main():
+        queue.register('sweep', handler)
+        now = time.time()
+        paused = []
+        for guild_id in range(1, jobs.GLOBAL_CONCURRENCY + 1):
+            job, _ = queue.submit('sweep', guild_id, {})
+            job.status = 'running'
+            queue._running[job.job_id] = asyncio.ensure_future(asyncio.sleep(3600))
+            paused.append(job)
+        waiting, _ = queue.submit('sweep', 99, {})
+        assert queue._runnable(now + 1) == []
+        for job in paused:
+            assert queue.pause(job.job_id)
+        assert queue._runnable(now + 1) == [waiting]
+        # A paused job's lane is free too
+        same_lane, _ = queue.submit('sweep', 1, {'n': 2})
+        assert same_lane in queue._runnable(now + 1)
+        assert queue.resume(paused[0].job_id) and paused[0].status == 'running'
+        assert same_lane not in queue._runnable(now + 1)
+
+    run(queue, main)
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta, timezone
+
+from utils.member_index import GuildJoinIndex, JoinIndex
+
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class Member:
+    def __init__(self, member_id, days, guild=None):
+        self.id = member_id
+        self.joined_at = EPOCH + timedelta(days=days) if days is not None else None
+        self.guild = guild
+
+
+class Guild:
+    def __init__(self, guild_id, members, chunked=True):
+        self.id = guild_id
+        self.members = list(members)
+        self.chunked = chunked
+        for member in self.members:
+            member.guild = self
+
+
+def test_positions_follow_join_order():
+    guild = Guild(1, [Member(30, 3), Member(10, 1), Member(20, 2)])
+    index = GuildJoinIndex(guild)
+    assert [index.position(m) for m in (10, 20, 30)] == [1, 2, 3]
+    assert len(index) == 3
+    assert index.position(99) is None
+
+
+def test_same_join_time_breaks_ties_by_id():
+    guild = Guild(1, [Member(7, 1), Member(5, 1)])
+    index = GuildJoinIndex(guild)
+    assert index.position(5) == 1 and index.position(7) == 2
+
+
+def test_members_without_join_date_are_skipped():
+    index = GuildJoinIndex(Guild(1, [Member(1, 1), Member(2, None)]))
+    assert len(index) == 1 and index.position(2) is None
+
+
+def test_newest_lists_latest_joins_first():
+    index = GuildJoinIndex(Guild(1, [Member(i, i) for i in range(1, 6)]))
+    assert index.newest(2) == [5, 4]
+    assert index.newest(10) == [5, 4, 3, 2, 1]
+
+
+def test_join_and_remove_update_positions():
+    guild = Guild(1, [Member(1, 1), Member(3, 3)])
+    joins = JoinIndex()
+    index = joins.get(guild)
+    newcomer = Member(2, 2, guild)
+    joins.member_join(newcomer)
+    assert index.position(2) == 2 and index.position(3) == 3
+    joins.member_join(newcomer)
+    assert len(index) == 3
+    joins.member_remove(1, 1)
+    assert index.position(2) == 1 and len(index) == 2
+    joins.member_remove(1, 1)
+    assert len(index) == 2
+
+
+def test_cache_growth_does_not_rebuild():
+    guild = Guild(1, [Member(1, 1), Member(2, 2)])
+    joins = JoinIndex()
+    index = joins.get(guild)
+    # Members cached by lookups or voice states rather than joins
+    guild.members.append(Member(3, 0, guild))
+    assert joins.get(guild) is index
+
+
+def test_partial_index_is_rebuilt_once_when_chunked():
+    guild = Guild(1, [Member(2, 2)], chunked=False)
+    joins = JoinIndex()
+    partial = joins.get(guild)
+    assert not partial.complete and joins.get(guild) is partial
+    guild.members.append(Member(1, 1, guild))
+    guild.chunked = True
+    full = joins.get(guild)
+    assert full is not partial and full.complete
+    assert full.position(1) == 1 and full.position(2) == 2
+    assert joins.get(guild) is full
+
+
+def test_drop_forgets_guild():
+    guild = Guild(1, [Member(1, 1)])
+    joins = JoinIndex()
+    index = joins.get(guild)
+    joins.drop(1)
+    joins.member_join(Member(2, 2, guild))
+    assert len(index) == 1
+    assert joins.get(guild) is not index
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+import discord
+
+from utils.stats import BotStats
+
+
+class Guild:
+    def __init__(self, guild_id, member_count, members, chunked):
+        self.id = guild_id
+        self.member_count = member_count
+        self.members = members
+        self.chunked = chunked
+        self.channels = []
+        self.shard_id = 0
+
+
+def left(guild_id, bot=False, user_id=1):
+    user = SimpleNamespace(id=user_id, bot=bot)
+    return discord.RawMemberRemoveEvent({'guild_id': str(guild_id), 'user': {}}, user)
+
+
+def test_chunked_guild_is_split_into_bots_and_humans():
+    stats = BotStats()
+    stats.set_guild(Guild(1, 3, [SimpleNamespace(bot=True), SimpleNamespace(bot=False), SimpleNamespace(bot=False)], True))
+    data = stats.snapshot()
+    assert (data['members'], data['bots'], data['humans'], data['unsplit']) == (3, 1, 2, 0)
+
+
+def test_unchunked_guild_is_not_split():
+    stats = BotStats()
+    stats.set_guild(Guild(1, 100, [SimpleNamespace(bot=True)], False))
+    data = stats.snapshot()
+    assert (data['members'], data['bots'], data['humans'], data['unsplit']) == (100, 0, 0, 100)
+
+
+def test_uncached_member_leaving_lowers_totals():
+    # In a lean, unchunked guild the leaver is usually not cached, so only the raw event fires
+    stats = BotStats()
+    guild = Guild(1, 100, [], False)
+    stats.set_guild(guild)
+    stats.member_remove(left(1, user_id=42))
+    assert stats.snapshot()['members'] == 99
+    assert stats.snapshot()['unsplit'] == 99
+
+
+def test_join_and_leave_keep_chunked_split_current():
+    stats = BotStats()
+    guild = Guild(1, 1, [SimpleNamespace(bot=False)], True)
+    stats.set_guild(guild)
+    stats.member_join(SimpleNamespace(guild=guild, bot=True))
+    assert (stats.totals['members'], stats.totals['bots'], stats.humans) == (2, 1, 1)
+    stats.member_remove(left(1, bot=True))
+    stats.member_remove(left(1, bot=False))
+    assert (stats.totals['members'], stats.totals['bots'], stats.humans) == (0, 0, 0)
+
+
+def test_leave_from_unknown_guild_is_ignored():
+    stats = BotStats()
+    stats.member_remove(left(7))
+    assert stats.snapshot()['members'] == 0
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from utils import timers
+
+
+@pytest.fixture
+def scheduler(tmp_path, monkeypatch, bot):
+    monkeypatch.setattr(timers, 'TIMERS_FILE', str(tmp_path / 'timers.json'))
+    return timers.TimerScheduler(bot)
+
+
+async def noop(timer):
+    pass
+
+
+def keys(due):
+    return [timer.key for timer in due]
+
+
+def test_due_timers_pop_in_deadline_order(scheduler):
+    scheduler.register('jail_release', noop)
+    for key, run_at in (('c', 30.0), ('a', 10.0), ('d', 40.0), ('b', 20.0)):
+        scheduler.schedule('jail_release', key, 1, run_at)
+    assert keys(scheduler._pop_due(25.0)) == ['a', 'b']
+    assert keys(scheduler._pop_due(25.0)) == []
+    assert keys(scheduler._pop_due(100.0)) == ['c', 'd']
+    assert scheduler.timers == {}
+
+
+def test_rescheduling_moves_the_deadline(scheduler):
+    scheduler.register('jail_release', noop)
+    scheduler.schedule('jail_release', 'a', 1, 10.0)
+    scheduler.schedule('jail_release', 'b', 1, 20.0)
+    scheduler.schedule('jail_release', 'a', 1, 30.0)
+    assert keys(scheduler._pop_due(25.0)) == ['b']
+    assert keys(scheduler._pop_due(35.0)) == ['a']
+    # The stale heap entry for 'a' at 10.0 was dropped rather than fired twice
+    assert scheduler._heap == []
+
+
+def test_cancelled_timer_never_fires(scheduler):
+    scheduler.register('jail_release', noop)
+    scheduler.schedule('jail_release', 'a', 1, 10.0)
+    assert scheduler.cancel('a')
+    assert not scheduler.cancel('a')
+    assert keys(scheduler._pop_due(100.0)) == []
+
+
+def test_unregistered_kind_is_parked_until_registered(scheduler):
+    scheduler.schedule('jail_release', 'a', 1, 10.0)
+    assert keys(scheduler._pop_due(100.0)) == []
+    assert 'a' in scheduler.timers
+    scheduler.register('jail_release', noop)
+    assert keys(scheduler._pop_due(100.0)) == ['a']
+
+
+def test_list_is_sorted_and_filtered(scheduler):
+    scheduler.schedule('jail_release', 'b', 2, 20.0)
+    scheduler.schedule('jail_release', 'a', 1, 10.0)
+    scheduler.schedule('other', 'c', 1, 5.0)
+    assert [t.key for t in scheduler.list()] == ['c', 'a', 'b']
+    assert [t.key for t in scheduler.list(kind='jail_release', guild_id=1)] == ['a']
+
+
+def test_timers_survive_restart(scheduler, bot):
+    scheduler.schedule('jail_release', 'b', 1, 20.0, {'user_id': 5})
+    scheduler.schedule('jail_release', 'a', 1, 10.0)
+    reloaded = timers.TimerScheduler(bot)
+    reloaded.register('jail_release', noop)
+    due = reloaded._pop_due(100.0)
+    assert keys(due) == ['a', 'b']
+    assert due[1].params == {'user_id': 5} and due[1].guild_id == 1
+
+
+def test_dispatcher_fires_due_timers(scheduler, bot):
+    fired = []
+
+    async def handler(timer):
+        fired.append(timer.key)
+
+    async def ready():
+        pass
+
+    async def main():
+        bot.wait_until_ready = ready
+        scheduler.register('jail_release', handler)
+        scheduler.schedule('jail_release', 'a', 1, 0.0)
+        scheduler.start()
+        try:
+            for _ in range(50):
+                if fired:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            scheduler.shutdown()
+
+    asyncio.run(main())
+    assert fired == ['a']
@@ -0,0 +1,42 @@
+import pytest
+
+from utils.voice_analytics import DURATION_BINS, bin_label, duration_bin, percentile
+
+
+@pytest.mark.parametrize('seconds, expected', [
+    (0, 0),
+    (30, 0),       # bins are inclusive of their upper bound
+    (30.5, 1),
+    (60, 1),
+    (3600, DURATION_BINS.index(3600)),
+    (86400, len(DURATION_BINS) - 1),
+    (86401, len(DURATION_BINS)),
+])
+def test_duration_bin(seconds, expected):
+    assert duration_bin(seconds) == expected
+
+
+def test_bin_label():
+    assert bin_label(0) == 30
+    assert bin_label(len(DURATION_BINS)) is None
+
+
+def test_percentile_empty():
+    assert percentile({}, 0.5) is None
+    assert percentile({0: 0}, 0.5) is None
+
+
+def test_percentile_reports_bin_upper_bound():
+    counts = {duration_bin(20): 50, duration_bin(250): 45, duration_bin(5000): 5}
+    assert percentile(counts, 0.5) == 30
+    assert percentile(counts, 0.95) == 300
+    assert percentile(counts, 0.96) == 7200
+
+
+def test_percentile_ignores_insertion_order():
+    assert percentile({3: 1, 0: 1}, 0.5) == 30
+
+
+def test_percentile_open_ended_bin():
+    counts = {len(DURATION_BINS): 1}
+    assert percentile(counts, 0.5) == DURATION_BINS[-1] + 1
@@ -0,0 +1,221 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import discord
+
+from utils.jobs import Job, JobContext, get_queue
+
+
+JOB_KIND = 'bulk_role'
+
+# Member role edits all share one rate-limit bucket per guild
+# (PUT/DELETE /guilds/{guild_id}/members/{user_id}/roles/{role_id}), so
+# concurrency is bounded per guild rather than per job.
+DEFAULT_CONCURRENCY = 4
+PROGRESS_INTERVAL = 3.0
+MAX_RETRIES = 3
+# fetch_members pages 1000 at a time; keep at most this many queued for the workers
+STREAM_BUFFER = 1000
+
+TARGETS = ('all', 'human', 'bot')
+ACTIONS = ('add', 'remove')
+
+
+class BulkRoleJob:
+    """A single role add/remove run over a filtered set of guild members.
+
+    Thin view over a queue :class:`~utils.jobs.Job`; the request lives in
+    ``params`` and the running counters in the checkpointed ``state``.
+    """
+
+    def __init__(self, job: Job) -> None:
+        self.job = job
+
+    job_id = property(lambda self: self.job.job_id)
+    guild_id = property(lambda self: self.job.guild_id)
+    requested_by = property(lambda self: self.job.requested_by)
+    created_at = property(lambda self: self.job.created_at)
+    finished = property(lambda self: self.job.finished)
+    role_id = property(lambda self: self.job.params['role_id'])
+    action = property(lambda self: self.job.params['action'])
+    target = property(lambda self: self.job.params['target'])
+    channel_id = property(lambda self: self.job.params.get('channel_id'))
+
+    @property
+    def status(self) -> str:
+        return 'pending' if self.job.status in ('queued', 'retrying') else self.job.status
+
+    @property
+    def message_id(self) -> Optional[int]:
+        return self.job.state.get('message_id')
+
+    @message_id.setter
+    def message_id(self, value: Optional[int]) -> None:
+        self.job.state['message_id'] = value
+
+    total = property(lambda self: self.job.total)
+    done = property(lambda self: self.job.done)
+    success = property(lambda self: self.job.state.get('success', 0))
+    failed = property(lambda self: self.job.state.get('failed', 0))
+    skipped = property(lambda self: self.job.state.get('skipped', 0))
+
+
+Reporter = Callable[[BulkRoleJob, bool], Awaitable[None]]
+
+
+class BulkRoleEngine:
+    """Runs bulk role jobs on the shared job queue with bounded per-guild concurrency.
+
+    Because the member selection skips anyone already in the target state, a
+    job interrupted by a restart is resumed by simply re-selecting and continuing.
+    """
+
+    def __init__(self, bot: discord.Client, reporter: Optional[Reporter] = None,
+                 concurrency: int = DEFAULT_CONCURRENCY, progress_interval: float = PROGRESS_INTERVAL) -> None:
+        self.bot = bot
+        self.reporter = reporter
+        self.concurrency = max(1, concurrency)
+        self.progress_interval = progress_interval
+        self.queue = get_queue(bot)
+        self._last_report: Dict[str, float] = {}
+
+    def register(self) -> None:
+        self.queue.register(JOB_KIND, self._run)
+        self.queue.on_finished(JOB_KIND, self._on_finished)
+
+    def shutdown(self) -> None:
+        # The queue outlives the cog, so drop our listener or every reload adds another report
+        self.queue.unregister(JOB_KIND)
+        self.queue.off_finished(JOB_KIND, self._on_finished)
+
+    # ---------- selection ----------
+    @staticmethod
+    def needs_change(member: discord.Member, role_id: int, action: str, target: str) -> bool:
+        if target == 'human' and member.bot:
+            return False
+        if target == 'bot' and not member.bot:
+            return False
+        return (member.get_role(role_id) is not None) == (action == 'remove')
+
+    @classmethod
+    def select_member_ids(cls, guild: discord.Guild, role: discord.Role, action: str, target: str) -> List[int]:
+        """IDs of cached members that still need the change; only complete for chunked guilds."""
+        return [m.id for m in guild.members if cls.needs_change(m, role.id, action, target)]
+
+    # ---------- lookup ----------
+    def active_job(self, guild_id: int) -> Optional[BulkRoleJob]:
+        jobs = self.queue.list(guild_id=guild_id, kind=JOB_KIND)
+        return BulkRoleJob(jobs[0]) if jobs else None
+
+    def latest_job(self, guild_id: int) -> Optional[BulkRoleJob]:
+        jobs = self.queue.list(guild_id=guild_id, kind=JOB_KIND, include_finished=True)
+        return BulkRoleJob(jobs[-1]) if jobs else None
+
+    # ---------- control ----------
+    def create(self, guild_id: int, role_id: int, action: str, target: str, requested_by: int,
+               channel_id: Optional[int] = None) -> BulkRoleJob:
+        params = {'role_id': role_id, 'action': action, 'target': target, 'channel_id': channel_id}
+        job, _ = self.queue.submit(JOB_KIND, guild_id, params, requested_by=requested_by,
+                                   dedup_key=f"{JOB_KIND}:{guild_id}:{role_id}:{action}:{target}")
+        return BulkRoleJob(job)
+
+    def pause(self, job_id: str) -> bool:
+        return self.queue.pause(job_id)
+
+    def resume(self, job_id: str) -> bool:
+        return self.queue.resume(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        return self.queue.cancel(job_id)
+
+    # ---------- execution ----------
+    async def _report(self, job: BulkRoleJob, final: bool = False) -> None:
+        now = time.monotonic()
+        if not final and now - self._last_report.get(job.job_id, 0) < self.progress_interval:
+            return
+        self._last_report[job.job_id] = now
+        if self.reporter is None:
+            return
+        try:
+            await self.reporter(job, final)
+        except Exception:
+            pass
+
+    async def _on_finished(self, job: Job) -> None:
+        self._last_report.pop(job.job_id, None)
+        await self._report(BulkRoleJob(job), final=True)
+
+    async def _apply(self, guild: discord.Guild, role: discord.Role, member: discord.Member, job: BulkRoleJob) -> Optional[bool]:
+        # Prefer the cached copy: it reflects role changes made since the member was fetched
+        member = guild.get_member(member.id) or member
+        has_role = member.get_role(role.id) is not None
+        if (job.action == 'add' and has_role) or (job.action == 'remove' and not has_role):
+            return None
+        reason = f"Role command by {job.requested_by}"
+        for attempt in range(MAX_RETRIES):
+            try:
+                if job.action == 'add':
+                    await member.add_roles(role, reason=reason)
+                else:
+                    await member.remove_roles(role, reason=reason)
+                return True
+            except discord.Forbidden:
+                return False
+            except discord.NotFound:
+                return None
+            except discord.HTTPException as e:
+                if e.status == 429 or e.status >= 500:
+                    await asyncio.sleep(getattr(e, 'retry_after', None) or (2 ** attempt))
+                    continue
+                return False
+        return False
+
+    async def _run(self, ctx: JobContext) -> None:
+        job = BulkRoleJob(ctx.job)
+        guild = self.bot.get_guild(job.guild_id)
+        role = guild.get_role(job.role_id) if guild else None
+        if guild is None or role is None:
+            raise RuntimeError("guild or role no longer exists")
+
+        # Members are streamed from the API rather than read from the member cache,
+        # which only holds everyone for small guilds. Anyone already in the target
+        # state is filtered out, so a resume after restart only sees what is left.
+        base_done = job.done
+        found = 0
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_BUFFER)
+        state = ctx.job.state
+        await self._report(job)
+
+        async def produce() -> None:
+            nonlocal found
+            async for member in guild.fetch_members(limit=None):
+                if not self.needs_change(member, role.id, job.action, job.target):
+                    continue
+                found += 1
+                ctx.progress(total=base_done + found)
+                await queue.put(member)
+            for _ in workers:
+                await queue.put(None)
+
+        async def worker() -> None:
+            while True:
+                member = await queue.get()
+                if member is None:
+                    return
+                await ctx.step()
+                result = await self._apply(guild, role, member, job)
+                key = 'success' if result is True else 'failed' if result is False else 'skipped'
+                state[key] = state.get(key, 0) + 1
+                ctx.progress(done=job.done + 1)
+                await self._report(job)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        tasks = [asyncio.create_task(produce()), *workers]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,326 @@
+import asyncio
+import contextlib
+import json
+import os
+import stat
+import tempfile
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+import discord
+
+try:
+    import fcntl
+except ImportError:  # Windows: no clusters there (Unix sockets), so nothing to lock against
+    fcntl = None
+
+
+# Set by launcher.py for each worker process; a plain `python main.py` is cluster 0 of 1
+CLUSTER_ID = int(os.getenv('CLUSTER_ID', '0'))
+CLUSTER_COUNT = int(os.getenv('CLUSTER_COUNT', '1'))
+# The sockets accept unauthenticated ops (e.g. `leave`), so they live in a directory only this user can enter
+IPC_DIR = os.getenv('CLUSTER_IPC_DIR') or os.path.join(tempfile.gettempdir(), f'wizard-ipc-{os.getuid()}')
+REQUEST_TIMEOUT = 5.0
+
+# Guild-scoped JSON state. With several clusters each keeps its own copy (see
+# cluster_file) holding only the guilds it owns, so no two processes ever write the
+# same file. The value names the field that holds the guild id, or None when the
+# top-level keys are guild ids; rebalance_state() uses it to move guilds between
+# clusters when the shard layout changes. Truly global files (prefixes, second
+# owners, premium, ...) stay shared and are updated through update_json().
+CLUSTER_FILES: Dict[str, Optional[str]] = {
+    'antinuke_config.json': None,
+    'automod_config.json': None,
+    'button_roles.json': None,
+    'giveaways.json': None,
+    'jail_config.json': None,
+    'jailed_users.json': None,
+    'join_config.json': None,
+    'nsfw_config.json': None,
+    'ticket_config.json': None,
+    'tickets.json': None,
+    'vanity_config.json': None,
+    'voicemaster_config.json': None,
+    'voicemaster_pool.json': None,
+    'welcome_config.json': None,
+    'jobs.json': 'guild_id',
+    'timers.json': 'guild_id',
+    'voicemaster_channels.json': 'guild_id',
+}
+# Shard layout the per-cluster files were last split for
+LAYOUT_FILE = 'cluster_layout.json'
+
+
+Handler = Callable[..., Awaitable[Any]]
+
+
+class ClusterError(Exception):
+    """A peer cluster could not be reached or failed to answer."""
+
+
+def parse_shard_ids(text: Optional[str]) -> Optional[List[int]]:
+    """Parse SHARD_IDS such as ``"4-7"`` or ``"0,2,5"``."""
+    if not text or not text.strip():
+        return None
+    ids: List[int] = []
+    for part in text.split(','):
+        part = part.strip()
+        if '-' in part:
+            start, end = part.split('-', 1)
+            ids.extend(range(int(start), int(end) + 1))
+        elif part:
+            ids.append(int(part))
+    return ids
+
+
+def shard_range(cluster_id: int, cluster_count: int, shard_count: int) -> range:
+    """Contiguous block of shards owned by ``cluster_id``; earlier clusters take the remainder."""
+    per, extra = divmod(shard_count, cluster_count)
+    start = cluster_id * per + min(cluster_id, extra)
+    return range(start, start + per + (1 if cluster_id < extra else 0))
+
+
+def socket_path(cluster_id: int) -> str:
+    return os.path.join(IPC_DIR, f'cluster-{cluster_id}.sock')
+
+
+def ensure_ipc_dir() -> str:
+    """Create IPC_DIR as a private (0700) directory, refusing one owned by another user."""
+    os.makedirs(IPC_DIR, mode=0o700, exist_ok=True)
+    info = os.stat(IPC_DIR)
+    if info.st_uid != os.getuid():
+        raise ClusterError(f'{IPC_DIR} is owned by another user; set CLUSTER_IPC_DIR to a private directory')
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        os.chmod(IPC_DIR, 0o700)
+    return IPC_DIR
+
+
+def state_path(filename: str, cluster_id: int, cluster_count: int) -> str:
+    if cluster_count <= 1:
+        return filename
+    root, ext = os.path.splitext(filename)
+    return f'{root}.cluster{cluster_id}{ext}'
+
+
+def cluster_file(filename: str) -> str:
+    """Per-cluster variant of a state file, e.g. ``jobs.json`` -> ``jobs.cluster2.json``.
+
+    Only for state tied to the guilds a process owns; shared config files stay global.
+    JSON files must be listed in CLUSTER_FILES so their guilds follow layout changes.
+    """
+    return state_path(filename, CLUSTER_ID, CLUSTER_COUNT)
+
+
+def guild_cluster(guild_id: int, shard_count: int, cluster_count: int) -> int:
+    """The cluster whose shards receive ``guild_id`` (Discord's ``(id >> 22) % shards``)."""
+    shard_id = (guild_id >> 22) % max(1, shard_count)
+    for cluster_id in range(cluster_count):
+        if shard_id in shard_range(cluster_id, cluster_count, shard_count):
+            return cluster_id
+    return 0
+
+
+# ---------- state files ----------
+def _read_json(path: str) -> Optional[Dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def write_json(path: str, data: Any, **dump_kwargs) -> None:
+    """Replace ``path`` atomically, so other processes never read a half-written file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix='.' + os.path.basename(path), suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+
+
+@contextlib.contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """Exclusive lock on ``path`` shared by every cluster process.
+
+    Blocking and not re-entrant: hold it only around synchronous file access, never across an await.
+    """
+    with open(f'{path}.lock', 'a') as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def update_json(path: str, mutate: Callable[[Dict], Any], **dump_kwargs) -> Any:
+    """Read-modify-write a JSON file shared by all clusters, under :func:`file_lock`.
+
+    ``mutate`` edits the freshly loaded dict in place; its return value is passed
+    back. The file is only rewritten when the data actually changed.
+    """
+    with file_lock(path):
+        data = _read_json(path) or {}
+        before = json.dumps(data, sort_keys=True)
+        result = mutate(data)
+        if json.dumps(data, sort_keys=True) != before:
+            write_json(path, data, **dump_kwargs)
+    return result
+
+
+def rebalance_state(shard_count: int, cluster_count: int) -> None:
+    """Re-split the CLUSTER_FILES for a new shard layout before any worker starts.
+
+    Guilds move between clusters when the shard or cluster count changes, so their
+    entries are gathered from the old per-cluster files and written to the files of
+    the clusters that own them now. Running a single process merges everything
+    back into the plain file names.
+    """
+    layout = {'shard_count': shard_count, 'cluster_count': cluster_count} if cluster_count > 1 else {'cluster_count': 1}
+    previous = _read_json(LAYOUT_FILE) or {'cluster_count': 1}
+    if previous == layout:
+        return
+    old_count = int(previous.get('cluster_count', 1))
+    for filename, guild_field in CLUSTER_FILES.items():
+        old_paths = [state_path(filename, cluster_id, old_count) for cluster_id in range(old_count)]
+        merged: Dict[str, Any] = {}
+        for path in old_paths:
+            if os.path.exists(path):
+                # Unreadable state aborts the split rather than being overwritten as empty
+                with open(path, 'r', encoding='utf-8') as f:
+                    merged.update(json.load(f))
+        parts: List[Dict[str, Any]] = [{} for _ in range(cluster_count)]
+        for key, value in merged.items():
+            guild_id = value.get(guild_field) if guild_field and isinstance(value, dict) else key
+            try:
+                owner = guild_cluster(int(guild_id), shard_count, cluster_count)
+            except (TypeError, ValueError):
+                owner = 0  # entries without a guild (legacy data) stay with the first cluster
+            parts[owner][key] = value
+        new_paths = [state_path(filename, cluster_id, cluster_count) for cluster_id in range(cluster_count)]
+        for path, part in zip(new_paths, parts):
+            if part or os.path.exists(path):
+                write_json(path, part, indent=2)
+        if old_count > 1:
+            for path in set(old_paths) - set(new_paths):
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+    write_json(LAYOUT_FILE, layout, indent=2)
+    print(f"[Cluster] Split guild state files for {cluster_count} cluster(s)")
+
+
+class ClusterIPC:
+    """Line-delimited JSON requests between cluster processes over Unix sockets.
+
+    Every worker listens on its own socket; a request opens a short-lived
+    connection to the target, so there is no broker process to keep alive.
+    """
+
+    def __init__(self, bot: discord.Client) -> None:
+        self.bot = bot
+        self.cluster_id = CLUSTER_ID
+        self.cluster_count = CLUSTER_COUNT
+        self._handlers: Dict[str, Handler] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.cluster_count > 1
+
+    def register(self, op: str, handler: Handler) -> None:
+        self._handlers[op] = handler
+
+    def unregister(self, op: str) -> None:
+        self._handlers.pop(op, None)
+
+    async def start(self) -> None:
+        if not self.enabled or self._server is not None:
+            return
+        ensure_ipc_dir()
+        path = socket_path(self.cluster_id)
+        if os.path.exists(path):
+            os.unlink(path)  # left behind by a crashed worker
+        self._server = await asyncio.start_unix_server(self._serve, path=path)
+        os.chmod(path, 0o600)
+        print(f"🔌 Cluster {self.cluster_id}/{self.cluster_count} IPC listening on {path}")
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+        try:
+            os.unlink(socket_path(self.cluster_id))
+        except OSError:
+            pass
+
+    async def _dispatch(self, op: str, args: Dict[str, Any]) -> Any:
+        handler = self._handlers.get(op)
+        if handler is None:
+            raise ClusterError(f'unknown op {op!r}')
+        return await handler(**args)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    reply = {'ok': True, 'data': await self._dispatch(request['op'], request.get('args') or {})}
+                except Exception as e:
+                    reply = {'ok': False, 'error': str(e)}
+                writer.write(json.dumps(reply).encode('utf-8') + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def request(self, cluster_id: int, op: str, **args: Any) -> Any:
+        """Run ``op`` on one cluster (locally when it is this one)."""
+        if cluster_id == self.cluster_id:
+            return await self._dispatch(op, args)
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(socket_path(cluster_id)), REQUEST_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise ClusterError(f'cluster {cluster_id} unreachable: {e}') from e
+        try:
+            writer.write(json.dumps({'op': op, 'args': args}).encode('utf-8') + b'\n')
+            await writer.drain()
+            line = await asyncio.wait_for(reader.readline(), REQUEST_TIMEOUT)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise ClusterError(f'cluster {cluster_id} did not answer: {e}') from e
+        finally:
+            writer.close()
+        if not line:
+            raise ClusterError(f'cluster {cluster_id} closed the connection')
+        reply = json.loads(line)
+        if not reply.get('ok'):
+            raise ClusterError(f"cluster {cluster_id}: {reply.get('error')}")
+        return reply.get('data')
+
+    async def broadcast(self, op: str, **args: Any) -> Dict[int, Any]:
+        """Run ``op`` on every cluster; unreachable clusters are left out of the result."""
+        ids = list(range(self.cluster_count)) if self.enabled else [self.cluster_id]
+        results = await asyncio.gather(*(self.request(i, op, **args) for i in ids), return_exceptions=True)
+        return {i: result for i, result in zip(ids, results) if not isinstance(result, Exception)}
+
+
+def get_ipc(bot: discord.Client) -> ClusterIPC:
+    """Return this process's cluster IPC endpoint, creating it on first use."""
+    ipc = getattr(bot, 'ipc', None)
+    if ipc is None:
+        ipc = ClusterIPC(bot)
+        bot.ipc = ipc
+    return ipc
@@ -0,0 +1,60 @@
+import hashlib
+import json
+import os
+from typing import Dict
+
+from discord.ext import commands
+
+
+SYNC_FILE = 'command_sync.json'
+
+
+def load_sync_state() -> Dict:
+    if not os.path.exists(SYNC_FILE):
+        return {}
+    try:
+        with open(SYNC_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def save_sync_state(data: Dict) -> None:
+    try:
+        with open(SYNC_FILE, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    except Exception:
+        pass
+
+
+def tree_hash(bot: commands.Bot) -> str:
+    """Stable hash of the global application command payload Discord would receive."""
+    payload = []
+    for command in bot.tree.get_commands():
+        try:
+            payload.append(command.to_dict(bot.tree))  # discord.py >= 2.4
+        except TypeError:
+            payload.append(command.to_dict())
+    payload.sort(key=lambda data: (data.get('type', 1), data['name']))
+    encoded = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def record_sync(bot: commands.Bot) -> None:
+    """Remember the current tree as synced (e.g. after a manual sync)."""
+    save_sync_state({'application_id': bot.application_id, 'hash': tree_hash(bot)})
+
+
+async def sync_if_changed(bot: commands.Bot) -> bool:
+    """Sync the global command tree only if it differs from the last synced one.
+
+    The global sync endpoint is heavily rate limited, so unchanged trees are skipped.
+    Returns True when a sync was performed.
+    """
+    state = load_sync_state()
+    current = tree_hash(bot)
+    if state.get('application_id') == bot.application_id and state.get('hash') == current:
+        return False
+    await bot.tree.sync()
+    save_sync_state({'application_id': bot.application_id, 'hash': current})
+    return True
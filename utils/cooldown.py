@@ -0,0 +1,122 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Size-capped mapping whose entries expire ``ttl`` seconds after they were last written.
+
+    Entries are grouped into time buckets ``ttl / buckets`` wide, so expiry
+    drops whole buckets at once instead of scanning every key. Keys are meant
+    to be small int tuples such as ``(guild_id, user_id)``.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 10000, buckets: int = 8,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = float(ttl)
+        self.max_size = max(1, max_size)
+        self._width = max(self.ttl / max(1, buckets), 0.001)
+        self._clock = clock
+        # bucket index -> {key: (written_at, value)}, oldest bucket first
+        self._buckets: "OrderedDict[int, Dict[Hashable, Tuple[float, Any]]]" = OrderedDict()
+        self._bucket_of: Dict[Hashable, int] = {}
+
+    def _expire(self, now: float) -> None:
+        horizon = int((now - self.ttl) // self._width)
+        while self._buckets:
+            index = next(iter(self._buckets))
+            if index >= horizon:
+                break
+            for key in self._buckets.pop(index):
+                del self._bucket_of[key]
+
+    def _evict_oldest(self) -> None:
+        while len(self._bucket_of) > self.max_size and self._buckets:
+            index = next(iter(self._buckets))
+            bucket = self._buckets[index]
+            key = next(iter(bucket))
+            del bucket[key]
+            del self._bucket_of[key]
+            if not bucket:
+                del self._buckets[index]
+
+    def _discard(self, key: Hashable) -> None:
+        index = self._bucket_of.pop(key, None)
+        if index is None:
+            return
+        bucket = self._buckets[index]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[index]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = self._clock()
+        self._expire(now)
+        index = self._bucket_of.get(key)
+        if index is None:
+            return default
+        written_at, value = self._buckets[index][key]
+        if now - written_at >= self.ttl:
+            self._discard(key)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = self._clock()
+        self._expire(now)
+        self._discard(key)
+        index = int(now // self._width)
+        bucket = self._buckets.get(index)
+        if bucket is None:
+            bucket = self._buckets[index] = {}
+        bucket[key] = (now, value)
+        self._bucket_of[key] = index
+        self._evict_oldest()
+
+    def touch(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the live value for ``key`` (creating it with ``factory``) and reset its expiry."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+        self.set(key, value)
+        return value
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self._discard(key)
+        return value
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """Live ``(key, value)`` pairs, oldest first."""
+        self._expire(self._clock())
+        return [(key, value) for bucket in self._buckets.values() for key, (_, value) in bucket.items()]
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._bucket_of.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        self._expire(self._clock())
+        return len(self._bucket_of)
+
+
+class Cooldown:
+    """Per-key cooldown backed by a :class:`TTLCache`."""
+
+    def __init__(self, seconds: float, max_size: int = 10000) -> None:
+        self._recent = TTLCache(seconds, max_size=max_size)
+
+    def hit(self, key: Hashable) -> bool:
+        """Record a use of ``key``; returns False if it is still cooling down."""
+        if key in self._recent:
+            return False
+        self._recent.set(key, True)
+        return True
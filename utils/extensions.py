@@ -0,0 +1,121 @@
+import asyncio
+import importlib
+import os
+import time
+import traceback
+from typing import Dict, List, NamedTuple, Optional
+
+from discord.ext import commands
+
+
+class Extension(NamedTuple):
+    name: str
+    label: str
+    # Deferred extensions load after on_ready so their imports don't delay the gateway login
+    deferred: bool = False
+
+
+# Every extension is independent of the others at setup time, so they load
+# concurrently; order here only fixes the order of the startup report.
+MANIFEST: List[Extension] = [
+    Extension('cmds.jail', 'jail command'),
+    Extension('cmds.info', 'info commands (serverinfo/userinfo)'),
+    Extension('cmds.cluster', 'cluster IPC'),
+    Extension('cmds.metrics', 'metrics endpoint'),
+    Extension('cmds.owner_tools', 'owner tools (jsk + moderation)'),
+    Extension('cmds.fun', 'fun commands (bully)', deferred=True),
+    Extension('cmds.voicemaster', 'voice master'),
+    Extension('cmds.purge', 'purge command'),
+    Extension('cmds.ticket', 'ticket command'),
+    Extension('cmds.vanity', 'vanity/booster system'),
+    Extension('welcome', 'welcome listener'),
+    Extension('cmds.wlcm', 'welcome configuration commands'),
+    Extension('cmds.automod', 'automod'),
+    Extension('cmds.antinuke', 'antinuke'),
+    Extension('cmds.emoji', 'emoji tools', deferred=True),
+    Extension('cmds.nickname', 'nickname command'),
+    Extension('cmds.manage', 'channel manage commands (hide/lock)'),
+    Extension('cmds.role', 'role management system'),
+    Extension('cmds.jobs', 'background job commands'),
+    Extension('cmds.buttonrole', 'button role system'),
+    Extension('cmds.embed', 'embed creator (slash commands)'),
+    Extension('cmds.giveaway', 'giveaway system (slash commands)'),
+    Extension('cmds.join', 'join roles'),
+    Extension('cmds.premium', 'premium/AI commands', deferred=True),
+    Extension('cmds.spotify', 'Spotify integration', deferred=True),
+]
+
+
+def discover(manifest: List[Extension] = MANIFEST, package: str = 'cmds') -> List[Extension]:
+    """The manifest plus any cog module in ``package`` it doesn't list yet."""
+    known = {ext.name for ext in manifest}
+    found: List[Extension] = []
+    for filename in sorted(os.listdir(package)):
+        stem, ext = os.path.splitext(filename)
+        name = f'{package}.{stem}'
+        if ext != '.py' or stem.startswith('_') or name in known:
+            continue
+        with open(os.path.join(package, filename), 'r', encoding='utf-8') as f:
+            if 'async def setup(' not in f.read():
+                continue
+        found.append(Extension(name, stem))
+    return list(manifest) + found
+
+
+class LoadResult(NamedTuple):
+    extension: Extension
+    ok: bool
+    import_time: float
+    setup_time: float
+    error: Optional[BaseException] = None
+
+
+class ExtensionLoader:
+    """Loads extensions concurrently and records how long each one took.
+
+    Each module is first imported in a worker thread, which pulls its
+    third-party dependencies into ``sys.modules`` off the event loop.
+    ``load_extension`` then re-executes only the (cheap) cog module itself.
+    """
+
+    def __init__(self, bot: commands.Bot, extensions: List[Extension]) -> None:
+        self.bot = bot
+        self.extensions = extensions
+        self.results: Dict[str, LoadResult] = {}
+        self._started: set = set()
+
+    async def _load_one(self, ext: Extension) -> LoadResult:
+        start = time.perf_counter()
+        try:
+            await asyncio.to_thread(importlib.import_module, ext.name)
+            imported = time.perf_counter()
+            await self.bot.load_extension(ext.name)
+            result = LoadResult(ext, True, imported - start, time.perf_counter() - imported)
+            print(f"✅ Loaded {ext.label}")
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            result = LoadResult(ext, False, elapsed, 0.0, e)
+            print(f"❌ Failed to load {ext.label}: {e}")
+            if not isinstance(e, ImportError):  # a missing optional dependency needs no traceback
+                traceback.print_exception(type(e), e, e.__traceback__)
+        self.results[ext.name] = result
+        return result
+
+    async def load(self, deferred: bool = False) -> List[LoadResult]:
+        """Load the immediate (or, with ``deferred=True``, the deferred) extensions once."""
+        batch = [ext for ext in self.extensions if ext.deferred == deferred and ext.name not in self._started]
+        self._started.update(ext.name for ext in batch)
+        if not batch:
+            return []
+        start = time.perf_counter()
+        results = await asyncio.gather(*(self._load_one(ext) for ext in batch))
+        self.print_profile(results, time.perf_counter() - start, 'deferred' if deferred else 'startup')
+        return list(results)
+
+    @staticmethod
+    def print_profile(results: List[LoadResult], wall: float, phase: str) -> None:
+        loaded = sum(1 for r in results if r.ok)
+        print(f"⏱️ {phase.capitalize()} profile: {loaded}/{len(results)} extensions in {wall * 1000:.0f}ms")
+        for r in sorted(results, key=lambda r: r.import_time + r.setup_time, reverse=True):
+            status = "ok" if r.ok else "failed"
+            print(f"   {r.extension.name:<20} import {r.import_time * 1000:7.1f}ms  setup {r.setup_time * 1000:7.1f}ms  {status}")
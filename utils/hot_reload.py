@@ -0,0 +1,67 @@
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from discord.ext import commands
+
+
+# A cog opts into state handoff by defining both hooks:
+#     def export_state(self) -> dict      # plain data only, no discord objects
+#     def import_state(self, state: dict) -> None
+# The old instance exports before the extension is reloaded and the new
+# instance imports right after its cog_load, so in-flight state survives.
+
+
+class ReloadReport(NamedTuple):
+    extension: str
+    elapsed: float
+    handed_off: List[str]
+    error: Optional[BaseException] = None
+
+
+def resolve_extension(bot: commands.Bot, name: str) -> Optional[str]:
+    """Map ``voicemaster``, ``cmds.voicemaster`` or a cog name like ``VoiceMaster`` to a loaded extension."""
+    name = name.strip()
+    for candidate in (name, f'cmds.{name}', name.lower(), f'cmds.{name.lower()}'):
+        if candidate in bot.extensions:
+            return candidate
+    for cog_name, cog in bot.cogs.items():
+        if cog_name.lower() == name.lower() and type(cog).__module__ in bot.extensions:
+            return type(cog).__module__
+    return None
+
+
+def cogs_of(bot: commands.Bot, extension: str) -> List[commands.Cog]:
+    return [cog for cog in bot.cogs.values() if type(cog).__module__ == extension]
+
+
+async def reload_with_state(bot: commands.Bot, extension: str) -> ReloadReport:
+    """Reload one extension, handing each cog's exported state to its replacement.
+
+    If the new code fails to load, discord.py restores the previous module and
+    the state is imported into that instance instead, so nothing is dropped.
+    """
+    states: Dict[str, Any] = {}
+    for cog in cogs_of(bot, extension):
+        export = getattr(cog, 'export_state', None)
+        if export is not None:
+            states[cog.qualified_name] = export()
+
+    start = time.perf_counter()
+    error: Optional[BaseException] = None
+    try:
+        await bot.reload_extension(extension)
+    except commands.ExtensionError as e:
+        error = e
+
+    handed_off: List[str] = []
+    for cog in cogs_of(bot, extension):
+        state = states.get(cog.qualified_name)
+        hook = getattr(cog, 'import_state', None)
+        if state is None or hook is None:
+            continue
+        try:
+            hook(state)
+            handed_off.append(cog.qualified_name)
+        except Exception as e:
+            print(f"[Reload] {cog.qualified_name} failed to import state: {e}")
+    return ReloadReport(extension, time.perf_counter() - start, handed_off, error)
@@ -0,0 +1,394 @@
+import asyncio
+import json
+import os
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import discord
+
+from utils.cluster import cluster_file
+
+
+# Jobs belong to the guilds this process owns, so each cluster keeps its own file
+JOBS_FILE = cluster_file('jobs.json')
+
+# Heavy guild-wide work is capped globally so it can't crowd out interactive
+# commands; each job kind additionally gets its own per-guild lane.
+GLOBAL_CONCURRENCY = 3
+DEFAULT_GUILD_CONCURRENCY = 1
+DEFAULT_MAX_ATTEMPTS = 3
+BACKOFF_BASE = 5.0
+BACKOFF_MAX = 300.0
+CHECKPOINT_INTERVAL = 3.0
+FINISHED_RETENTION = 24 * 3600
+
+FINISHED_STATES = ('completed', 'failed', 'cancelled')
+
+
+def load_jobs() -> Dict[str, Dict]:
+    if not os.path.exists(JOBS_FILE):
+        return {}
+    try:
+        with open(JOBS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def save_jobs(data: Dict[str, Dict]) -> None:
+    try:
+        with open(JOBS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    except Exception:
+        pass
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler when its job has been cancelled."""
+
+
+class Job:
+    """A persisted unit of background work."""
+
+    FIELDS = (
+        'job_id', 'kind', 'guild_id', 'params', 'dedup_key', 'status', 'attempts', 'max_attempts',
+        'run_at', 'state', 'done', 'total', 'error', 'requested_by', 'created_at', 'updated_at',
+    )
+
+    def __init__(self, job_id: str, kind: str, guild_id: int, params: Optional[Dict] = None,
+                 dedup_key: Optional[str] = None, status: str = 'queued', attempts: int = 0,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, run_at: Optional[float] = None,
+                 state: Optional[Dict] = None, done: int = 0, total: int = 0, error: Optional[str] = None,
+                 requested_by: Optional[int] = None, created_at: Optional[float] = None,
+                 updated_at: Optional[float] = None) -> None:
+        now = time.time()
+        self.job_id = job_id
+        self.kind = kind
+        self.guild_id = guild_id
+        self.params = params or {}
+        self.dedup_key = dedup_key
+        self.status = status
+        self.attempts = attempts
+        self.max_attempts = max_attempts
+        self.run_at = run_at or now
+        self.state = state or {}
+        self.done = done
+        self.total = total
+        self.error = error
+        self.requested_by = requested_by
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Job':
+        return cls(**{name: data.get(name) for name in cls.FIELDS if name in data})
+
+
+class JobContext:
+    """Handle passed to job handlers for progress, checkpoints and cooperative cancellation."""
+
+    def __init__(self, queue: 'JobQueue', job: Job) -> None:
+        self.queue = queue
+        self.job = job
+        self.bot = queue.bot
+        self._last_checkpoint = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        return self.job.status == 'cancelled'
+
+    async def step(self) -> None:
+        """Yield to the event loop, wait while paused and stop if cancelled."""
+        await asyncio.sleep(0)
+        await self.queue._unpaused_event(self.job.job_id).wait()
+        if self.cancelled:
+            raise JobCancelled()
+
+    def progress(self, done: Optional[int] = None, total: Optional[int] = None) -> None:
+        if done is not None:
+            self.job.done = done
+        if total is not None:
+            self.job.total = total
+        self.checkpoint()
+
+    def checkpoint(self, force: bool = False, **state) -> None:
+        """Merge ``state`` into the job and persist it (throttled unless ``force``)."""
+        self.job.state.update(state)
+        now = time.monotonic()
+        if force or now - self._last_checkpoint >= CHECKPOINT_INTERVAL:
+            self._last_checkpoint = now
+            self.job.updated_at = time.time()
+            self.queue.save()
+
+
+Handler = Callable[[JobContext], Awaitable[None]]
+
+
+class JobQueue:
+    """Persistent background job queue with per-guild lanes, retries and dedup.
+
+    Jobs are stored in ``jobs.json`` and picked back up on the next start, so
+    work queued before a deploy continues afterwards. Handlers are registered
+    per job kind by the cogs that own them; jobs whose kind has no handler yet
+    simply wait until one is registered.
+    """
+
+    def __init__(self, bot: discord.Client, global_concurrency: int = GLOBAL_CONCURRENCY) -> None:
+        self.bot = bot
+        self.global_concurrency = max(1, global_concurrency)
+        self.jobs: Dict[str, Job] = {}
+        for job_id, data in load_jobs().items():
+            job = Job.from_dict(data)
+            if job.status == 'running':
+                # Interrupted by a restart; run it again from its last checkpoint
+                job.status = 'queued'
+            self.jobs[job_id] = job
+        self._handlers: Dict[str, Handler] = {}
+        self._guild_limits: Dict[str, int] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+        self._unpaused: Dict[str, asyncio.Event] = {}
+        self._listeners: Dict[str, List[Callable[[Job], Awaitable[None]]]] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    # ---------- persistence ----------
+    def save(self) -> None:
+        cutoff = time.time() - FINISHED_RETENTION
+        for job_id, job in list(self.jobs.items()):
+            if job.finished and job.updated_at < cutoff:
+                del self.jobs[job_id]
+        save_jobs({job_id: job.to_dict() for job_id, job in self.jobs.items()})
+
+    # ---------- registration ----------
+    def register(self, kind: str, handler: Handler, *, guild_concurrency: int = DEFAULT_GUILD_CONCURRENCY) -> None:
+        self._handlers[kind] = handler
+        self._guild_limits[kind] = max(1, guild_concurrency)
+        self.start()
+        self._wake()
+
+    def unregister(self, kind: str) -> None:
+        self._handlers.pop(kind, None)
+
+    def on_finished(self, kind: str, callback: Callable[[Job], Awaitable[None]]) -> None:
+        """Register a coroutine called with the job once a job of ``kind`` finishes."""
+        self._listeners.setdefault(kind, []).append(callback)
+
+    def off_finished(self, kind: str, callback: Callable[[Job], Awaitable[None]]) -> None:
+        """Remove a callback added with :meth:`on_finished` (e.g. when its cog unloads)."""
+        listeners = self._listeners.get(kind)
+        if listeners and callback in listeners:
+            listeners.remove(callback)
+
+    # ---------- submission and control ----------
+    def submit(self, kind: str, guild_id: int, params: Optional[Dict] = None, *, dedup_key: Optional[str] = None,
+               delay: float = 0.0, requested_by: Optional[int] = None,
+               max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> Tuple[Job, bool]:
+        """Queue a job. Returns ``(job, created)``; an identical unfinished job is reused."""
+        params = params or {}
+        if dedup_key is None:
+            dedup_key = f"{kind}:{guild_id}:{json.dumps(params, sort_keys=True)}"
+        for job in self.jobs.values():
+            if job.dedup_key == dedup_key and not job.finished:
+                return job, False
+        job = Job(uuid.uuid4().hex[:8], kind, guild_id, params, dedup_key=dedup_key,
+                  max_attempts=max_attempts, run_at=time.time() + max(0.0, delay), requested_by=requested_by)
+        self.jobs[job.job_id] = job
+        self.save()
+        self._wake()
+        return job, True
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.jobs.get(job_id)
+
+    def list(self, guild_id: Optional[int] = None, kind: Optional[str] = None, include_finished: bool = False) -> List[Job]:
+        jobs = [
+            j for j in self.jobs.values()
+            if (guild_id is None or j.guild_id == guild_id)
+            and (kind is None or j.kind == kind)
+            and (include_finished or not j.finished)
+        ]
+        return sorted(jobs, key=lambda j: j.created_at)
+
+    def pause(self, job_id: str) -> bool:
+        job = self.jobs.get(job_id)
+        if job is None or job.finished or job.status == 'paused':
+            return False
+        job.status = 'paused'
+        self._unpaused_event(job_id).clear()
+        self.save()
+        # A paused handler gives up its slot, so something else may be able to start
+        self._wake()
+        return True
+
+    def resume(self, job_id: str) -> bool:
+        job = self.jobs.get(job_id)
+        if job is None or job.status != 'paused':
+            return False
+        job.status = 'running' if job_id in self._running else 'queued'
+        self._unpaused_event(job_id).set()
+        self.save()
+        self._wake()
+        return True
+
+    def cancel(self, job_id: str) -> bool:
+        job = self.jobs.get(job_id)
+        if job is None or job.finished:
+            return False
+        job.status = 'cancelled'
+        job.updated_at = time.time()
+        # Wake a paused handler so it observes the cancellation at its next step()
+        self._unpaused_event(job_id).set()
+        self.save()
+        if job_id not in self._running:
+            self._unpaused.pop(job_id, None)
+            asyncio.ensure_future(self._notify(job))
+        return True
+
+    # ---------- dispatcher ----------
+    def start(self) -> None:
+        if self._dispatcher is not None and not self._dispatcher.done():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._wakeup = asyncio.Event()
+        self._dispatcher = asyncio.create_task(self._dispatch_loop())
+
+    def shutdown(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        for task in self._running.values():
+            task.cancel()
+        self._running.clear()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _unpaused_event(self, job_id: str) -> asyncio.Event:
+        event = self._unpaused.get(job_id)
+        if event is None:
+            event = asyncio.Event()
+            job = self.jobs.get(job_id)
+            if job is None or job.status != 'paused':
+                event.set()
+            self._unpaused[job_id] = event
+        return event
+
+    def _runnable(self, now: float) -> List[Job]:
+        # Paused handlers are parked in step() and hold no slot, otherwise a few
+        # paused jobs would stall every other guild; on resume they simply carry on
+        per_lane: Dict[Tuple[str, int], int] = {}
+        active = 0
+        for job_id in self._running:
+            job = self.jobs.get(job_id)
+            if job is None or job.status == 'paused':
+                continue
+            active += 1
+            key = (job.kind, job.guild_id)
+            per_lane[key] = per_lane.get(key, 0) + 1
+        ready: List[Job] = []
+        slots = self.global_concurrency - active
+        for job in sorted(self.jobs.values(), key=lambda j: j.run_at):
+            if slots <= 0:
+                break
+            if job.status not in ('queued', 'retrying') or job.run_at > now or job.kind not in self._handlers:
+                continue
+            key = (job.kind, job.guild_id)
+            if per_lane.get(key, 0) >= self._guild_limits.get(job.kind, DEFAULT_GUILD_CONCURRENCY):
+                continue
+            per_lane[key] = per_lane.get(key, 0) + 1
+            slots -= 1
+            ready.append(job)
+        return ready
+
+    def _next_wakeup(self, now: float) -> float:
+        pending = [
+            j.run_at for j in self.jobs.values()
+            if j.status in ('queued', 'retrying') and j.kind in self._handlers and j.run_at > now
+        ]
+        return min(pending) - now if pending else 60.0
+
+    async def _dispatch_loop(self) -> None:
+        # The queue is usually created while extensions load, before login sets up the ready event
+        while True:
+            try:
+                await self.bot.wait_until_ready()
+                break
+            except RuntimeError:
+                await asyncio.sleep(1)
+        while True:
+            self._wakeup.clear()
+            now = time.time()
+            for job in self._runnable(now):
+                job.status = 'running'
+                self._running[job.job_id] = asyncio.create_task(self._execute(job))
+            self.save()
+            waiter = asyncio.ensure_future(self._wakeup.wait())
+            try:
+                await asyncio.wait({waiter}, timeout=max(0.5, self._next_wakeup(now)))
+            finally:
+                waiter.cancel()
+
+    async def _execute(self, job: Job) -> None:
+        handler = self._handlers[job.kind]
+        ctx = JobContext(self, job)
+        try:
+            await handler(ctx)
+            if job.status != 'cancelled':
+                job.status = 'completed'
+                job.error = None
+        except JobCancelled:
+            job.status = 'cancelled'
+        except asyncio.CancelledError:
+            # Process shutdown: leave the job resumable from its checkpoint
+            if job.status == 'running':
+                job.status = 'queued'
+            self.save()
+            raise
+        except Exception as e:
+            job.attempts += 1
+            job.error = f"{type(e).__name__}: {e}"[:300]
+            if job.status == 'cancelled':
+                pass
+            elif job.attempts < job.max_attempts:
+                job.status = 'retrying'
+                job.run_at = time.time() + min(BACKOFF_MAX, BACKOFF_BASE * (2 ** (job.attempts - 1)))
+            else:
+                job.status = 'failed'
+                print(f"[Jobs] {job.kind} job {job.job_id} failed: {job.error}")
+        finally:
+            self._running.pop(job.job_id, None)
+        job.updated_at = time.time()
+        if job.finished:
+            self._unpaused.pop(job.job_id, None)
+            await self._notify(job)
+        self.save()
+        self._wake()
+
+    async def _notify(self, job: Job) -> None:
+        for callback in self._listeners.get(job.kind, []):
+            try:
+                await callback(job)
+            except Exception:
+                pass
+
+
+def get_queue(bot: discord.Client) -> JobQueue:
+    """Return the bot-wide job queue, creating it on first use."""
+    queue = getattr(bot, 'job_queue', None)
+    if queue is None:
+        queue = JobQueue(bot)
+        bot.job_queue = queue
+    queue.start()
+    return queue
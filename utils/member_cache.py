@@ -0,0 +1,108 @@
+import asyncio
+import os
+from typing import Dict, Optional, Set
+
+import discord
+
+
+# MEMBER_CACHE=full restores the old behaviour (every member of every guild cached
+# at startup). The default 'lean' policy only chunks small guilds up front and
+# leaves large ones partial, which is where most of the process memory went.
+# Only commands that act on every member (e.g. mass kicks) chunk them via ensure();
+# informational commands read gateway counts and report cached-only data as such.
+MEMBER_CACHE_MODE = os.getenv('MEMBER_CACHE', 'lean').strip().lower()
+CHUNK_THRESHOLD = int(os.getenv('MEMBER_CHUNK_THRESHOLD', '5000'))
+
+
+def lean() -> bool:
+    return MEMBER_CACHE_MODE != 'full'
+
+
+def member_cache_flags(intents: discord.Intents) -> discord.MemberCacheFlags:
+    """Cache flags for the bot constructor.
+
+    Lean mode keeps members who joined (or were chunked) this session and
+    members in voice; online members from presence updates are not retained.
+    """
+    if not lean():
+        return discord.MemberCacheFlags.from_intents(intents)
+    flags = discord.MemberCacheFlags.none()
+    flags.joined = True
+    flags.voice = intents.voice_states
+    return flags
+
+
+class MemberCachePolicy:
+    """Decides which guilds get a full member cache and fills them one at a time."""
+
+    def __init__(self, bot: discord.Client) -> None:
+        self.bot = bot
+        # Guilds that must always be fully cached (e.g. vanity roles enforced from presences)
+        self._pinned: Set[int] = set()
+        self._chunking: Dict[int, asyncio.Task] = {}
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._queued: Set[int] = set()
+        self._worker: Optional[asyncio.Task] = None
+
+    def pin(self, guild_id: int) -> None:
+        self._pinned.add(guild_id)
+        guild = self.bot.get_guild(guild_id)
+        if guild is not None:
+            self.schedule(guild)
+
+    def unpin(self, guild_id: int) -> None:
+        self._pinned.discard(guild_id)
+
+    def wants_full(self, guild: discord.Guild) -> bool:
+        if not lean() or guild.id in self._pinned:
+            return True
+        return (guild.member_count or 0) <= CHUNK_THRESHOLD
+
+    def schedule(self, guild: discord.Guild) -> None:
+        """Queue a background chunk if policy says this guild should be fully cached."""
+        if guild.chunked or guild.id in self._queued or not self.wants_full(guild):
+            return
+        self._queued.add(guild.id)
+        self._queue.put_nowait(guild.id)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+
+    async def _drain(self) -> None:
+        # Chunk requests go over the shard's gateway connection; one at a time
+        # keeps them from starving heartbeats and event dispatch.
+        while not self._queue.empty():
+            guild_id = self._queue.get_nowait()
+            self._queued.discard(guild_id)
+            guild = self.bot.get_guild(guild_id)
+            if guild is None:
+                continue
+            try:
+                await self.ensure(guild)
+            except Exception as e:
+                print(f"[MemberCache] Failed to chunk {guild_id}: {e}")
+
+    async def ensure(self, guild: discord.Guild) -> None:
+        """Make sure ``guild`` has a complete member cache, chunking it if needed."""
+        if guild.chunked:
+            return
+        task = self._chunking.get(guild.id)
+        if task is None:
+            task = asyncio.create_task(guild.chunk(cache=True))
+            self._chunking[guild.id] = task
+            task.add_done_callback(lambda _t, guild_id=guild.id: self._chunking.pop(guild_id, None))
+        await asyncio.shield(task)
+
+    def shutdown(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+        for task in self._chunking.values():
+            task.cancel()
+
+
+def get_member_cache(bot: discord.Client) -> MemberCachePolicy:
+    """Return the bot-wide member cache policy, creating it on first use."""
+    policy = getattr(bot, 'member_cache', None)
+    if policy is None:
+        policy = MemberCachePolicy(bot)
+        bot.member_cache = policy
+    return policy
@@ -0,0 +1,79 @@
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+import discord
+
+
+Key = Tuple[float, int]
+
+
+class GuildJoinIndex:
+    """Members of one guild kept sorted by ``(joined_at, id)``."""
+
+    def __init__(self, guild: discord.Guild) -> None:
+        self.keys: List[Key] = sorted(
+            (m.joined_at.timestamp(), m.id) for m in guild.members if m.joined_at
+        )
+        self.by_member: Dict[int, Key] = {member_id: (ts, member_id) for ts, member_id in self.keys}
+        # Built from a complete member cache; joins and leaves keep it complete from then on
+        self.complete = guild.chunked
+
+    def add(self, member: discord.Member) -> None:
+        if member.id in self.by_member or not member.joined_at:
+            return
+        key = (member.joined_at.timestamp(), member.id)
+        insort(self.keys, key)
+        self.by_member[member.id] = key
+
+    def remove(self, member_id: int) -> None:
+        key = self.by_member.pop(member_id, None)
+        if key is None:
+            return
+        i = bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            del self.keys[i]
+
+    def position(self, member_id: int) -> Optional[int]:
+        """1-based join position, found by bisecting on the member's key."""
+        key = self.by_member.get(member_id)
+        if key is None:
+            return None
+        return bisect_left(self.keys, key) + 1
+
+    def newest(self, count: int) -> List[int]:
+        return [member_id for _, member_id in reversed(self.keys[-count:])]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class JoinIndex:
+    """Lazily built per-guild join-order indexes, updated from member events.
+
+    An index is rebuilt only once, when a guild it was built for partially
+    becomes chunked; otherwise join/leave events keep it current. Callers drop
+    it when the guild's member cache is reset (guild unavailable or removed).
+    """
+
+    def __init__(self) -> None:
+        self._guilds: Dict[int, GuildJoinIndex] = {}
+
+    def get(self, guild: discord.Guild) -> GuildJoinIndex:
+        index = self._guilds.get(guild.id)
+        if index is None or (guild.chunked and not index.complete):
+            index = GuildJoinIndex(guild)
+            self._guilds[guild.id] = index
+        return index
+
+    def member_join(self, member: discord.Member) -> None:
+        index = self._guilds.get(member.guild.id)
+        if index is not None:
+            index.add(member)
+
+    def member_remove(self, guild_id: int, member_id: int) -> None:
+        index = self._guilds.get(guild_id)
+        if index is not None:
+            index.remove(member_id)
+
+    def drop(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
@@ -0,0 +1,144 @@
+from collections import Counter
+from typing import Dict, Set
+
+import discord
+
+
+# 'split' is how many of 'members' belong to guilds whose member cache is complete;
+# only those members are divided into bots and humans.
+FIELDS = ('members', 'split', 'bots', 'text', 'voice', 'categories')
+
+
+def channel_kind(channel: discord.abc.GuildChannel) -> str:
+    if isinstance(channel, discord.TextChannel):
+        return 'text'
+    if isinstance(channel, discord.VoiceChannel):
+        return 'voice'
+    if isinstance(channel, discord.CategoryChannel):
+        return 'categories'
+    return ''
+
+
+class BotStats:
+    """Bot-wide member/channel counters kept current from gateway events.
+
+    Each guild contributes a snapshot taken when it becomes available; after
+    that, joins, leaves and channel events adjust both the snapshot and the
+    running totals, so reads are O(1) and never touch member caches.
+
+    The bot/human split can only be read from a complete member cache, so
+    guilds that are not chunked (lean member cache) count towards ``members``
+    but not ``split``/``bots``; :meth:`snapshot` reports them as ``unsplit``.
+    """
+
+    def __init__(self) -> None:
+        self.totals: Counter = Counter()
+        self._guilds: Dict[int, Counter] = {}
+        # guild id -> gateway shard id, and guild counts per shard
+        self._shard_of: Dict[int, int] = {}
+        self.shard_guilds: Counter = Counter()
+        # Guilds snapshotted before their member cache was complete
+        self._unchunked: Set[int] = set()
+
+    @property
+    def guilds(self) -> int:
+        return len(self._guilds)
+
+    @property
+    def humans(self) -> int:
+        return self.totals['split'] - self.totals['bots']
+
+    @property
+    def unsplit(self) -> int:
+        return self.totals['members'] - self.totals['split']
+
+    def _apply(self, guild_id: int, field: str, delta: int) -> None:
+        snap = self._guilds.get(guild_id)
+        if snap is None or not field:
+            return
+        snap[field] += delta
+        self.totals[field] += delta
+
+    # ---------- guild snapshots ----------
+    def set_guild(self, guild: discord.Guild) -> None:
+        self.remove_guild(guild.id)
+        snap: Counter = Counter()
+        snap['members'] = guild.member_count or len(guild.members)
+        if guild.chunked:
+            snap['split'] = snap['members']
+            snap['bots'] = sum(1 for m in guild.members if m.bot)
+        for channel in guild.channels:
+            kind = channel_kind(channel)
+            if kind:
+                snap[kind] += 1
+        self._guilds[guild.id] = snap
+        self.totals.update(snap)
+        shard_id = guild.shard_id or 0
+        self._shard_of[guild.id] = shard_id
+        self.shard_guilds[shard_id] += 1
+        if guild.chunked:
+            self._unchunked.discard(guild.id)
+        else:
+            self._unchunked.add(guild.id)
+
+    def remove_guild(self, guild_id: int) -> None:
+        snap = self._guilds.pop(guild_id, None)
+        self._unchunked.discard(guild_id)
+        if snap is not None:
+            self.totals.subtract(snap)
+        shard_id = self._shard_of.pop(guild_id, None)
+        if shard_id is not None:
+            self.shard_guilds[shard_id] -= 1
+
+    def refresh_chunked(self, bot: discord.Client) -> None:
+        """Re-snapshot guilds whose member cache has filled since they were counted."""
+        for guild_id in list(self._unchunked):
+            guild = bot.get_guild(guild_id)
+            if guild is None:
+                self._unchunked.discard(guild_id)
+            elif guild.chunked:
+                self.set_guild(guild)
+
+    # ---------- incremental updates ----------
+    def _member_delta(self, guild_id: int, bot: bool, delta: int) -> None:
+        self._apply(guild_id, 'members', delta)
+        if guild_id in self._unchunked:
+            return
+        self._apply(guild_id, 'split', delta)
+        if bot:
+            self._apply(guild_id, 'bots', delta)
+
+    def member_join(self, member: discord.Member) -> None:
+        self._member_delta(member.guild.id, member.bot, 1)
+
+    def member_remove(self, payload: discord.RawMemberRemoveEvent) -> None:
+        # Fed from on_raw_member_remove: on_member_remove only fires for cached
+        # members, and the lean cache leaves most of a large guild uncached
+        self._member_delta(payload.guild_id, payload.user.bot, -1)
+
+    def channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        self._apply(channel.guild.id, channel_kind(channel), 1)
+
+    def channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        self._apply(channel.guild.id, channel_kind(channel), -1)
+
+    def channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel) -> None:
+        if channel_kind(before) != channel_kind(after):
+            self.channel_delete(before)
+            self.channel_create(after)
+
+    def snapshot(self) -> Dict[str, int]:
+        data = {field: self.totals[field] for field in FIELDS}
+        data['humans'] = self.humans
+        data['unsplit'] = self.unsplit
+        data['guilds'] = self.guilds
+        return data
+
+
+def get_stats(bot: discord.Client) -> BotStats:
+    """Return the bot-wide stats aggregator, creating it on first use."""
+    stats = getattr(bot, 'stats', None)
+    if stats is None:
+        stats = BotStats()
+        bot.stats = stats
+    return stats
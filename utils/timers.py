@@ -0,0 +1,190 @@
+import asyncio
+import heapq
+import json
+import os
+import time
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import discord
+
+from utils.cluster import cluster_file
+
+
+# Deadlines belong to the guilds this process owns, so each cluster keeps its own file
+TIMERS_FILE = cluster_file('timers.json')
+
+
+def load_timers() -> Dict[str, Dict]:
+    if not os.path.exists(TIMERS_FILE):
+        return {}
+    try:
+        with open(TIMERS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def save_timers(data: Dict[str, Dict]) -> None:
+    try:
+        with open(TIMERS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    except Exception:
+        pass
+
+
+class Timer(NamedTuple):
+    key: str
+    kind: str
+    guild_id: int
+    run_at: float
+    params: Dict
+
+    def to_dict(self) -> Dict:
+        return {'kind': self.kind, 'guild_id': self.guild_id, 'run_at': self.run_at, 'params': self.params}
+
+    @classmethod
+    def from_dict(cls, key: str, data: Dict) -> 'Timer':
+        return cls(key, data['kind'], int(data['guild_id']), float(data['run_at']), data.get('params') or {})
+
+
+TimerHandler = Callable[[Timer], Awaitable[None]]
+
+
+class TimerScheduler:
+    """Persistent one-shot deadlines shared by every cog (jail sentences and the like).
+
+    Timers are keyed, so scheduling an existing key moves its deadline. A single
+    task sleeps until the earliest deadline in a min-heap; replaced or cancelled
+    entries are dropped lazily when they reach the top. Timers live in
+    ``timers.json`` and are rehydrated on start, and those whose kind has no
+    handler registered yet simply wait until one is.
+    """
+
+    def __init__(self, bot: discord.Client) -> None:
+        self.bot = bot
+        self.timers: Dict[str, Timer] = {}
+        for key, data in load_timers().items():
+            try:
+                self.timers[key] = Timer.from_dict(key, data)
+            except (KeyError, TypeError, ValueError):
+                continue
+        self._heap: List[Tuple[float, str]] = [(t.run_at, key) for key, t in self.timers.items()]
+        heapq.heapify(self._heap)
+        # Due timers whose kind isn't registered (e.g. mid-reload); re-armed by register()
+        self._parked: Dict[str, List[str]] = {}
+        self._handlers: Dict[str, TimerHandler] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def save(self) -> None:
+        save_timers({key: timer.to_dict() for key, timer in self.timers.items()})
+
+    # ---------- registration ----------
+    def register(self, kind: str, handler: TimerHandler) -> None:
+        self._handlers[kind] = handler
+        for key in self._parked.pop(kind, []):
+            timer = self.timers.get(key)
+            if timer is not None:
+                heapq.heappush(self._heap, (timer.run_at, key))
+        self._wake()
+
+    def unregister(self, kind: str) -> None:
+        self._handlers.pop(kind, None)
+
+    # ---------- scheduling ----------
+    def schedule(self, kind: str, key: str, guild_id: int, run_at: float, params: Optional[Dict] = None) -> Timer:
+        """Fire ``kind``'s handler at ``run_at`` (epoch seconds), replacing any timer with the same key."""
+        timer = Timer(key, kind, guild_id, run_at, params or {})
+        self.timers[key] = timer
+        heapq.heappush(self._heap, (run_at, key))
+        self.save()
+        self._wake()
+        return timer
+
+    def cancel(self, key: str) -> bool:
+        if self.timers.pop(key, None) is None:
+            return False
+        self.save()
+        return True
+
+    def get(self, key: str) -> Optional[Timer]:
+        return self.timers.get(key)
+
+    def list(self, kind: Optional[str] = None, guild_id: Optional[int] = None) -> List[Timer]:
+        timers = [
+            t for t in self.timers.values()
+            if (kind is None or t.kind == kind) and (guild_id is None or t.guild_id == guild_id)
+        ]
+        return sorted(timers, key=lambda t: t.run_at)
+
+    # ---------- dispatcher ----------
+    def start(self) -> None:
+        if self._loop_task is not None and not self._loop_task.done():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._wakeup = asyncio.Event()
+        self._loop_task = asyncio.create_task(self._run())
+
+    def shutdown(self) -> None:
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            self._loop_task = None
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _pop_due(self, now: float) -> List[Timer]:
+        due: List[Timer] = []
+        while self._heap and self._heap[0][0] <= now:
+            run_at, key = heapq.heappop(self._heap)
+            timer = self.timers.get(key)
+            if timer is None or timer.run_at != run_at:
+                continue  # cancelled or rescheduled since this entry was pushed
+            if timer.kind not in self._handlers:
+                self._parked.setdefault(timer.kind, []).append(key)
+                continue
+            del self.timers[key]
+            due.append(timer)
+        if due:
+            self.save()
+        return due
+
+    async def _fire(self, timer: Timer) -> None:
+        try:
+            await self._handlers[timer.kind](timer)
+        except Exception as e:
+            print(f"[Timers] {timer.kind} timer {timer.key} failed: {e}")
+
+    async def _run(self) -> None:
+        # The scheduler is usually created while extensions load, before login sets up the ready event
+        while True:
+            try:
+                await self.bot.wait_until_ready()
+                break
+            except RuntimeError:
+                await asyncio.sleep(1)
+        while True:
+            self._wakeup.clear()
+            now = time.time()
+            for timer in self._pop_due(now):
+                asyncio.create_task(self._fire(timer))
+            timeout = self._heap[0][0] - now if self._heap else 3600.0
+            waiter = asyncio.ensure_future(self._wakeup.wait())
+            try:
+                await asyncio.wait({waiter}, timeout=max(0.5, min(timeout, 3600.0)))
+            finally:
+                waiter.cancel()
+
+
+def get_timers(bot: discord.Client) -> TimerScheduler:
+    """Return the bot-wide timer scheduler, creating it on first use."""
+    timers = getattr(bot, 'timer_scheduler', None)
+    if timers is None:
+        timers = TimerScheduler(bot)
+        bot.timer_scheduler = timers
+    timers.start()
+    return timers
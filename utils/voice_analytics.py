@@ -0,0 +1,280 @@
+import asyncio
+import bisect
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from utils.cluster import cluster_file
+
+
+# Voice activity belongs to the guilds this process owns, so each cluster keeps its own database
+ANALYTICS_DB = cluster_file('voice_analytics.db')
+
+FLUSH_INTERVAL = 10.0
+EVENT_RETENTION = 7 * 86400      # raw events are kept for a week
+BUCKET_RETENTION = 90 * 86400    # minute buckets and histograms for three months
+PRUNE_INTERVAL = 3600
+
+# Upper bounds (seconds) of the duration histogram; percentiles are reported as "<= bound"
+DURATION_BINS = [30, 60, 120, 300, 600, 900, 1800, 3600, 7200, 14400, 28800, 86400]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS voice_events (
+    ts INTEGER NOT NULL,
+    guild_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    user_id INTEGER,
+    kind TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS voice_events_ts ON voice_events (ts);
+CREATE TABLE IF NOT EXISTS voice_minutes (
+    guild_id INTEGER NOT NULL,
+    minute INTEGER NOT NULL,
+    channels_peak INTEGER NOT NULL DEFAULT 0,
+    users_peak INTEGER NOT NULL DEFAULT 0,
+    created INTEGER NOT NULL DEFAULT 0,
+    deleted INTEGER NOT NULL DEFAULT 0,
+    joins INTEGER NOT NULL DEFAULT 0,
+    leaves INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, minute)
+);
+CREATE TABLE IF NOT EXISTS voice_durations (
+    guild_id INTEGER NOT NULL,
+    minute INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    bin INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, minute, kind, bin)
+);
+"""
+
+# Column order of an in-memory minute bucket
+CHANNELS_PEAK, USERS_PEAK, CREATED, DELETED, JOINS, LEAVES = range(6)
+
+
+class VoiceRollup(NamedTuple):
+    hours: float
+    channels_peak: int
+    users_peak: int
+    created: int
+    deleted: int
+    joins: int
+    leaves: int
+    session_p50: Optional[int]
+    session_p95: Optional[int]
+    lifetime_p50: Optional[int]
+    lifetime_p95: Optional[int]
+
+
+def duration_bin(seconds: float) -> int:
+    return bisect.bisect_left(DURATION_BINS, seconds)
+
+
+def bin_label(index: int) -> Optional[int]:
+    """Upper bound of a histogram bin in seconds (None for the open-ended last bin)."""
+    return DURATION_BINS[index] if index < len(DURATION_BINS) else None
+
+
+def percentile(counts: Dict[int, int], fraction: float) -> Optional[int]:
+    total = sum(counts.values())
+    if not total:
+        return None
+    target = fraction * total
+    seen = 0
+    for index in sorted(counts):
+        seen += counts[index]
+        if seen >= target:
+            return bin_label(index) or DURATION_BINS[-1] + 1
+    return None
+
+
+class VoiceAnalytics:
+    """Collects VoiceMaster session events and writes them to SQLite off the event loop.
+
+    Recording only touches in-memory counters, so voice handlers never wait on disk.
+    Events, per-minute buckets (peak concurrency, churn) and duration histograms are
+    flushed in one transaction every FLUSH_INTERVAL seconds from a worker thread.
+    """
+
+    def __init__(self, path: str = ANALYTICS_DB) -> None:
+        self.path = path
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._events: List[Tuple[int, int, int, Optional[int], str]] = []
+        self._minutes: Dict[Tuple[int, int], List[int]] = {}
+        self._durations: Dict[Tuple[int, int, str, int], int] = defaultdict(int)
+        # Live state used for concurrency and durations
+        self._channels: Dict[int, Set[int]] = defaultdict(set)      # guild_id -> channel ids
+        self._created_at: Dict[int, float] = {}                     # channel_id -> created ts
+        self._joined_at: Dict[Tuple[int, int], float] = {}          # (channel_id, user_id) -> ts
+        self._users: Dict[int, int] = defaultdict(int)              # guild_id -> users in temp VCs
+        self._task: Optional[asyncio.Task] = None
+        self._last_prune = 0.0
+
+    # --------------- recording (event loop, no I/O) ---------------
+    def _bucket(self, guild_id: int, now: float) -> List[int]:
+        key = (guild_id, int(now // 60) * 60)
+        bucket = self._minutes.get(key)
+        if bucket is None:
+            bucket = self._minutes[key] = [0, 0, 0, 0, 0, 0]
+        bucket[CHANNELS_PEAK] = max(bucket[CHANNELS_PEAK], len(self._channels[guild_id]))
+        bucket[USERS_PEAK] = max(bucket[USERS_PEAK], self._users[guild_id])
+        return bucket
+
+    def _duration(self, guild_id: int, now: float, kind: str, seconds: float) -> None:
+        self._durations[(guild_id, int(now // 60) * 60, kind, duration_bin(seconds))] += 1
+
+    def _emit(self, now: float, guild_id: int, channel_id: int, user_id: Optional[int], kind: str, column: int) -> None:
+        self._events.append((int(now), guild_id, channel_id, user_id, kind))
+        self._bucket(guild_id, now)[column] += 1
+        self._ensure_flusher()
+
+    def seed(self, guild_id: int, channel_id: int, created_at: Optional[float], user_ids: List[int]) -> None:
+        """Register a temp channel that already existed before this process started."""
+        now = time.time()
+        self._channels[guild_id].add(channel_id)
+        self._created_at.setdefault(channel_id, created_at or now)
+        for user_id in user_ids:
+            if (channel_id, user_id) not in self._joined_at:
+                self._joined_at[(channel_id, user_id)] = now
+                self._users[guild_id] += 1
+
+    def channel_created(self, guild_id: int, channel_id: int) -> None:
+        now = time.time()
+        self._channels[guild_id].add(channel_id)
+        self._created_at[channel_id] = now
+        self._emit(now, guild_id, channel_id, None, 'create', CREATED)
+
+    def channel_deleted(self, guild_id: int, channel_id: int) -> None:
+        now = time.time()
+        self._channels[guild_id].discard(channel_id)
+        created_at = self._created_at.pop(channel_id, None)
+        if created_at is not None:
+            self._duration(guild_id, now, 'lifetime', now - created_at)
+        for key in [k for k in self._joined_at if k[0] == channel_id]:
+            self._leave(guild_id, key, now)
+        self._emit(now, guild_id, channel_id, None, 'delete', DELETED)
+
+    def member_joined(self, guild_id: int, channel_id: int, user_id: int) -> None:
+        if (channel_id, user_id) in self._joined_at:
+            return  # already counted (the creator is recorded before their move event arrives)
+        now = time.time()
+        self._joined_at[(channel_id, user_id)] = now
+        self._users[guild_id] += 1
+        self._emit(now, guild_id, channel_id, user_id, 'join', JOINS)
+
+    def member_left(self, guild_id: int, channel_id: int, user_id: int) -> None:
+        now = time.time()
+        self._leave(guild_id, (channel_id, user_id), now)
+        self._emit(now, guild_id, channel_id, user_id, 'leave', LEAVES)
+
+    def _leave(self, guild_id: int, key: Tuple[int, int], now: float) -> None:
+        joined_at = self._joined_at.pop(key, None)
+        if joined_at is not None:
+            self._users[guild_id] = max(0, self._users[guild_id] - 1)
+            self._duration(guild_id, now, 'session', now - joined_at)
+
+    # --------------- writer ---------------
+    def _ensure_flusher(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while self._events or self._minutes or self._durations:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not (self._events or self._minutes or self._durations):
+            return
+        events, minutes, durations = self._events, self._minutes, self._durations
+        self._events, self._minutes, self._durations = [], {}, defaultdict(int)
+        try:
+            await asyncio.to_thread(self._write, events, minutes, dict(durations))
+        except Exception as e:
+            print(f"[VoiceAnalytics] Failed to write {len(events)} event(s): {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def _write(self, events, minutes, durations) -> None:
+        with self._db_lock:
+            db = self._connect()
+            with db:
+                db.executemany("INSERT INTO voice_events (ts, guild_id, channel_id, user_id, kind) VALUES (?, ?, ?, ?, ?)", events)
+                db.executemany(
+                    """INSERT INTO voice_minutes (guild_id, minute, channels_peak, users_peak, created, deleted, joins, leaves)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT (guild_id, minute) DO UPDATE SET
+                           channels_peak = MAX(channels_peak, excluded.channels_peak),
+                           users_peak = MAX(users_peak, excluded.users_peak),
+                           created = created + excluded.created,
+                           deleted = deleted + excluded.deleted,
+                           joins = joins + excluded.joins,
+                           leaves = leaves + excluded.leaves""",
+                    [(g, m, *bucket) for (g, m), bucket in minutes.items()],
+                )
+                db.executemany(
+                    """INSERT INTO voice_durations (guild_id, minute, kind, bin, count) VALUES (?, ?, ?, ?, ?)
+                       ON CONFLICT (guild_id, minute, kind, bin) DO UPDATE SET count = count + excluded.count""",
+                    [(*key, count) for key, count in durations.items()],
+                )
+            now = time.time()
+            if now - self._last_prune >= PRUNE_INTERVAL:
+                self._last_prune = now
+                with db:
+                    db.execute("DELETE FROM voice_events WHERE ts < ?", (int(now - EVENT_RETENTION),))
+                    db.execute("DELETE FROM voice_minutes WHERE minute < ?", (int(now - BUCKET_RETENTION),))
+                    db.execute("DELETE FROM voice_durations WHERE minute < ?", (int(now - BUCKET_RETENTION),))
+
+    # --------------- rollups ---------------
+    async def rollup(self, guild_id: int, hours: float) -> VoiceRollup:
+        await self.flush()
+        return await asyncio.to_thread(self._rollup, guild_id, hours)
+
+    def _rollup(self, guild_id: int, hours: float) -> VoiceRollup:
+        since = int(time.time() - hours * 3600)
+        with self._db_lock:
+            db = self._connect()
+            row = db.execute(
+                """SELECT MAX(channels_peak), MAX(users_peak), SUM(created), SUM(deleted), SUM(joins), SUM(leaves)
+                   FROM voice_minutes WHERE guild_id = ? AND minute >= ?""",
+                (guild_id, since),
+            ).fetchone()
+            hist: Dict[str, Dict[int, int]] = {'session': {}, 'lifetime': {}}
+            for kind, index, count in db.execute(
+                "SELECT kind, bin, SUM(count) FROM voice_durations WHERE guild_id = ? AND minute >= ? GROUP BY kind, bin",
+                (guild_id, since),
+            ):
+                hist.setdefault(kind, {})[index] = count
+        return VoiceRollup(
+            hours, *(int(v or 0) for v in row),
+            percentile(hist['session'], 0.5), percentile(hist['session'], 0.95),
+            percentile(hist['lifetime'], 0.5), percentile(hist['lifetime'], 0.95),
+        )
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        await self.flush()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def get_voice_analytics(bot) -> VoiceAnalytics:
+    """Return the bot-wide analytics collector, creating it on first use.
+
+    It lives on the bot rather than the cog so live sessions survive `jsk reload`.
+    """
+    analytics = getattr(bot, 'voice_analytics', None)
+    if analytics is None:
+        analytics = VoiceAnalytics()
+        bot.voice_analytics = analytics
+    return analytics
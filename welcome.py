@@ -4,9 +4,10 @@ from discord.ui import View, Button
 import json
 import os
 from typing import Dict, Optional
+from utils.cluster import cluster_file
 
 
-CONFIG_FILE = 'welcome_config.json'
+CONFIG_FILE = cluster_file('welcome_config.json')
 
 
 class Welcome(commands.Cog):